@@ -0,0 +1,68 @@
+"""Compare the payload size and the encode/decode time of the serializers used by the cache response plugin"""
+
+import pickle
+from typing import Any, Callable, Dict, Tuple
+
+from flask import Flask, Response, jsonify
+
+from benchmarks.diff_use_pait.run import run_and_calculate_time
+from pait.app.flask.plugin.cache_response import CacheSerializer
+from pait.plugin.cache_response import BaseCacheSerializer, PickleCacheSerializer
+
+
+class Latin1PickleSerializer(BaseCacheSerializer):
+    """The serializer used by the plugin before, the value is stored as latin1 str"""
+
+    def dumps(self, value: Any) -> Any:
+        return pickle.dumps(value).decode("latin1")
+
+    def loads(self, data: Any) -> Any:
+        return pickle.loads(data.encode("latin1"))
+
+
+serializer_dict: Dict[str, BaseCacheSerializer] = {
+    "latin1-pickle": Latin1PickleSerializer(),
+    "pickle": PickleCacheSerializer(),
+    "default": CacheSerializer(),
+    "default-compress": CacheSerializer(compress_min_size=1024),
+}
+
+
+def gen_payload() -> Dict[str, Any]:
+    return {
+        "code": 0,
+        "msg": "",
+        "data": [
+            {"uid": index, "name": f"user-{index}", "age": index % 100, "tags": ["a", "b"]} for index in range(200)
+        ],
+    }
+
+
+def run(payload_factory: Callable[[], Any]) -> Dict[str, Tuple[int, float, float]]:
+    result: Dict[str, Tuple[int, float, float]] = {}
+    for name, serializer in serializer_dict.items():
+        data = serializer.dumps(payload_factory())
+        payload = payload_factory()
+        result[name] = (
+            len(data),
+            run_and_calculate_time(lambda: serializer.dumps(payload)),
+            run_and_calculate_time(lambda: serializer.loads(data)),
+        )
+    return result
+
+
+def main() -> None:
+    app: Flask = Flask(__name__)
+    with app.app_context():
+        for payload_name, payload_factory in (
+            ("json", gen_payload),
+            ("flask response", lambda: jsonify(gen_payload())),
+            ("flask text response", lambda: Response("Hello World!" * 100, mimetype="text/plain")),
+        ):
+            print(f"payload: {payload_name}")
+            for name, (size, dumps_duration, loads_duration) in run(payload_factory).items():
+                print(f"    {name}: size: {size}, dumps duration: {dumps_duration}, loads duration: {loads_duration}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Compare the `diff_use_pait` routes of the four frameworks with and without compiled validation"""
+
+from pprint import pprint
+from typing import Callable, Dict, List
+
+from benchmarks.diff_use_pait import _flask, _sanic, _starlette, _tornado, run
+
+route_list: List[Callable] = [
+    _flask.user_info_by_pait,
+    _sanic.user_info_by_pait,
+    _starlette.user_info_by_pait,
+    _tornado.UserInfoByPaitHandler.get,
+]
+
+
+def main() -> None:
+    result: Dict[str, Dict[str, float]] = {}
+    # Sanic changes the event loop policy, so it runs last, like `diff_use_pait.run`
+    for framework, run_func in (
+        ("flask", run.run_flask),
+        ("starlette", run.run_starlette),
+        ("tornado", run.run_tornado),
+        ("sanic", run.run_sanic),
+    ):
+        bucket: Dict[str, float] = result.setdefault(framework, {})
+        for compiled_validation in (False, True):
+            for route in route_list:
+                # The route is built again with the new validation mode when it is called next time
+                route.pait_core_model.compiled_validation = compiled_validation  # type: ignore[attr-defined]
+            run_func()
+            bucket[f"compiled_validation={compiled_validation}"] = run.state_result[framework]["use-pait"]
+        bucket["diff"] = bucket["compiled_validation=True"] - bucket["compiled_validation=False"]
+    pprint(result)
+
+
+if __name__ == "__main__":
+    main()
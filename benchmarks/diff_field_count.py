@@ -0,0 +1,60 @@
+"""Check that the overhead of each request field stays flat as the number of fields of the route grows"""
+
+import inspect
+from typing import Any, Callable, List
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.testclient import TestClient
+
+from benchmarks.diff_use_pait.run import run_and_calculate_time
+from pait import field
+from pait.app.starlette import pait
+
+field_count_list: List[int] = [1, 5, 10, 20, 40]
+
+
+def create_route(field_count: int) -> Callable:
+    async def demo(**kwargs: Any) -> JSONResponse:
+        return JSONResponse(kwargs)
+
+    setattr(
+        demo,
+        "__signature__",
+        inspect.Signature(
+            [
+                inspect.Parameter(
+                    f"field_{index}", inspect.Parameter.KEYWORD_ONLY, default=field.Query.i(), annotation=int
+                )
+                for index in range(field_count)
+            ]
+        ),
+    )
+    demo.__name__ = f"demo_{field_count}"
+    return pait()(demo)
+
+
+def create_app() -> Starlette:
+    app = Starlette(__name__)
+    for field_count in field_count_list:
+        app.add_route(f"/api/demo-{field_count}", create_route(field_count), methods=["GET"])
+    return app
+
+
+def main() -> None:
+    base_duration: float = 0.0
+    with TestClient(create_app()) as client:
+        for field_count in field_count_list:
+            url = f"/api/demo-{field_count}?" + "&".join(f"field_{index}={index}" for index in range(field_count))
+            duration = run_and_calculate_time(lambda: client.get(url))
+            if field_count == field_count_list[0]:
+                base_duration = duration
+                print(f"field count: {field_count}, duration: {duration}")
+            else:
+                # The extra duration of each field compared to the route with one field
+                per_field_duration = (duration - base_duration) / (field_count - field_count_list[0])
+                print(f"field count: {field_count}, duration: {duration}, per field duration: {per_field_duration}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Check the throughput (MB/s) of the multipart parser used by `by_multipart.Stream` for the large uploads"""
+
+import time
+from typing import Generator, List
+
+from pait.extra.field.stream._multipart import MultipartSegment, PushMultipartParser
+
+boundary: str = "pait-benchmark-boundary"
+# The size of the chunk read from the request body, it depends on the server
+chunk_size_list: List[int] = [64 * 1024, 1024**2]
+upload_size_list: List[int] = [1024**2, 100 * 1024**2, 1024**3]
+
+
+def gen_body(upload_size: int, chunk_size: int) -> Generator[bytes, None, None]:
+    """Generate the chunks of a multipart body with a file part of `upload_size` bytes,
+    the body is not built in memory, and the delimiter straddles chunks like the real upload"""
+    data: bytes = b"x" * chunk_size
+    body_head: bytes = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="stream"; filename="demo.bin"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    body_tail: bytes = f"\r\n--{boundary}--\r\n".encode()
+    # The first chunk contains the header and the beginning of the file data
+    yield body_head + data[: chunk_size - len(body_head)]
+    remaining_size: int = upload_size - (chunk_size - len(body_head))
+    while remaining_size > chunk_size:
+        yield data
+        remaining_size -= chunk_size
+    yield data[:remaining_size] + body_tail
+
+
+def parse(upload_size: int, chunk_size: int) -> float:
+    parser: PushMultipartParser = PushMultipartParser(boundary)
+    size: int = 0
+    start_time: float = time.perf_counter()
+    for chunk in gen_body(upload_size, chunk_size):
+        for result in parser.parse(chunk):
+            if result is not None and not isinstance(result, MultipartSegment):
+                size += len(result)
+    parser.close()
+    duration: float = time.perf_counter() - start_time
+    assert size == upload_size
+    return duration
+
+
+def main() -> None:
+    for chunk_size in chunk_size_list:
+        for upload_size in upload_size_list:
+            duration: float = parse(upload_size, chunk_size)
+            print(
+                f"chunk size: {chunk_size // 1024}KB, upload size: {upload_size // 1024 ** 2}MB, "
+                f"duration: {duration:.4f}s, throughput: {upload_size / 1024 ** 2 / duration:.1f}MB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Check the time it takes to build the OpenAPI document of an app with many routes"""
+
+import time
+from typing import Callable, List
+
+from flask import Flask
+from pydantic import BaseModel, Field
+
+from pait import field
+from pait.app.flask import pait
+from pait.openapi import openapi
+from pait.openapi.openapi import OpenAPI
+
+route_count: int = 1000
+
+
+class UserModel(BaseModel):
+    uid: int = Field(description="user id")
+    name: str = Field(description="user name")
+    age: int = Field(description="user age")
+
+
+class RespModel(BaseModel):
+    code: int = Field(0, description="api code")
+    msg: str = Field("success", description="api status msg")
+    data: UserModel
+
+
+def create_route(index: int) -> Callable:
+    def demo(
+        uid: int = field.Query.i(description="user id"),
+        name: str = field.Query.i(description="user name"),
+        token: str = field.Header.i(description="token"),
+        user: UserModel = field.Json.i(),
+    ) -> dict:
+        return {}
+
+    # The pait id is generated by the name of the route function, so the name must be unique
+    demo.__name__ = f"demo_{index}"
+    demo.__qualname__ = f"create_route.<locals>.demo_{index}"
+    return pait(response_model_list=[RespModel])(demo)
+
+
+def create_app() -> Flask:
+    app: Flask = Flask(__name__)
+    for index in range(route_count):
+        app.add_url_rule(f"/api/demo-{index}", view_func=create_route(index), methods=["POST"])
+    return app
+
+
+def run(title: str, app: Flask, *cache_list: dict) -> None:
+    duration_list: List[float] = []
+    for _ in range(3):
+        for cache in cache_list:
+            cache.clear()
+        start = time.perf_counter()
+        OpenAPI(app).content()
+        duration_list.append(time.perf_counter() - start)
+    print(f"route count: {route_count}, {title} build duration: {min(duration_list)}")
+
+
+def main() -> None:
+    app = create_app()
+    # Build without any cache
+    run("cold", app, openapi._parse_pait_model_cache, openapi._synthesized_model_cache)
+    # Parse all routes again (e.g. the routes are changed), but reuse the synthesized pydantic models
+    run("reparse", app, openapi._parse_pait_model_cache)
+    run("warm", app)
+
+
+if __name__ == "__main__":
+    main()
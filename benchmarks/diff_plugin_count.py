@@ -0,0 +1,43 @@
+"""Check the overhead of each plugin by calling the routing function directly (without the HTTP layer)"""
+
+from typing import Callable, List
+
+from flask import Flask
+
+from benchmarks.diff_use_pait.run import run_and_calculate_time
+from pait import field
+from pait.app.flask import pait
+from pait.plugin.base import PrePluginProtocol
+
+plugin_count_list: List[int] = [0, 3, 10]
+
+
+class EmptyPlugin(PrePluginProtocol):
+    """A plugin that does nothing but call the next plugin"""
+
+
+def create_route(plugin_count: int) -> Callable:
+    @pait(plugin_list=[EmptyPlugin.build() for _ in range(plugin_count)], feature_code=str(plugin_count))
+    def demo(name: str = field.Query.t()) -> str:
+        return name
+
+    return demo
+
+
+def main() -> None:
+    app: Flask = Flask(__name__)
+    base_duration: float = 0.0
+    with app.test_request_context("/api/demo?name=John"):
+        for plugin_count in plugin_count_list:
+            route = create_route(plugin_count)
+            duration = run_and_calculate_time(route)
+            if plugin_count == plugin_count_list[0]:
+                base_duration = duration
+                print(f"plugin count: {plugin_count}, duration: {duration}")
+            else:
+                per_plugin_duration = (duration - base_duration) / (plugin_count - plugin_count_list[0])
+                print(f"plugin count: {plugin_count}, duration: {duration}, per plugin duration: {per_plugin_duration}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Check the bytes allocated by pait for each request (without the HTTP layer) by tracemalloc"""
+
+import gc
+import tracemalloc
+from typing import Callable, List
+
+from flask import Flask
+
+from pait import field
+from pait.app.flask import pait
+from pait.core import Pait
+from pait.model.context import ContextModel
+
+
+@pait()
+def demo(name: str = field.Query.t(), token: str = field.Header.t()) -> str:
+    return name + token
+
+
+def get_allocated_bytes_per_request(func: Callable, cnt: int = 1000) -> float:
+    """The average peak of the memory allocated during a request (the objects are freed after the request)"""
+    func()  # warm up, the first request will initialize some global caches
+    total_size: int = 0
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        for _ in range(cnt):
+            current_size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            _, peak_size = tracemalloc.get_traced_memory()
+            total_size += peak_size - current_size
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    return total_size / cnt
+
+
+def get_context_bytes(cnt: int = 1000) -> float:
+    """The average size of the objects created by pait for each request (context, app helper and request)"""
+    pait_core_model = demo.pait_core_model  # type: ignore[attr-defined]
+    context_list: List[ContextModel] = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_size, _ = tracemalloc.get_traced_memory()
+        for _ in range(cnt):
+            context = Pait.init_context(pait_core_model, (), {})
+            context.app_helper.request.request_extend()
+            context_list.append(context)
+        end_size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (end_size - start_size) / cnt
+
+
+def main() -> None:
+    app: Flask = Flask(__name__)
+    with app.test_request_context("/api/demo?name=John", headers={"token": "xxx"}):
+        print(f"allocated bytes per request: {get_allocated_bytes_per_request(demo)}")
+        print(f"context bytes per request: {get_context_bytes()}")
+
+
+if __name__ == "__main__":
+    main()
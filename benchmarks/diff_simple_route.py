@@ -0,0 +1,30 @@
+"""Compare the route that only uses the simple fields (which use the fast call path) with the route that uses depend,
+the routes of `diff_use_pait` are called through the test client of flask, starlette, tornado and sanic"""
+
+from pprint import pprint
+from typing import Dict
+
+from benchmarks.diff_use_pait import run
+
+url_dict: Dict[str, str] = {
+    "simple-route": "/api/user-info-by-simple-pait",
+    "depend-route": "/api/user-info-by-pait",
+}
+
+
+def main() -> None:
+    run.run_flask(url_dict)
+    run.run_starlette(url_dict)
+    run.run_tornado(url_dict)
+    # Sanic changes the event loop policy, so it runs last
+    run.run_sanic(url_dict)
+
+    result: Dict[str, Dict[str, float]] = {}
+    for framework, bucket in run.state_result.items():
+        result[framework] = {key: bucket[key] for key in url_dict}
+        result[framework]["diff"] = bucket["simple-route"] - bucket["depend-route"]
+    pprint(result)
+
+
+if __name__ == "__main__":
+    main()
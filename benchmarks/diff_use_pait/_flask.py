@@ -28,6 +28,24 @@ def user_info_by_pait(
     )
 
 
+# It only uses the simple fields, so it takes the fast call path of the simple route
+@pait()
+def user_info_by_simple_pait(
+    token: str = field.Header.t(),
+    name: str = field.Query.t(),
+    age: int = field.Query.t(),
+    sex: str = field.Query.t(),
+) -> Response:
+    return jsonify(
+        {
+            "uid": token_db_dict.get(token, ""),
+            "name": name,
+            "age": age,
+            "sex": sex,
+        }
+    )
+
+
 def user_info() -> Response:
     return jsonify(
         RequestDataModel(
@@ -42,5 +60,6 @@ def user_info() -> Response:
 def create_app() -> Flask:
     app = Flask(__name__)
     app.add_url_rule("/api/user-info-by-pait", view_func=user_info_by_pait, methods=["GET"])
+    app.add_url_rule("/api/user-info-by-simple-pait", view_func=user_info_by_simple_pait, methods=["GET"])
     app.add_url_rule("/api/user-info", view_func=user_info, methods=["GET"])
     return app
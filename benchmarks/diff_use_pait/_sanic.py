@@ -30,6 +30,24 @@ async def user_info_by_pait(
     )
 
 
+# It only uses the simple fields, so it takes the fast call path of the simple route
+@pait()
+async def user_info_by_simple_pait(
+    token: str = field.Header.t(),
+    name: str = field.Query.t(),
+    age: int = field.Query.t(),
+    sex: str = field.Query.t(),
+) -> HTTPResponse:
+    return json(
+        {
+            "uid": token_db_dict.get(token, ""),
+            "name": name,
+            "age": age,
+            "sex": sex,
+        }
+    )
+
+
 async def user_info(request: Request) -> HTTPResponse:
     return json(
         RequestDataModel(
@@ -44,5 +62,6 @@ async def user_info(request: Request) -> HTTPResponse:
 def create_app() -> Sanic:
     app = Sanic("benchmarks")
     app.add_route(user_info_by_pait, "/api/user-info-by-pait")
+    app.add_route(user_info_by_simple_pait, "/api/user-info-by-simple-pait")
     app.add_route(user_info, "/api/user-info")
     return app
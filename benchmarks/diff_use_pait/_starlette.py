@@ -30,6 +30,24 @@ async def user_info_by_pait(
     )
 
 
+# It only uses the simple fields, so it takes the fast call path of the simple route
+@pait()
+async def user_info_by_simple_pait(
+    token: str = field.Header.t(),
+    name: str = field.Query.t(),
+    age: int = field.Query.t(),
+    sex: str = field.Query.t(),
+) -> JSONResponse:
+    return JSONResponse(
+        {
+            "uid": token_db_dict.get(token, ""),
+            "name": name,
+            "age": age,
+            "sex": sex,
+        }
+    )
+
+
 async def user_info(request: Request) -> JSONResponse:
     return JSONResponse(
         RequestDataModel(
@@ -44,5 +62,6 @@ async def user_info(request: Request) -> JSONResponse:
 def create_app() -> Starlette:
     app = Starlette(__name__)
     app.add_route("/api/user-info-by-pait", user_info_by_pait, methods=["GET"])
+    app.add_route("/api/user-info-by-simple-pait", user_info_by_simple_pait, methods=["GET"])
     app.add_route("/api/user-info", user_info, methods=["GET"])
     return app
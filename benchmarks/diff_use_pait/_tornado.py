@@ -30,6 +30,26 @@ class UserInfoByPaitHandler(RequestHandler):
         )
 
 
+# It only uses the simple fields, so it takes the fast call path of the simple route
+class UserInfoBySimplePaitHandler(RequestHandler):
+    @pait()
+    async def get(
+        self,
+        token: str = field.Header.t(),
+        name: str = field.Query.t(),
+        age: int = field.Query.t(),
+        sex: str = field.Query.t(),
+    ) -> None:
+        self.write(
+            {
+                "uid": token_db_dict.get(token, ""),
+                "name": name,
+                "age": age,
+                "sex": sex,
+            }
+        )
+
+
 class UserInfoHandler(RequestHandler):
     async def get(self) -> None:
         request_dict = {key: value[0].decode() for key, value in self.request.query_arguments.items()}
@@ -47,6 +67,7 @@ def create_app() -> Application:
     app: Application = Application(
         [
             (r"/api/user-info-by-pait", UserInfoByPaitHandler),
+            (r"/api/user-info-by-simple-pait", UserInfoBySimplePaitHandler),
             (r"/api/user-info", UserInfoHandler),
         ]
     )
@@ -1,8 +1,9 @@
 import logging
 import time
 from contextlib import contextmanager
+from functools import partial
 from pprint import pprint
-from typing import Callable, Generator
+from typing import Callable, Dict, Generator, Optional
 
 from flask import Flask
 from flask.ctx import AppContext
@@ -19,6 +20,10 @@ state_result = {
     "starlette": {"raw": 0.0, "use-pait": 0.0},
     "tornado": {"raw": 0.0, "use-pait": 0.0},
 }
+# The path of the route to be measured, the result is saved in `state_result` with the key
+default_url_dict: Dict[str, str] = {"raw": "/api/user-info", "use-pait": "/api/user-info-by-pait"}
+query_string: str = "name=John&age=18&sex=man"
+headers: Dict[str, str] = {"token": "xxx"}
 
 
 def run_and_calculate_time(func: Callable) -> float:
@@ -33,7 +38,7 @@ def run_and_calculate_time(func: Callable) -> float:
     return sum(duration_list[int(cnt * 0.05) : int(cnt * 0.95)]) / int(cnt * 0.9)
 
 
-def run_flask() -> None:
+def run_flask(url_dict: Optional[Dict[str, str]] = None) -> None:
     @contextmanager
     def client_ctx() -> Generator[FlaskClient, None, None]:
         app: Flask = _flask.create_app()
@@ -45,61 +50,33 @@ def run_flask() -> None:
         yield client  # this is where the testing happens!
         ctx.pop()
 
-    with client_ctx() as client:
-        state_result["flask"]["raw"] = run_and_calculate_time(
-            lambda: client.get(
-                "/api/user-info?name=John&age=18&sex=man",
-                headers={"token": "xxx"},
+    for key, url in (url_dict or default_url_dict).items():
+        with client_ctx() as client:
+            state_result["flask"][key] = run_and_calculate_time(
+                partial(client.get, f"{url}?{query_string}", headers=headers)
             )
-        )
-    with client_ctx() as client:
-        state_result["flask"]["use-pait"] = run_and_calculate_time(
-            lambda: client.get(
-                "/api/user-info-by-pait?name=John&age=18&sex=man",
-                headers={"token": "xxx"},
-            )
-        )
 
 
-def run_sanic() -> None:
+def run_sanic(url_dict: Optional[Dict[str, str]] = None) -> None:
     logging.disable()  # don't know where to configure the log, the test environment will be canceled log
-    app: _sanic.Sanic = _sanic.create_app()
-    app.config.ACCESS_LOG = False
-    state_result["sanic"]["raw"] = run_and_calculate_time(
-        lambda: app.test_client.get(
-            "/api/user-info?name=John&age=18&sex=man",
-            headers={"token": "xxx"},
-        )
-    )
-    app = _sanic.create_app()
-    app.config.ACCESS_LOG = False
-    state_result["sanic"]["use-pait"] = run_and_calculate_time(
-        lambda: app.test_client.get(
-            "/api/user-info-by-pait?name=John&age=18&sex=man",
-            headers={"token": "xxx"},
+    for key, url in (url_dict or default_url_dict).items():
+        app: _sanic.Sanic = _sanic.create_app()
+        app.config.ACCESS_LOG = False
+        state_result["sanic"][key] = run_and_calculate_time(
+            partial(app.test_client.get, f"{url}?{query_string}", headers=headers)
         )
-    )
 
 
-def run_starlette() -> None:
-    with TestClient(_starlette.create_app()) as client:
-        state_result["starlette"]["raw"] = run_and_calculate_time(
-            lambda: client.get(
-                "/api/user-info?name=John&age=18&sex=man",
-                headers={"token": "xxx"},
+def run_starlette(url_dict: Optional[Dict[str, str]] = None) -> None:
+    for key, url in (url_dict or default_url_dict).items():
+        with TestClient(_starlette.create_app()) as client:
+            state_result["starlette"][key] = run_and_calculate_time(
+                partial(client.get, f"{url}?{query_string}", headers=headers)
             )
-        )
-    with TestClient(_starlette.create_app()) as client:
-        state_result["starlette"]["use-pait"] = run_and_calculate_time(
-            lambda: client.get(
-                "/api/user-info-by-pait?name=John&age=18&sex=man",
-                headers={"token": "xxx"},
-            )
-        )
 
 
-def run_tornado() -> None:
-    class BaseTestTornado(AsyncHTTPTestCase):
+def run_tornado(url_dict: Optional[Dict[str, str]] = None) -> None:
+    class TestTornado(AsyncHTTPTestCase):
         def get_app(self) -> Application:
             return _tornado.create_app()
 
@@ -107,39 +84,12 @@ def run_tornado() -> None:
             return "%s://localhost:%s%s" % (self.get_protocol(), self.get_http_port(), path)
 
         def runTest(self) -> None:
-            state_result["tornado"]["raw"] = run_and_calculate_time(
-                lambda: self.fetch(
-                    "/api/user-info?name=John&age=18&sex=man",
-                    headers={"token": "xxx"},
-                )
-            )
-
-    class RawTestTornado(BaseTestTornado):
-        def runTest(self) -> None:
-            state_result["tornado"]["raw"] = run_and_calculate_time(
-                lambda: self.fetch(
-                    "/api/user-info?name=John&age=18&sex=man",
-                    headers={"token": "xxx"},
-                )
-            )
-            state_result["tornado"]["use-pait"] = run_and_calculate_time(
-                lambda: self.fetch(
-                    "/api/user-info-by-pait?name=John&age=18&sex=man",
-                    headers={"token": "xxx"},
-                )
-            )
-
-    class UserPaitTestTornado(BaseTestTornado):
-        def runTest(self) -> None:
-            state_result["tornado"]["use-pait"] = run_and_calculate_time(
-                lambda: self.fetch(
-                    "/api/user-info-by-pait?name=John&age=18&sex=man",
-                    headers={"token": "xxx"},
-                )
+            state_result["tornado"][key] = run_and_calculate_time(
+                partial(self.fetch, f"{url}?{query_string}", headers=headers)
             )
 
-    RawTestTornado().run()
-    UserPaitTestTornado().run()
+    for key, url in (url_dict or default_url_dict).items():
+        TestTornado().run()
 
 
 def main() -> None:
@@ -1,9 +1,14 @@
+import os
+import tempfile
+
 from example.common import tag
+from example.common.request_model import UserModel
 from example.flask_example.utils import create_app, global_pait
 from pait.app.flask import Pait
 from pait.extra.field.stream.by_multipart import Stream as MultipartStream
 from pait.extra.field.stream.by_streaming_form_data import Stream as SFAStream
-from pait.extra.field.stream.request_resource import StreamFile
+from pait.extra.field.stream.json_lines import JsonLinesIterator
+from pait.extra.field.stream.request_resource import JsonLines, StreamFile
 from pait.model.status import PaitStatus
 
 file_pait: Pait = global_pait.create_sub_pait(
@@ -29,7 +34,70 @@ def multipart_route(stream: MultipartStream = StreamFile.i()) -> dict:
     return {"filename": stream.filename(), "length": file_len}
 
 
+class LimitedMultipartStream(MultipartStream):
+    chunk_size = 16
+    max_body_size = 1024
+
+
+@file_pait()
+def multipart_limit_route(stream: LimitedMultipartStream = StreamFile.i()) -> dict:
+    chunk_list = [chunk for chunk in stream.stream()]
+    return {
+        "filename": stream.filename(),
+        "length": sum(len(chunk) for chunk in chunk_list),
+        # Except for the last chunk, the small chunks are merged into a chunk of at least `chunk_size`
+        "coalesced": all(len(chunk) >= stream.chunk_size for chunk in chunk_list[:-1]),
+    }
+
+
+@file_pait()
+def multipart_save_route(stream: MultipartStream = StreamFile.i()) -> dict:
+    with tempfile.TemporaryDirectory() as dir_name:
+        path = os.path.join(dir_name, "upload")
+        save_result = stream.save_to(path, checksum=("sha256", "md5"))
+        file_size = os.path.getsize(path)
+    return {
+        "filename": stream.filename(),
+        "size": save_result.size,
+        "file_size": file_size,
+        "checksum": save_result.checksum,
+    }
+
+
+@file_pait()
+def multipart_parts_route(stream: MultipartStream = StreamFile.i()) -> dict:
+    file_dict = {}
+    for part in stream.parts():
+        file_len = 0
+        for chunk in part.stream():
+            file_len += len(chunk)
+        file_dict[part.name] = {"filename": part.filename, "length": file_len}
+    return {"form": stream.form, "file": file_dict}
+
+
+@file_pait()
+def multipart_multi_file_route(avatar: MultipartStream = StreamFile.i(), doc: MultipartStream = StreamFile.i()) -> dict:
+    result = {}
+    for name, stream in (("avatar", avatar), ("doc", doc)):
+        file_len = 0
+        for chunk in stream.stream():
+            file_len += len(chunk)
+        result[name] = {"filename": stream.filename(), "length": file_len}
+    return result
+
+
+@file_pait()
+def json_lines_route(items: JsonLinesIterator[UserModel] = JsonLines.i(raise_error=False)) -> dict:
+    uid_list = [item.uid for item in items]
+    return {"uid_list": uid_list, "error_list": [exc.msg for exc in items.error_list]}
+
+
 if __name__ == "__main__":
     with create_app(__name__) as app:
         app.add_url_rule("/api/file/stream-for-data", view_func=stream_for_data_route, methods=["POST"])
         app.add_url_rule("/api/file/multipart", view_func=multipart_route, methods=["POST"])
+        app.add_url_rule("/api/file/multipart-limit", view_func=multipart_limit_route, methods=["POST"])
+        app.add_url_rule("/api/file/multipart-save", view_func=multipart_save_route, methods=["POST"])
+        app.add_url_rule("/api/file/multipart-parts", view_func=multipart_parts_route, methods=["POST"])
+        app.add_url_rule("/api/file/multipart-multi-file", view_func=multipart_multi_file_route, methods=["POST"])
+        app.add_url_rule("/api/file/json-lines", view_func=json_lines_route, methods=["POST"])
@@ -33,7 +33,15 @@ from example.flask_example.field_route import (
     post_route,
     same_alias_route,
 )
-from example.flask_example.file_route import multipart_route, stream_for_data_route
+from example.flask_example.file_route import (
+    json_lines_route,
+    multipart_limit_route,
+    multipart_multi_file_route,
+    multipart_parts_route,
+    multipart_route,
+    multipart_save_route,
+    stream_for_data_route,
+)
 from example.flask_example.plugin_route import (
     auto_complete_json_route,
     cache_response,
@@ -315,6 +323,11 @@ def create_app() -> Flask:
     app.add_url_rule("/api/security/user-name-by-http-digest", view_func=get_user_name_by_http_digest, methods=["GET"])
     app.add_url_rule("/api/file/stream-for-data", view_func=stream_for_data_route, methods=["POST"])
     app.add_url_rule("/api/file/multipart", view_func=multipart_route, methods=["POST"])
+    app.add_url_rule("/api/file/multipart-limit", view_func=multipart_limit_route, methods=["POST"])
+    app.add_url_rule("/api/file/multipart-parts", view_func=multipart_parts_route, methods=["POST"])
+    app.add_url_rule("/api/file/multipart-save", view_func=multipart_save_route, methods=["POST"])
+    app.add_url_rule("/api/file/json-lines", view_func=json_lines_route, methods=["POST"])
+    app.add_url_rule("/api/file/multipart-multi-file", view_func=multipart_multi_file_route, methods=["POST"])
 
     app.errorhandler(PaitBaseException)(api_exception)
     app.errorhandler(ValidationError)(api_exception)
@@ -1,11 +1,16 @@
+import os
+import tempfile
+
 from sanic.response import HTTPResponse, json
 
 from example.common import tag
+from example.common.request_model import UserModel
 from example.sanic_example.utils import create_app, global_pait
 from pait.app.sanic import Pait
 from pait.extra.field.stream.by_multipart import AsyncStream as MultipartStream
 from pait.extra.field.stream.by_streaming_form_data import AsyncStream as SFAStream
-from pait.extra.field.stream.request_resource import StreamFile
+from pait.extra.field.stream.json_lines import AsyncJsonLinesIterator
+from pait.extra.field.stream.request_resource import JsonLines, StreamFile
 from pait.model.status import PaitStatus
 
 file_pait: Pait = global_pait.create_sub_pait(
@@ -31,7 +36,78 @@ async def multipart_route(stream: MultipartStream = StreamFile.i()) -> HTTPRespo
     return json({"filename": await stream.filename(), "length": file_len})
 
 
+class LimitedMultipartStream(MultipartStream):
+    chunk_size = 16
+    max_body_size = 1024
+
+
+@file_pait()
+async def multipart_limit_route(stream: LimitedMultipartStream = StreamFile.i()) -> HTTPResponse:
+    chunk_list = [chunk async for chunk in stream.stream()]
+    return json(
+        {
+            "filename": await stream.filename(),
+            "length": sum(len(chunk) for chunk in chunk_list),
+            # Except for the last chunk, the small chunks are merged into a chunk of at least `chunk_size`
+            "coalesced": all(len(chunk) >= stream.chunk_size for chunk in chunk_list[:-1]),
+        }
+    )
+
+
+@file_pait()
+async def multipart_save_route(stream: MultipartStream = StreamFile.i()) -> HTTPResponse:
+    with tempfile.TemporaryDirectory() as dir_name:
+        path = os.path.join(dir_name, "upload")
+        save_result = await stream.save_to(path, checksum=("sha256", "md5"))
+        file_size = os.path.getsize(path)
+    return json(
+        {
+            "filename": await stream.filename(),
+            "size": save_result.size,
+            "file_size": file_size,
+            "checksum": save_result.checksum,
+        }
+    )
+
+
+@file_pait()
+async def multipart_parts_route(stream: MultipartStream = StreamFile.i()) -> HTTPResponse:
+    file_dict = {}
+    async for part in stream.parts():
+        file_len = 0
+        async for chunk in part.stream():
+            file_len += len(chunk)
+        file_dict[part.name] = {"filename": part.filename, "length": file_len}
+    return json({"form": stream.form, "file": file_dict})
+
+
+@file_pait()
+async def multipart_multi_file_route(
+    avatar: MultipartStream = StreamFile.i(), doc: MultipartStream = StreamFile.i()
+) -> HTTPResponse:
+    result = {}
+    for name, stream in (("avatar", avatar), ("doc", doc)):
+        file_len = 0
+        async for chunk in stream.stream():
+            file_len += len(chunk)
+        result[name] = {"filename": await stream.filename(), "length": file_len}
+    return json(result)
+
+
+@file_pait()
+async def json_lines_route(
+    items: AsyncJsonLinesIterator[UserModel] = JsonLines.i(raise_error=False),
+) -> HTTPResponse:
+    uid_list = [item.uid async for item in items]
+    return json({"uid_list": uid_list, "error_list": [exc.msg for exc in items.error_list]})
+
+
 if __name__ == "__main__":
     with create_app(__name__) as app:
         app.add_route(stream_for_data_route, "/api/file/stream-for-data", methods=["POST"], stream=True)
         app.add_route(multipart_route, "/api/file/multipart", methods=["POST"], stream=True)
+        app.add_route(multipart_limit_route, "/api/file/multipart-limit", methods=["POST"], stream=True)
+        app.add_route(multipart_save_route, "/api/file/multipart-save", methods=["POST"], stream=True)
+        app.add_route(multipart_parts_route, "/api/file/multipart-parts", methods=["POST"], stream=True)
+        app.add_route(multipart_multi_file_route, "/api/file/multipart-multi-file", methods=["POST"], stream=True)
+        app.add_route(json_lines_route, "/api/file/json-lines", methods=["POST"], stream=True)
@@ -38,7 +38,15 @@ from example.sanic_example.field_route import (
     post_route,
     same_alias_route,
 )
-from example.sanic_example.file_route import multipart_route, stream_for_data_route
+from example.sanic_example.file_route import (
+    json_lines_route,
+    multipart_limit_route,
+    multipart_multi_file_route,
+    multipart_parts_route,
+    multipart_route,
+    multipart_save_route,
+    stream_for_data_route,
+)
 from example.sanic_example.plugin_route import (
     auto_complete_json_route,
     cache_response,
@@ -336,6 +344,11 @@ def create_app(configure_logging: bool = True) -> Sanic:
     app.add_route(sync_with_ctx_depend_route, "/api/sync-to-thread/sync-ctx-depend", methods={"POST"})
     app.add_route(stream_for_data_route, "/api/file/stream-for-data", methods=["POST"], stream=True)
     app.add_route(multipart_route, "/api/file/multipart", methods=["POST"], stream=True)
+    app.add_route(multipart_limit_route, "/api/file/multipart-limit", methods=["POST"], stream=True)
+    app.add_route(multipart_parts_route, "/api/file/multipart-parts", methods=["POST"], stream=True)
+    app.add_route(multipart_save_route, "/api/file/multipart-save", methods=["POST"], stream=True)
+    app.add_route(json_lines_route, "/api/file/json-lines", methods=["POST"], stream=True)
+    app.add_route(multipart_multi_file_route, "/api/file/multipart-multi-file", methods=["POST"], stream=True)
 
     app.exception(PaitBaseException, ValidationError, RuntimeError, SanicException)(api_exception)
     # app.exception(ValidationError)(api_exception)
@@ -37,7 +37,15 @@ from example.starlette_example.field_route import (
     post_route,
     same_alias_route,
 )
-from example.starlette_example.file_route import multipart_route, stream_for_data_route
+from example.starlette_example.file_route import (
+    json_lines_route,
+    multipart_limit_route,
+    multipart_multi_file_route,
+    multipart_parts_route,
+    multipart_route,
+    multipart_save_route,
+    stream_for_data_route,
+)
 from example.starlette_example.plugin_route import (
     async_auto_complete_json_route,
     async_check_json_plugin_route,
@@ -347,6 +355,11 @@ def create_app() -> Starlette:
             Route("/api/sync-to-thread/sync-ctx-depend", sync_with_ctx_depend_route, methods=["POST"]),
             Route("/api/file/stream-for-data", stream_for_data_route, methods=["POST"]),
             Route("/api/file/multipart", multipart_route, methods=["POST"]),
+            Route("/api/file/multipart-limit", multipart_limit_route, methods=["POST"]),
+            Route("/api/file/multipart-parts", multipart_parts_route, methods=["POST"]),
+            Route("/api/file/multipart-save", multipart_save_route, methods=["POST"]),
+            Route("/api/file/json-lines", json_lines_route, methods=["POST"]),
+            Route("/api/file/multipart-multi-file", multipart_multi_file_route, methods=["POST"]),
         ]
     )
     CacheResponsePlugin.set_redis_to_app(app, redis=Redis(decode_responses=True))
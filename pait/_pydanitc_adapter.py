@@ -1,3 +1,4 @@
+import copy
 from typing import Callable, Optional, Type, TypeVar, Union
 
 from any_api.util import pydantic_adapter as _any_api_pydantic_adapter
@@ -9,6 +10,7 @@ __all__ = [
     "is_v1",
     "ConfigDict",
     "PaitModelField",
+    "PaitCompiledModelField",
     "get_field_info",
     "get_extra_dict_by_field_info",
     "get_extra_by_field_info",
@@ -34,6 +36,8 @@ get_extra_by_field_info = _any_api_pydantic_adapter.get_extra_by_field_info
 
 
 if _any_api_pydantic_adapter.is_v1:
+    from typing import Any, Dict, List, Sequence, Set, Tuple
+
     from pydantic import BaseConfig
     from pydantic.error_wrappers import ValidationError
     from pydantic.fields import FieldInfo, ModelField
@@ -80,11 +84,11 @@ if _any_api_pydantic_adapter.is_v1:
         return field.extra
 
 else:
-    from typing import Any, Dict, List, Sequence, Tuple, Union
+    from typing import Any, Dict, List, Sequence, Set, Tuple, Union
 
     from pydantic import BaseModel, TypeAdapter, ValidationError
     from pydantic.fields import FieldInfo, PydanticUndefined
-    from typing_extensions import Annotated
+    from typing_extensions import Annotated, TypedDict
 
     PydanticUndefinedType = type(PydanticUndefined)
 
@@ -144,6 +148,108 @@ else:
         return field.json_schema_extra or {}
 
 
+# Different versions of Pydantic have different ways to validate multiple values at once
+if _any_api_pydantic_adapter.is_v1:
+    from pydantic import create_model, validate_model
+    from pydantic.error_wrappers import ErrorWrapper as _ErrorWrapper
+
+    class PaitCompiledModelField(object):
+        """Validate the values of multiple `PaitModelField` in a single pass and raise one `ValidationError`"""
+
+        def __init__(
+            self, pait_model_field_list: List[PaitModelField], class_name: str, base_model: Type[BaseModel] = BaseModel
+        ) -> None:
+            self.pait_model_field_list = pait_model_field_list
+            self.class_name = class_name
+            self.base_model = base_model
+
+            # The value name may shadow the attribute of BaseModel(e.g: json), so the field of model use a safe name
+            self._field_name_dict: Dict[str, str] = {
+                i.value_name: f"field_{index}" for index, i in enumerate(pait_model_field_list)
+            }
+            self._model: Type[BaseModel] = create_model(  # type: ignore[call-overload]
+                class_name,
+                __base__=base_model,
+                **{
+                    self._field_name_dict[i.value_name]: (i.annotation, copy.copy(i.field_info))
+                    for i in pait_model_field_list
+                },
+            )
+            # The key of the input value is the alias of the model field
+            self._input_key_dict: Dict[str, str] = {}
+            self._loc_prefix_dict: Dict[Union[str, int], Tuple[str, str]] = {}
+            for pait_model_field in pait_model_field_list:
+                value_name = pait_model_field.value_name
+                input_key = self._model.__fields__[self._field_name_dict[value_name]].alias
+                self._input_key_dict[value_name] = input_key
+                self._loc_prefix_dict[input_key] = (pait_model_field.request_param, value_name)
+
+        def _regenerate_error(self, errors: Sequence[Any]) -> List[_ErrorWrapper]:
+            updated_loc_errors: List[_ErrorWrapper] = []
+            for err in errors:
+                if isinstance(err, list):
+                    updated_loc_errors.extend(self._regenerate_error(err))
+                    continue
+                loc = err.loc_tuple()
+                if loc and loc[0] in self._loc_prefix_dict:
+                    loc = self._loc_prefix_dict[loc[0]] + tuple(loc[1:])
+                updated_loc_errors.append(_ErrorWrapper(err.exc, loc))
+            return updated_loc_errors
+
+        def validate(self, value_dict: Dict[str, Any]) -> Dict[str, Any]:
+            input_dict = {input_key: value_dict[value_name] for value_name, input_key in self._input_key_dict.items()}
+            ok_value_dict, _, exc = validate_model(self._model, input_dict)
+            if exc:
+                raise ValidationError(self._regenerate_error(exc.raw_errors), self.base_model)
+            return {value_name: ok_value_dict[field_name] for value_name, field_name in self._field_name_dict.items()}
+
+else:
+
+    class PaitCompiledModelField(object):  # type: ignore[no-redef]
+        """Validate the values of multiple `PaitModelField` in a single pass and raise one `ValidationError`"""
+
+        def __init__(
+            self, pait_model_field_list: List[PaitModelField], class_name: str, base_model: Type[BaseModel] = BaseModel
+        ) -> None:
+            self.pait_model_field_list = pait_model_field_list
+            self.class_name = class_name
+            self.base_model = base_model
+
+            # The key of the validated value is the value name, but the key of the input value is the validation alias
+            self._input_key_dict: Dict[str, str] = {}
+            self._loc_prefix_dict: Dict[Union[str, int], Tuple[str, str]] = {}
+            for pait_model_field in pait_model_field_list:
+                value_name = pait_model_field.value_name
+                validation_alias = pait_model_field.field_info.validation_alias
+                input_key = validation_alias if isinstance(validation_alias, str) else value_name
+                self._input_key_dict[value_name] = input_key
+                self._loc_prefix_dict[input_key] = (pait_model_field.request_param, value_name)
+                self._loc_prefix_dict[value_name] = (pait_model_field.request_param, value_name)
+            typed_dict = TypedDict(  # type: ignore[misc]
+                class_name,
+                {i.value_name: Annotated[i.annotation, i.field_info] for i in pait_model_field_list},  # type: ignore
+            )
+            self._type_adapter: TypeAdapter[Any] = TypeAdapter(typed_dict)
+
+        def _regenerate_error(self, errors: Sequence[Any]) -> List[Dict[str, Any]]:
+            updated_loc_errors: List[Dict[str, Any]] = []
+            for err in _normalize_errors(errors):
+                loc = err.get("loc", ())
+                if loc and loc[0] in self._loc_prefix_dict:
+                    loc = self._loc_prefix_dict[loc[0]] + tuple(loc[1:])
+                updated_loc_errors.append({**err, "loc": loc})
+            return updated_loc_errors
+
+        def validate(self, value_dict: Dict[str, Any]) -> Dict[str, Any]:
+            input_dict = {input_key: value_dict[value_name] for value_name, input_key in self._input_key_dict.items()}
+            try:
+                return self._type_adapter.validate_python(input_dict, from_attributes=True)
+            except ValidationError as exc:
+                raise exc.from_exception_data(
+                    title=f"{self.class_name} Validation Error", line_errors=self._regenerate_error(exc.errors())
+                )
+
+
 def get_field_extra_dict(field: FieldInfo, json_schema_extra_dict: Optional[dict] = None) -> dict:
     json_schema_extra = get_field_extra(field)
     if callable(json_schema_extra):
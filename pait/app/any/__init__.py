@@ -93,6 +93,11 @@ def get_app_attribute(app: Any, key: str, default_value: Any = MISSING) -> Any:
     return base_call_func("get_app_attribute", app, key, default_value, app=app)
 
 
+def add_app_depend_shutdown_hook(app: Any) -> None:
+    """Exit the context managers of the app scope depends when the app is shutdown"""
+    base_call_func("add_app_depend_shutdown_hook", app, app=app)
+
+
 def add_simple_route(app: Any, simple_route: "SimpleRoute") -> None:
     base_call_func("add_simple_route", app, simple_route, app=app)
 
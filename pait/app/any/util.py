@@ -39,6 +39,11 @@ def import_func_from_app(fun_name: str, app: Any = None, module_name: str = "")
         app_name: str = sniffing(app)
     else:
         app_name = auto_load_app_class().__name__.lower()
+    return import_func_from_app_name(fun_name, app_name, module_name=module_name)
+
+
+def import_func_from_app_name(fun_name: str, app_name: str, module_name: str = "") -> Callable:
+    """Import the func by the name of the framework, e.g. the `app_name` of the app helper of the request"""
     framework_location = framework_location_dict.get(app_name, "pait.app")
     if module_name:
         return getattr(import_module(f"{framework_location}.{app_name}.{module_name}"), fun_name)
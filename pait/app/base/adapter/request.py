@@ -1,9 +1,13 @@
-from typing import Any, AsyncGenerator, Generator, Generic, List, Mapping, Type, TypeVar, Union
+import asyncio
+from functools import wraps
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, Generic, List, Mapping, Tuple, Type, TypeVar, Union
 
 RequestT = TypeVar("RequestT")
 
 
 class BaseRequestExtend(Generic[RequestT]):
+    __slots__ = ("request",)
+
     def __init__(self, request: RequestT) -> None:
         self.request: RequestT = request
 
@@ -23,12 +27,60 @@ class BaseRequestExtend(Generic[RequestT]):
 RequestExtendT = TypeVar("RequestExtendT", bound=BaseRequestExtend)
 
 
+def _memo_source(func: Callable) -> Callable:
+    """Cache the result of the request source method in the BaseRequest object (supports async method)"""
+    name: str = func.__name__
+
+    @wraps(func)
+    def sync_wrapper(self: "BaseRequest", *args: Any, **kwargs: Any) -> Any:
+        memo_source_dict = self.get_memo_source_dict()
+        if name not in memo_source_dict:
+            memo_source_dict[name] = func(self, *args, **kwargs)
+        return memo_source_dict[name]
+
+    @wraps(func)
+    async def async_wrapper(self: "BaseRequest", *args: Any, **kwargs: Any) -> Any:
+        memo_source_dict = self.get_memo_source_dict()
+        if name not in memo_source_dict:
+            memo_source_dict[name] = await func(self, *args, **kwargs)
+        return memo_source_dict[name]
+
+    wrapper: Callable = async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+    setattr(wrapper, "_pait_memo_source", True)
+    return wrapper
+
+
 class BaseRequest(Generic[RequestT, RequestExtendT]):
     # The class that defines the request object corresponding to the framework (consistent with Request T)
     RequestType: Type[RequestT] = type  # type: ignore
     FormType = type(None)  # The class that defines the form object corresponding to the framework
     FileType = type(None)  # The class that defines the file object corresponding to the framework
     HeaderType = type(None)  # The class that defines the header object corresponding to the framework
+    # The request source methods that are memoized.
+    # Each request has its own BaseRequest object, so each source is only materialized once per request,
+    # no matter how many fields of the route read from it.
+    memo_source_name_tuple: Tuple[str, ...] = (
+        "body",
+        "cookie",
+        "file",
+        "form",
+        "header",
+        "multiform",
+        "multiquery",
+        "query",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in cls.memo_source_name_tuple:
+            func = cls.__dict__.get(name, None)
+            if not callable(func) or getattr(func, "_pait_memo_source", False):
+                continue
+            setattr(cls, name, _memo_source(func))
+
+    # Each request creates a BaseRequest object, so use __slots__ to save the memory footprint,
+    # the subclass should also define `__slots__` (if it does not define, the object will have a `__dict__`)
+    __slots__ = ("request", "args", "kwargs", "request_kwargs", "_memo_source_dict")
 
     def __init__(self, request: RequestT, args: List[Any], kwargs: Mapping[str, Any]):
         self.request: RequestT = request
@@ -36,6 +88,14 @@ class BaseRequest(Generic[RequestT, RequestExtendT]):
         self.kwargs: Mapping[str, Any] = kwargs
         self.request_kwargs: Mapping[str, Any] = kwargs
 
+    def get_memo_source_dict(self) -> Dict[str, Any]:
+        """The result of the memoized request source methods, it is only initialized when it is used"""
+        try:
+            return self._memo_source_dict
+        except AttributeError:
+            self._memo_source_dict: Dict[str, Any] = {}
+            return self._memo_source_dict
+
     def request_extend(self) -> BaseRequestExtend[RequestT]:
         return BaseRequestExtend(self.request)
 
@@ -85,4 +145,9 @@ class BaseRequest(Generic[RequestT, RequestExtendT]):
         return value is self.HeaderType
 
     def self(self) -> Mapping:
-        return self.__dict__
+        value_dict: Dict[str, Any] = dict(getattr(self, "__dict__", {}))
+        for class_ in type(self).__mro__:
+            for key in getattr(class_, "__slots__", ()):
+                if hasattr(self, key):
+                    value_dict[key] = getattr(self, key)
+        return value_dict
@@ -15,6 +15,9 @@ class BaseAppHelper(Generic[RequestT, RequestExtendT]):
 
     request_class: Type[BaseRequest[RequestT, RequestExtendT]] = BaseRequest
 
+    # Each request creates an app helper object, so use __slots__ to save the memory footprint
+    __slots__ = ("cbv_instance", "raw_request", "request")
+
     def __init__(self, args: List[Any], kwargs: Mapping[str, Any]):
         """
         Extract the required data from the passed parameters,
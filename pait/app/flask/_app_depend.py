@@ -0,0 +1,12 @@
+import atexit
+
+from flask import Flask
+
+from pait.param_handle.app_depend import close_app_depend
+
+__all__ = ["add_app_depend_shutdown_hook"]
+
+
+def add_app_depend_shutdown_hook(app: Flask) -> None:
+    """Exit the context managers of the app scope depends when the process exits (Flask has no shutdown event)"""
+    atexit.register(close_app_depend)
@@ -13,6 +13,8 @@ __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[_Request, RequestExtend]):
+    __slots__ = ()
+
     CbvType = (View,)
     app_name = "flask"
 
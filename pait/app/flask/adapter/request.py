@@ -5,10 +5,11 @@ from flask import request as _request
 from werkzeug.datastructures import EnvironHeaders, Headers, ImmutableMultiDict
 
 from pait.app.base.adapter.request import BaseRequest, BaseRequestExtend
-from pait.util import LazyProperty
 
 
 class RequestExtend(BaseRequestExtend[FlaskRequest]):
+    __slots__ = ()
+
     @property
     def scheme(self) -> str:
         return _request.scheme
@@ -23,6 +24,8 @@ class RequestExtend(BaseRequestExtend[FlaskRequest]):
 
 
 class Request(BaseRequest[FlaskRequest, RequestExtend]):
+    __slots__ = ()
+
     RequestType = FlaskRequest
     FormType = ImmutableMultiDict
     FileType = FlaskRequest.files
@@ -60,10 +63,8 @@ class Request(BaseRequest[FlaskRequest, RequestExtend]):
             yield chunk
         return None
 
-    @LazyProperty()
     def multiform(self) -> Dict[str, List[Any]]:
         return {key: _request.form.getlist(key) for key, _ in _request.form.items()}
 
-    @LazyProperty()
     def multiquery(self) -> Dict[str, List[Any]]:
         return {key: _request.args.getlist(key) for key, _ in _request.args.items()}
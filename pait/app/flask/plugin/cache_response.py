@@ -1,3 +1,25 @@
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from typing import Any, List, Optional, Tuple
 
-__all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
+from flask import Response
+
+from pait.plugin.cache_response import BaseCacheSerializer, CacheRespExtraParam
+from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
+from pait.plugin.cache_response import CacheSerializer as _CacheSerializer
+
+__all__ = ["CacheResponsePlugin", "CacheRespExtraParam", "CacheSerializer"]
+
+
+class CacheSerializer(_CacheSerializer):
+    def dump_response(self, value: Any) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        if not isinstance(value, Response) or value.is_streamed or value.direct_passthrough:
+            return None
+        return value.status_code, list(value.headers.items()), value.get_data()
+
+    def load_response(self, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> Response:
+        return Response(body, status=status_code, headers=headers)
+
+
+class CacheResponsePlugin(_CacheResponsePlugin):
+    @classmethod
+    def default_serializer(cls) -> BaseCacheSerializer:
+        return CacheSerializer()
@@ -1,4 +1,5 @@
 from ._api_route import APIRoute
+from ._app_depend import add_app_depend_shutdown_hook
 from ._app_helper import AppHelper
 from ._load_app import load_app
 from ._pait import Pait, pait
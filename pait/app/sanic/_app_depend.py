@@ -0,0 +1,16 @@
+from asyncio import AbstractEventLoop
+
+from sanic import Sanic
+
+from pait.param_handle.app_depend import async_close_app_depend
+
+__all__ = ["add_app_depend_shutdown_hook"]
+
+
+async def _after_server_stop(app: Sanic, loop: AbstractEventLoop) -> None:
+    await async_close_app_depend()
+
+
+def add_app_depend_shutdown_hook(app: Sanic) -> None:
+    """Exit the context managers of the app scope depends when the server is stopped"""
+    app.register_listener(_after_server_stop, "after_server_stop")
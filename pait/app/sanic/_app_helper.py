@@ -20,6 +20,8 @@ __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[_Request, RequestExtend]):
+    __slots__ = ()
+
     CbvType = cbv_type_tuple
     app_name = "sanic"
 
@@ -7,10 +7,11 @@ from sanic.request import Request as _Request
 from sanic.request import RequestParameters
 
 from pait.app.base.adapter.request import BaseRequest, BaseRequestExtend
-from pait.util import LazyProperty
 
 
 class RequestExtend(BaseRequestExtend[_Request]):
+    __slots__ = ()
+
     @property
     def scheme(self) -> str:
         return self.request.scheme
@@ -25,6 +26,8 @@ class RequestExtend(BaseRequestExtend[_Request]):
 
 
 class SanicBaseRequest(BaseRequest[_Request, RequestExtend]):
+    __slots__ = ()
+
     RequestType = _Request
     FormType = RequestParameters
     FileType = File
@@ -49,15 +52,12 @@ class SanicBaseRequest(BaseRequest[_Request, RequestExtend]):
     # sanic return result like: {"a": [1], "b": [2]} #
     # not support raw_return future                  #
     ##################################################
-    @LazyProperty()
     def file(self) -> Dict[str, File]:
         return {key: value[0] for key, value in self.request.files.items()}
 
-    @LazyProperty()
     def form(self) -> dict:
         return {key: value[0] for key, value in self.request.form.items()}
 
-    @LazyProperty()
     def query(self) -> dict:
         return {key: value[0] for key, value in self.request.args.items()}
 
@@ -72,20 +72,20 @@ class SanicBaseRequest(BaseRequest[_Request, RequestExtend]):
 
         return _stream()
 
-    @LazyProperty()
     def multiform(self) -> Dict[str, List[Any]]:
         return {key: self.request.form.getlist(key) for key, _ in self.request.form.items()}
 
-    @LazyProperty()
     def multiquery(self) -> Dict[str, Any]:
         return {key: self.request.args.getlist(key) for key, _ in self.request.args.items()}
 
 
-class RequestLt23(SanicBaseRequest): ...
+class RequestLt23(SanicBaseRequest):
+    __slots__ = ()
 
 
 class RequestGt23(SanicBaseRequest):
-    @LazyProperty()
+    __slots__ = ()
+
     def cookie(self) -> dict:
         return {key: value[0] for key, value in self.request.cookies.items()}
 
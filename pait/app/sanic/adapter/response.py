@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, Optional, Type
+from typing import Any, Dict, Optional, Type
 
 from pydantic import BaseModel
 from sanic.response import BaseHTTPResponse, HTTPResponse, json
@@ -39,6 +39,13 @@ def gen_unifiled_response(
     return _gen_response(response_value, response_model_class or JsonResponseModel, *args, **kwargs)
 
 
+def gen_raw_response(
+    body: bytes, status_code: int = 200, headers: Optional[Dict[str, str]] = None, media_type: str = "application/json"
+) -> BaseHTTPResponse:
+    """Generate the response of the body that has been serialized, such as the cached OpenAPI document"""
+    return HTTPResponse(body, status=status_code, headers=headers, content_type=media_type)
+
+
 def set_info_to_response(resp: BaseHTTPResponse, response_model_class: Type[BaseResponseModel]) -> None:
     resp.content_type = response_model_class.media_type
     resp.status = response_model_class.status_code[0]
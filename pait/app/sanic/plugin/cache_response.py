@@ -1,3 +1,31 @@
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from typing import Any, List, Optional, Tuple
 
-__all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
+from sanic.compat import Header
+from sanic.response import HTTPResponse
+
+from pait.plugin.cache_response import BaseCacheSerializer, CacheRespExtraParam
+from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
+from pait.plugin.cache_response import CacheSerializer as _CacheSerializer
+
+__all__ = ["CacheResponsePlugin", "CacheRespExtraParam", "CacheSerializer"]
+
+
+class CacheSerializer(_CacheSerializer):
+    def dump_response(self, value: Any) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        if not isinstance(value, HTTPResponse) or value.body is None:
+            return None
+        headers: List[Tuple[str, str]] = list(value.headers.items())
+        if value.content_type and "content-type" not in value.headers:
+            headers.append(("content-type", value.content_type))
+        return value.status, headers, value.body
+
+    def load_response(self, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> HTTPResponse:
+        header: Header = Header(headers)
+        content_type: Optional[str] = header.pop("content-type", None)
+        return HTTPResponse(body, status=status_code, headers=header, content_type=content_type)
+
+
+class CacheResponsePlugin(_CacheResponsePlugin):
+    @classmethod
+    def default_serializer(cls) -> BaseCacheSerializer:
+        return CacheSerializer()
@@ -0,0 +1,10 @@
+from starlette.applications import Starlette
+
+from pait.param_handle.app_depend import async_close_app_depend
+
+__all__ = ["add_app_depend_shutdown_hook"]
+
+
+def add_app_depend_shutdown_hook(app: Starlette) -> None:
+    """Exit the context managers of the app scope depends when the app is shutdown"""
+    app.add_event_handler("shutdown", async_close_app_depend)
@@ -12,6 +12,8 @@ __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[_Request, RequestExtend]):
+    __slots__ = ()
+
     CbvType = (HTTPEndpoint,)
     app_name = "starlette"
 
@@ -1,13 +1,14 @@
-from typing import Any, AsyncGenerator, Coroutine, Dict, Generator, List, Mapping, Optional, Union
+from typing import Any, AsyncGenerator, Dict, Generator, List, Mapping, Optional, Union
 
 from starlette.datastructures import FormData, Headers, UploadFile
 from starlette.requests import Request as _Request
 
 from pait.app.base.adapter.request import BaseRequest, BaseRequestExtend
-from pait.util import LazyProperty
 
 
 class RequestExtend(BaseRequestExtend[_Request]):
+    __slots__ = ()
+
     @property
     def scheme(self) -> str:
         return self.request.url.scheme
@@ -24,6 +25,8 @@ class RequestExtend(BaseRequestExtend[_Request]):
 
 
 class Request(BaseRequest[_Request, RequestExtend]):
+    __slots__ = ("_form",)
+
     RequestType = _Request
     FormType = FormData
     FileType = UploadFile
@@ -36,8 +39,8 @@ class Request(BaseRequest[_Request, RequestExtend]):
     def request_extend(self) -> RequestExtend:
         return RequestExtend(self.request)
 
-    def body(self) -> Coroutine[Any, Any, dict]:
-        return self.request.json()
+    async def body(self) -> dict:
+        return await self.request.json()
 
     def cookie(self) -> dict:
         return self.request.cookies
@@ -49,19 +52,12 @@ class Request(BaseRequest[_Request, RequestExtend]):
         self._form = form
         return form
 
-    def file(self) -> Coroutine[Any, Any, FormData]:
-        async def _() -> FormData:
-            return await self.get_form()
-
-        return _()
+    async def file(self) -> FormData:
+        return await self.get_form()
 
-    def form(self) -> Coroutine[Any, Any, Dict[str, Any]]:
-        @LazyProperty(self)
-        async def _form() -> Dict[str, Any]:
-            form_data: FormData = await self.get_form()
-            return {key: form_data.getlist(key)[0] for key, _ in form_data.items()}
-
-        return _form()
+    async def form(self) -> Dict[str, Any]:
+        form_data: FormData = await self.get_form()
+        return {key: form_data.getlist(key)[0] for key, _ in form_data.items()}
 
     def header(self) -> Headers:
         return self.request.headers
@@ -75,17 +71,11 @@ class Request(BaseRequest[_Request, RequestExtend]):
     def stream(self, size: int = -1) -> Union[Generator[bytes, None, None], AsyncGenerator[bytes, None]]:
         return self.request.stream()
 
-    def multiform(self) -> Coroutine[Any, Any, Dict[str, List[Any]]]:
-        @LazyProperty(self)
-        async def _multiform() -> Dict[str, List[Any]]:
-            form_data: FormData = await self.get_form()
-            return {
-                key: [i for i in form_data.getlist(key) if not isinstance(i, UploadFile)]
-                for key, _ in form_data.items()
-            }
-
-        return _multiform()
+    async def multiform(self) -> Dict[str, List[Any]]:
+        form_data: FormData = await self.get_form()
+        return {
+            key: [i for i in form_data.getlist(key) if not isinstance(i, UploadFile)] for key, _ in form_data.items()
+        }
 
-    @LazyProperty()
     def multiquery(self) -> Dict[str, Any]:
         return {key: self.request.query_params.getlist(key) for key, _ in self.request.query_params.items()}
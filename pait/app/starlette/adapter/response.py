@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, Optional, Type
+from typing import Any, Dict, Optional, Type
 
 from pydantic import BaseModel
 from starlette.responses import JSONResponse, Response
@@ -38,6 +38,13 @@ def gen_unifiled_response(
     return _gen_response(response_value, response_model_class or JsonResponseModel, *args, **kwargs)
 
 
+def gen_raw_response(
+    body: bytes, status_code: int = 200, headers: Optional[Dict[str, str]] = None, media_type: str = "application/json"
+) -> Response:
+    """Generate the response of the body that has been serialized, such as the cached OpenAPI document"""
+    return Response(body, status_code=status_code, headers=headers or {}, media_type=media_type)
+
+
 def set_info_to_response(resp: Response, response_model_class: Type[BaseResponseModel]) -> None:
     resp.media_type = response_model_class.media_type
     resp.status_code = response_model_class.status_code[0]
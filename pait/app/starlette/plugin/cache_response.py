@@ -1,3 +1,32 @@
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from typing import Any, List, Optional, Tuple
 
-__all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
+from starlette.responses import Response
+
+from pait.plugin.cache_response import BaseCacheSerializer, CacheRespExtraParam
+from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
+from pait.plugin.cache_response import CacheSerializer as _CacheSerializer
+
+__all__ = ["CacheResponsePlugin", "CacheRespExtraParam", "CacheSerializer"]
+
+
+class CacheSerializer(_CacheSerializer):
+    def dump_response(self, value: Any) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        # The streaming response (and file response) does not have the body
+        if not isinstance(value, Response) or not hasattr(value, "body") or value.background is not None:
+            return None
+        return (
+            value.status_code,
+            [(key.decode("latin-1"), header_value.decode("latin-1")) for key, header_value in value.raw_headers],
+            value.body,
+        )
+
+    def load_response(self, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> Response:
+        response: Response = Response(body, status_code=status_code)
+        response.raw_headers = [(key.encode("latin-1"), value.encode("latin-1")) for key, value in headers]
+        return response
+
+
+class CacheResponsePlugin(_CacheResponsePlugin):
+    @classmethod
+    def default_serializer(cls) -> BaseCacheSerializer:
+        return CacheSerializer()
@@ -0,0 +1,38 @@
+from typing import AsyncGenerator, Set
+
+from tornado.ioloop import IOLoop
+from tornado.web import Application
+
+from pait.param_handle.app_depend import async_close_app_depend
+
+__all__ = ["add_app_depend_shutdown_hook"]
+
+# The event loop only holds a weak reference to the async generator, so it needs to be kept alive here
+_app_depend_lifespan_set: Set[AsyncGenerator[None, None]] = set()
+
+
+async def _app_depend_lifespan() -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await async_close_app_depend()
+
+
+async def _start_app_depend_lifespan() -> None:
+    # Start the async generator in the event loop of the app,
+    # the loop will finalize it (and exit the context managers) when the loop shuts down its async generators
+    app_depend_lifespan = _app_depend_lifespan()
+    _app_depend_lifespan_set.add(app_depend_lifespan)
+    await app_depend_lifespan.__anext__()
+
+
+def add_app_depend_shutdown_hook(app: Application) -> None:
+    """Exit the context managers of the app scope depends when the event loop of the app is shutdown
+    (Tornado does not have a shutdown event, e.g. the end of `asyncio.run(main())`).
+    It should be called in the event loop that runs the app.
+
+    Note: If the app is run by `IOLoop.current().start()`, the loop will not shut down its async generators,
+        please call `IOLoop.current().run_sync(pait.param_handle.app_depend.async_close_app_depend)`
+        after the IOLoop is stopped
+    """
+    IOLoop.current().add_callback(_start_app_depend_lifespan)
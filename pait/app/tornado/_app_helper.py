@@ -12,6 +12,8 @@ __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[HTTPServerRequest, RequestExtend]):
+    __slots__ = ()
+
     CbvType = (RequestHandler,)
     app_name = "tornado"
 
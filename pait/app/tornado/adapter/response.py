@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, Optional, Type
+from typing import Any, Dict, Optional, Type
 
 from pydantic import BaseModel
 from tornado.web import RequestHandler
@@ -15,6 +15,9 @@ def _gen_response(
     *args: Any,
     **kwargs: Any,
 ) -> Any:
+    if response_value is tornado_handle:
+        # The response has been written to the handle, see `gen_raw_response`
+        return None
     if issubclass(response_model_class, FileResponseModel):
         raise RuntimeError("FileResponseModel is not supported")
     set_info_to_response(tornado_handle, response_model_class)
@@ -46,6 +49,26 @@ def gen_unifiled_response(
     return _gen_response(tornado_handle, response_value, response_model_class or JsonResponseModel, *args, **kwargs)
 
 
+def gen_raw_response(
+    tornado_handle: RequestHandler,
+    body: bytes,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+    media_type: str = "application/json",
+) -> RequestHandler:
+    """Generate the response of the body that has been serialized, such as the cached OpenAPI document.
+
+    The response is written to the handle, and the handle is returned
+    """
+    tornado_handle.set_status(status_code)
+    tornado_handle.set_header("Content-Type", media_type)
+    for k, v in (headers or {}).items():
+        tornado_handle.set_header(k, v)
+    if body:
+        tornado_handle.write(body)
+    return tornado_handle
+
+
 def set_info_to_response(tornado_handle: RequestHandler, response_model_class: Type[BaseResponseModel]) -> None:
     tornado_handle.set_status(response_model_class.status_code[0])
     tornado_handle.set_header("Content-Type", response_model_class.media_type)
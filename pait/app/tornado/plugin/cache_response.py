@@ -1,34 +1,72 @@
-from typing import Any, Dict, Tuple
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
 
+from tornado.httputil import HTTPHeaders
 from tornado.web import RequestHandler
 
-from pait.plugin.cache_response import CacheRespExtraParam
+from pait.plugin.cache_response import BaseCacheSerializer, CacheRespExtraParam
 from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
+from pait.plugin.cache_response import CacheSerializer as _CacheSerializer
 
-__all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
+__all__ = ["CacheResponsePlugin", "CacheRespExtraParam", "CacheSerializer", "TornadoCacheResponse"]
+
+
+@dataclass
+class TornadoCacheResponse(object):
+    """The response written to the tornado handler, the plugin caches it instead of the handler"""
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+
+class CacheSerializer(_CacheSerializer):
+    """The response of tornado is written to the handler, so the plugin dumps the status, headers and body of
+    the handler as `TornadoCacheResponse`, and the loaded value is written back to the handler by the plugin"""
+
+    def dump_response(self, value: Any) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        if not isinstance(value, TornadoCacheResponse):
+            return None
+        return value.status_code, value.headers, value.body
+
+    def load_response(self, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> TornadoCacheResponse:
+        return TornadoCacheResponse(status_code=status_code, headers=headers, body=body)
 
 
 class CacheResponsePlugin(_CacheResponsePlugin):
+    @classmethod
+    def default_serializer(cls) -> BaseCacheSerializer:
+        return CacheSerializer()
+
     def _gen_key(self, *args: Any, **kwargs: Any) -> Tuple[str, str]:
         return super()._gen_key(*args[1:], **kwargs)
 
     def _dumps(self, response: Any, *args: Any, **kwargs: Any) -> Any:
-        tornado_handle: RequestHandler = args[0]
         if isinstance(response, Exception):
             return super()._dumps(response, *args, **kwargs)
-        cache_dict: Dict[str, Any] = {
-            "write_buffer": tornado_handle._write_buffer,
-            "status_code": tornado_handle._status_code,
-            "headers": tornado_handle._headers,
-        }
-        return super()._dumps(cache_dict, *args, **kwargs)
+        tornado_handle: RequestHandler = args[0]
+        cache_response: TornadoCacheResponse = TornadoCacheResponse(
+            status_code=tornado_handle._status_code,
+            headers=list(tornado_handle._headers.get_all()),
+            body=b"".join(tornado_handle._write_buffer),
+        )
+        return super()._dumps(cache_response, *args, **kwargs)
 
     def _loads(self, response: Any, *args: Any, **kwargs: Any) -> Any:
         response = super()._loads(response, *args, **kwargs)
         if isinstance(response, Exception):
             return response
         tornado_handle: RequestHandler = args[0]
-        tornado_handle._write_buffer = response["write_buffer"]
-        tornado_handle._status_code = response["status_code"]
-        tornado_handle._headers = response["headers"]
+        if isinstance(response, TornadoCacheResponse):
+            headers: HTTPHeaders = HTTPHeaders()
+            for key, value in response.headers:
+                headers.add(key, value)
+            tornado_handle._write_buffer = [response.body]
+            tornado_handle._headers = headers
+            tornado_handle._status_code = response.status_code
+        else:
+            # The value cached by the old version of the plugin
+            tornado_handle._write_buffer = response["write_buffer"]
+            tornado_handle._headers = response["headers"]
+            tornado_handle._status_code = response["status_code"]
         return tornado_handle
@@ -56,6 +56,10 @@ class PaitBaseParamTypedDict(TypedDict, total=False):
     :param plugin_list: pre plugin for routing functions
     :param post_plugin_list: post plugin list for routing functions
     :param sync_to_thread: if True, use AsyncParamHandler and run sync func in asyncio.thread pool
+    :param compiled_validation: If True, all plain request fields of the routing function (and depend function)
+        are validated by one pydantic model in a single pass instead of being validated one by one
+    :param concurrent_depend: If True, the independent depends of the routing function (and depend function)
+        are run concurrently, only support async routing function
     :param feature_code: Specify the prefix of the pait id corresponding to the generated routing function.
         Usually, the pait_id is equal to md5(func), but during dynamic generation,
         there may be multiple different routing functions generated by the same func.
@@ -85,6 +89,8 @@ class PaitBaseParamTypedDict(TypedDict, total=False):
     plugin_list: PluginListOptionalType
     post_plugin_list: PostPluginListOptionalType
     sync_to_thread: OptionalBoolType
+    compiled_validation: OptionalBoolType
+    concurrent_depend: OptionalBoolType
     # other
     feature_code: Optional[str]
     auto_build: bool
@@ -356,7 +362,7 @@ class Pait(object):
                 @wraps(func)
                 async def async_dispatch(*args: Any, **func_kwargs: Any) -> Callable:
                     context = self.init_context(pait_core_model, args, func_kwargs)
-                    return await pait_core_model.main_plugin(context)
+                    return await pait_core_model.main_plugin_entry(context)
 
                 return async_dispatch
             else:
@@ -364,7 +370,7 @@ class Pait(object):
                 @wraps(func)
                 def dispatch(*args: Any, **func_kwargs: Any) -> Callable:
                     context = self.init_context(pait_core_model, args, func_kwargs)
-                    return pait_core_model.main_plugin(context)
+                    return pait_core_model.main_plugin_entry(context)
 
                 return dispatch
 
@@ -34,6 +34,9 @@ class PaitCoreProxyModel(object):
 class PaitData(object):
     def __init__(self) -> None:
         self.pait_id_dict: Dict[str, Dict[str, "PaitCoreModel"]] = {}
+        # It is incremented whenever the data changes, so the data derived from it (such as the OpenAPI document)
+        # can know whether it needs to be regenerated
+        self.version: int = 0
 
     def register(self, app_name: str, pait_info_model: "PaitCoreModel") -> None:
         """Store the data of each routing handle
@@ -45,6 +48,14 @@ class PaitData(object):
         if app_name not in self.pait_id_dict:
             self.pait_id_dict[app_name] = {}
         self.pait_id_dict[app_name][pait_id] = pait_info_model
+        pait_info_model.add_change_notify(self._on_core_model_change)
+        self.version += 1
+
+    def _on_core_model_change(self, core_model: "PaitCoreModel", key: str, value: Any) -> None:
+        # `load_app` sets the same value every time it is called (e.g. when the OpenAPI document is generated)
+        if key in core_model.__dict__ and core_model.__dict__[key] == value:
+            return
+        self.version += 1
 
     # def get_pait_data(self, app_name: str, pait_id: str) -> "PaitCoreModel":
     #     """Get route handle data"""
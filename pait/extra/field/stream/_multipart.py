@@ -269,16 +269,22 @@ class PushMultipartParser:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close(check_complete=not exc_type)
 
-    def parse(self, chunk: Union[bytes, bytearray]) -> Iterator[Union["MultipartSegment", bytearray, None]]:
+    def parse(self, chunk: Union[bytes, bytearray]) -> Iterator[Union["MultipartSegment", memoryview, None]]:
         """Parse a chunk of data and yield as many result objects as possible
         with the data given.
 
         For each multipart segment, the parser will emit a single instance
         of :class:`MultipartSegment` with all headers already present,
-        followed by zero or more non-empty `bytearray` instances containing
+        followed by zero or more non-empty `memoryview` instances containing
         parts of the segment body, followed by a single `None` signaling the
         end of the segment.
 
+        The `memoryview` instances are read-only slices of the given chunk,
+        the data is only copied if it straddles chunks (e.g. a delimiter that
+        was split by the chunk boundary). They stay valid after the next chunk
+        is parsed, but should be converted to `bytes` if they are kept long,
+        since each of them keeps the whole chunk alive.
+
         The returned iterator iterator will stop if more data is required or
         if the end of the multipart stream was detected. The iterator must
         be fully consumed before parsing the next chunk. End of input can be
@@ -306,11 +312,30 @@ class PushMultipartParser:
                 raise self._fail("Unexpected data after end of multipart stream")
             return
 
-        buffer = self._buffer
+        buffer: Union[bytes, bytearray] = self._buffer
         delimiter = self._delimiter
-        buffer += chunk  # Copy chunk to existing buffer
-        offset = 0
         d_len = len(delimiter)
+
+        if buffer and self._state is _BODY and isinstance(chunk, bytes) and len(chunk) >= d_len + 4:
+            # The leftover of the previous chunk was kept because it may be
+            # the start of a delimiter. If it is not, it is body data and
+            # the chunk can be parsed without copying it.
+            index = (buffer + chunk[: d_len + 4]).find(b"\r\n" + delimiter)
+            if index == -1 or index >= len(buffer):
+                self._current._update_size(len(buffer))  # type: ignore[attr-defined]
+                self._parsed += len(buffer)
+                yield memoryview(bytes(buffer))
+                buffer = b""
+
+        if buffer or not isinstance(chunk, bytes):
+            # The data straddles chunks: Copy the leftover and the chunk to a
+            # new immutable buffer, the views of it are never invalidated
+            buffer = b"".join((buffer, chunk))
+        else:
+            # Zero-copy: parse the chunk as it is
+            buffer = chunk
+        view = memoryview(buffer)
+        offset = 0
         bufferlen = len(buffer)
 
         while True:
@@ -344,8 +369,10 @@ class PushMultipartParser:
                     if tail and tail[0:1] == b"\n":
                         raise self._fail("Invalid line break after delimiter")
 
-                # Delimiter not found, skip data until we find one
-                offset = bufferlen - (d_len + 4)
+                # Delimiter not found, skip data until we find one, but keep
+                # the data that may be the start of a delimiter split by the
+                # chunk boundary
+                offset = max(offset, bufferlen - (d_len + 4))
                 break  # wait for more data
 
             # Parse header section
@@ -377,7 +404,7 @@ class PushMultipartParser:
                 if tail in (b"\r\n", b"--"):  # Delimiter or terminator found
                     if index > offset:
                         self._current._update_size(index - offset)
-                        yield buffer[offset:index]
+                        yield view[offset:index]
                     offset = index + d_len + 4
                     self._current._mark_complete()
                     yield None
@@ -393,11 +420,11 @@ class PushMultipartParser:
 
                 # No delimiter or terminator found
                 min_keep = d_len + 3
-                chunk = buffer[offset:-min_keep]
-                if chunk:
-                    self._current._update_size(len(chunk))
-                    offset += len(chunk)
-                    yield chunk
+                data = view[offset:-min_keep]
+                if data:
+                    self._current._update_size(len(data))
+                    offset += len(data)
+                    yield data
                 break  # wait for more data
 
             else:  # pragma: no cover
@@ -405,7 +432,8 @@ class PushMultipartParser:
 
         # We ran out of data, or reached the end
         self._parsed += offset
-        buffer[:] = buffer[offset:]
+        # Only the unparsed tail (at most a delimiter or a header) is kept
+        self._buffer = bytearray(buffer[offset:])
 
     def _fail(self, msg):
         err = MultipartError(msg)
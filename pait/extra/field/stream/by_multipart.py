@@ -1,9 +1,24 @@
 import asyncio
 import logging
-from asyncio import Future as AsyncioFuture
-from concurrent.futures import Future as cFuture
+from functools import partial
 from queue import Queue
-from typing import Any, AsyncGenerator, Callable, Generator, Mapping, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 try:
     from multipart import MultipartSegment, PushMultipartParser, parse_options_header
@@ -12,10 +27,16 @@ except ImportError:
 
 from pait.g import get_ctx
 
-from .util import BaseStream
+from .util import BaseStream, BodySizeLimiter, SaveResult, SaveTargetType, async_save_to, save_to
+
+if TYPE_CHECKING:
+    from pait.model.context import ContextModel
 
 logger = logging.getLogger(__name__)
 
+# The end of the request body
+_EOF: Any = object()
+
 
 def get_boundary(headers: Mapping) -> str:
     content_type = headers.get("content-type")
@@ -24,117 +45,504 @@ def get_boundary(headers: Mapping) -> str:
     return boundary_dict.get("boundary", "")
 
 
-class Stream(BaseStream):
+class BasePart(object):
+    """A part of the multipart body.
+
+    The data of the part is not buffered, it can only be read once, and must be read before the next part is read,
+    otherwise it will be skipped.
+    The data is yielded as `memoryview` slices of the body chunks without copying,
+    use `bytes(chunk)` if the data needs to be kept after it is handled.
+    """
+
+    def __init__(self, segment: MultipartSegment) -> None:
+        self.segment: MultipartSegment = segment
+        # True if the data of the part has been read (or skipped)
+        self.is_complete: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    @property
+    def filename(self) -> Optional[str]:
+        return self.segment.filename
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self.segment.content_type
+
+    @property
+    def headers(self) -> List[Tuple[str, str]]:
+        return self.segment.headerlist
+
+    def _decode(self, data: bytes) -> str:
+        return data.decode(self.segment.charset or "utf-8")
+
+
+class Part(BasePart):
+    def __init__(self, segment: MultipartSegment, reader: "MultipartReader") -> None:
+        self._reader: "MultipartReader" = reader
+        super().__init__(segment)
+
+    def stream(self) -> Generator[Union[bytes, memoryview], None, None]:
+        return self._reader._iter_data(self)
+
+    def read(self) -> bytes:
+        return b"".join(self.stream())
+
+    def text(self) -> str:
+        return self._decode(self.read())
+
+    def save_to(
+        self, target: SaveTargetType, checksum: Sequence[str] = (), buffer_size: int = 1024 * 1024
+    ) -> SaveResult:
+        """Write the data to the file (path or file object), and compute the checksums of the data in the same pass"""
+        return save_to(self.stream(), target, checksum=checksum, buffer_size=buffer_size)
+
+
+class AsyncPart(BasePart):
+    def __init__(self, segment: MultipartSegment, reader: "AsyncMultipartReader") -> None:
+        self._reader: "AsyncMultipartReader" = reader
+        super().__init__(segment)
+
+    def stream(self) -> AsyncGenerator[Union[bytes, memoryview], None]:
+        return self._reader._iter_data(self)
+
+    async def read(self) -> bytes:
+        return b"".join([chunk async for chunk in self.stream()])
+
+    async def text(self) -> str:
+        return self._decode(await self.read())
+
+    async def save_to(
+        self, target: SaveTargetType, checksum: Sequence[str] = (), buffer_size: int = 1024 * 1024
+    ) -> SaveResult:
+        """Write the data to the file (path or file object), and compute the checksums of the data in the same pass"""
+        return await async_save_to(self.stream(), target, checksum=checksum, buffer_size=buffer_size)
+
+
+class BaseMultipartReader(object):
+    """Read the parts of the multipart body in order.
+
+    The file parts are returned to the caller and their data is streamed,
+    the text fields that are not requested are read and collected into `form`.
+
+    The body is only read when the caller needs more data, so at most one chunk of the body is buffered,
+    no matter how slow the caller consumes the data.
+    """
 
     def __init__(
         self,
         headers: Mapping,
-        stream: Callable[[], Generator[bytes, None, None]],
         parser: Type[PushMultipartParser] = PushMultipartParser,
-        queue: Type[Queue] = Queue,
-    ):
+        queue: Type = Queue,
+        chunk_size: Optional[int] = None,
+        max_body_size: Optional[int] = None,
+    ) -> None:
+        """
+        :param headers: The headers of the request
+        :param parser: The multipart parser class
+        :param queue: The queue class, it is used to store the parse results of a chunk of the body
+        :param chunk_size: If set, the small data of the part are merged into a chunk of at least this size
+        :param max_body_size: If set, a 413 exception is raised when the size of the body exceeds it
+        """
+        self._limiter: BodySizeLimiter = BodySizeLimiter(headers, max_body_size)
+        self._parser: PushMultipartParser = parser(get_boundary(headers))
+        self._chunk_size: Optional[int] = chunk_size
+        # The parse results that have not been handled, a chunk of body may contain the data of several parts
         self._queue = queue()
-        self._info: cFuture[Optional[MultipartSegment]] = cFuture()
-        self._parser = parser(get_boundary(headers))
-
-        self._stream_gen = self._step(stream)
+        self._eof: bool = False
+        self._current: Optional[BasePart] = None
+        # The name of the file parts that have been passed, their data can no longer be read
+        self._passed_name_set: Set[str] = set()
+        self.form: Dict[str, str] = {}
 
         # Reclaim the resource after the request is processed
         get_ctx().contextmanager_list.append(self)  # type: ignore
-        super().__init__(headers, stream)
+
+    def _close(self) -> None:
+        if not self._parser.closed:
+            # The route does not need to read the rest of the body
+            self._parser.close(check_complete=False)
+
+    def _parse(self, chunk: bytes) -> None:
+        if not chunk:
+            # An empty chunk closes the parser and checks whether the body is complete
+            self._eof = True
+        try:
+            self._limiter.feed(chunk)
+        except Exception:
+            self._close()
+            raise
+        for result in self._parser.parse(chunk):
+            self._queue.put_nowait(result)
+
+    def _check_part(self, part: BasePart) -> None:
+        if part is not self._current or part.is_complete:
+            raise RuntimeError(f"The data of the part `{part.name}` has been read or skipped")
+
+    def _on_part_end(self, part: BasePart) -> None:
+        part.is_complete = True
+        if part.filename is not None:
+            self._passed_name_set.add(part.name)
+
+    def _check_passed(self, name: str) -> None:
+        if name in self._passed_name_set:
+            raise RuntimeError(
+                f"The part `{name}` has been skipped, please read the parts in the order of the request body"
+            )
+
+
+class MultipartReader(BaseMultipartReader):
+    def __init__(
+        self,
+        headers: Mapping,
+        stream: Callable[[], Union[AsyncGenerator[bytes, None], Generator[bytes, None, None]]],
+        parser: Type[PushMultipartParser] = PushMultipartParser,
+        queue: Type[Queue] = Queue,
+        chunk_size: Optional[int] = None,
+        max_body_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(headers, parser=parser, queue=queue, chunk_size=chunk_size, max_body_size=max_body_size)
+        # The `stream` of the sync web framework returns a generator
+        self._stream_gen: Generator[bytes, None, None] = cast(Generator[bytes, None, None], stream())
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self._parser.__exit__(exc_type, exc_val, exc_tb)
+        self._close()
+
+    def _next_result(self) -> Any:
+        while self._queue.empty():
+            if self._eof:
+                return _EOF
+            self._parse(next(self._stream_gen, b""))
+        return self._queue.get_nowait()
+
+    def _iter_data(self, part: Part) -> Generator[Union[bytes, memoryview], None, None]:
+        self._check_part(part)
+        buffer: bytearray = bytearray()
+        while not part.is_complete:
+            result = self._next_result()
+            if result is None or result is _EOF:
+                self._on_part_end(part)
+            elif not self._chunk_size:
+                yield result
+            else:
+                buffer += result
+                if len(buffer) >= self._chunk_size:
+                    yield buffer
+                    buffer = bytearray()
+        if buffer:
+            yield buffer
+
+    def _next_part(self) -> Optional[Part]:
+        if self._current is not None and not self._current.is_complete:
+            # Skip the unread data of the current part
+            for _ in self._iter_data(self._current):  # type: ignore[arg-type]
+                pass
+        while True:
+            result = self._next_result()
+            if result is _EOF:
+                self._current = None
+                return None
+            elif isinstance(result, MultipartSegment):
+                self._current = Part(result, self)
+                return self._current
 
-    def _step(self, stream: Callable[[], Generator[bytes, None, None]]) -> Generator[Optional[bytearray], None, None]:
-        for chunk in stream():
-            if not chunk:
+    def parts(self) -> Generator[Part, None, None]:
+        """Iterate over the file parts of the body, and collect the text fields into `form`"""
+        while True:
+            part = self._next_part()
+            if part is None:
                 return
-            for result in self._parser.parse(chunk):
-                if isinstance(result, MultipartSegment):
-                    self._info.set_result(result)
-                else:
-                    if not self._info.done():
-                        self._info.set_result(None)
-                    if result is not None:
-                        self._queue.put(result)
-                yield None
+            elif part.filename is None:
+                self.form[part.name] = part.text()
+            else:
+                yield part
+
+    def get_part(self, name: str) -> Optional[Part]:
+        """Get the part by name, the parts before it are skipped (the text fields are collected into `form`)"""
+        if self._current is not None and self._current.name == name:
+            return self._current  # type: ignore[return-value]
+        self._check_passed(name)
+        while True:
+            part = self._next_part()
+            if part is None or part.name == name:
+                return part
+            elif part.filename is None:
+                self.form[part.name] = part.text()
+
+
+class AsyncMultipartReader(BaseMultipartReader):
+    def __init__(
+        self,
+        headers: Mapping,
+        stream: Callable[[], Union[AsyncGenerator[bytes, None], Generator[bytes, None, None]]],
+        parser: Type[PushMultipartParser] = PushMultipartParser,
+        queue: Type[asyncio.Queue] = asyncio.Queue,
+        chunk_size: Optional[int] = None,
+        max_body_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(headers, parser=parser, queue=queue, chunk_size=chunk_size, max_body_size=max_body_size)
+        # The `stream` of the async web framework returns an async generator
+        self._stream_gen: AsyncGenerator[bytes, None] = cast(AsyncGenerator[bytes, None], stream())
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self._close()
+
+    async def _next_result(self) -> Any:
+        while self._queue.empty():
+            if self._eof:
+                return _EOF
+            try:
+                chunk = await self._stream_gen.__anext__()
+            except StopAsyncIteration:
+                chunk = b""
+            self._parse(chunk)
+        return self._queue.get_nowait()
+
+    async def _iter_data(self, part: AsyncPart) -> AsyncGenerator[Union[bytes, memoryview], None]:
+        self._check_part(part)
+        buffer: bytearray = bytearray()
+        while not part.is_complete:
+            result = await self._next_result()
+            if result is None or result is _EOF:
+                self._on_part_end(part)
+            elif not self._chunk_size:
+                yield result
+            else:
+                buffer += result
+                if len(buffer) >= self._chunk_size:
+                    yield buffer
+                    buffer = bytearray()
+        if buffer:
+            yield buffer
+
+    async def _next_part(self) -> Optional[AsyncPart]:
+        if self._current is not None and not self._current.is_complete:
+            # Skip the unread data of the current part
+            async for _ in self._iter_data(self._current):  # type: ignore[arg-type]
+                pass
+        while True:
+            result = await self._next_result()
+            if result is _EOF:
+                self._current = None
+                return None
+            elif isinstance(result, MultipartSegment):
+                self._current = AsyncPart(result, self)
+                return self._current
+
+    async def parts(self) -> AsyncGenerator[AsyncPart, None]:
+        """Iterate over the file parts of the body, and collect the text fields into `form`"""
+        while True:
+            part = await self._next_part()
+            if part is None:
+                return
+            elif part.filename is None:
+                self.form[part.name] = await part.text()
+            else:
+                yield part
+
+    async def get_part(self, name: str) -> Optional[AsyncPart]:
+        """Get the part by name, the parts before it are skipped (the text fields are collected into `form`)"""
+        if self._current is not None and self._current.name == name:
+            return self._current  # type: ignore[return-value]
+        self._check_passed(name)
+        while True:
+            part = await self._next_part()
+            if part is None or part.name == name:
+                return part
+            elif part.filename is None:
+                self.form[part.name] = await part.text()
+
+
+class Stream(BaseStream):
+    """The stream of the file part of the multipart body.
+
+    The stream is bound to the part whose name is the request key (the name of the parameter by default),
+    if the request key is not set, it is bound to the first file part.
+    The `StreamFile` parameters of the same route share the same reader, so they can bind different parts of the body,
+    but they need to be read in the order of the parts in the body.
+    """
+
+    reader_class: Type[MultipartReader] = MultipartReader
+    # If set, the small data of the part are merged into a chunk of at least this size
+    chunk_size: Optional[int] = None
+    # If set, a 413 exception is raised when the size of the body exceeds it
+    max_body_size: Optional[int] = None
+
+    def __init__(
+        self,
+        headers: Mapping,
+        stream: Callable[[], Union[AsyncGenerator[bytes, None], Generator[bytes, None, None]]],
+        parser: Type[PushMultipartParser] = PushMultipartParser,
+        queue: Type[Queue] = Queue,
+        reader: Optional[MultipartReader] = None,
+    ):
+        self.reader: MultipartReader = reader or self.reader_class(
+            headers,
+            stream,
+            parser=parser,
+            queue=queue,
+            chunk_size=self.chunk_size,
+            max_body_size=self.max_body_size,
+        )
+        self._request_key: Optional[str] = None
+        self._part: Optional[Part] = None
+        self._part_loaded: bool = False
+        super().__init__(headers, stream)
+
+    @classmethod
+    def from_context(cls, context: "ContextModel", request_key: str) -> "Stream":
+        state_key: str = f"pait_multipart_reader:{cls.reader_class.__name__}"
+        reader: Optional[MultipartReader] = getattr(context, "state", {}).get(state_key, None)
+        request = context.app_helper.request
+        request_stream = partial(request.stream, cls.read_size)
+        if reader is None:
+            reader = cls.reader_class(
+                request.header(), request_stream, chunk_size=cls.chunk_size, max_body_size=cls.max_body_size
+            )
+            context.set_to_state(state_key, reader)
+        stream = cls(request.header(), request_stream, reader=reader)
+        stream.set_request_key(request_key)
+        return stream
+
+    def set_request_key(self, request_key: str) -> None:
+        if self._part_loaded:
+            raise RuntimeError("The file has been parsed and the request key cannot be set")
+        self._request_key = request_key
+
+    @property
+    def form(self) -> Dict[str, str]:
+        """The text fields that have been read"""
+        return self.reader.form
+
+    def parts(self) -> Generator[Part, None, None]:
+        """Iterate over the file parts of the body (not only the bound part)"""
+        return self.reader.parts()
+
+    def part(self) -> Optional[Part]:
+        if not self._part_loaded:
+            if self._request_key is None:
+                self._part = next(self.reader.parts(), None)
+            else:
+                self._part = self.reader.get_part(self._request_key)
+            self._part_loaded = True
+        return self._part
 
     def filename(self) -> Optional[str]:
-        info = self.info()
-        if info:
-            return info.filename
+        part = self.part()
+        if part:
+            return part.filename
         return None
 
-    def info(self) -> MultipartSegment:
-        if self._info.done():
-            return self._info.result()
+    def info(self) -> Optional[MultipartSegment]:
+        part = self.part()
+        if part:
+            return part.segment
+        return None
 
-        for _ in self._stream_gen:
-            if self._info.done():
-                return self._info.result()
+    def stream(self) -> Generator[Union[bytes, memoryview], None, None]:
+        part = self.part()
+        if part:
+            yield from part.stream()
 
-    def stream(self) -> Generator[bytes, None, None]:
-        for _ in self._stream_gen:
-            if self._queue.empty():
-                continue
-            yield self._queue.get()
+    def save_to(
+        self, target: SaveTargetType, checksum: Sequence[str] = (), buffer_size: int = 1024 * 1024
+    ) -> SaveResult:
+        """Write the data of the file to the target, see `Part.save_to` for details"""
+        return save_to(self.stream(), target, checksum=checksum, buffer_size=buffer_size)
 
 
 class AsyncStream(BaseStream):
+    """The stream of the file part of the multipart body, see `Stream` for details"""
+
+    reader_class: Type[AsyncMultipartReader] = AsyncMultipartReader
+    # If set, the small data of the part are merged into a chunk of at least this size
+    chunk_size: Optional[int] = None
+    # If set, a 413 exception is raised when the size of the body exceeds it
+    max_body_size: Optional[int] = None
 
     def __init__(
         self,
         headers: Mapping,
-        stream: Callable[[], AsyncGenerator[bytes, None]],
+        stream: Callable[[], Union[AsyncGenerator[bytes, None], Generator[bytes, None, None]]],
         parser: Type[PushMultipartParser] = PushMultipartParser,
         queue: Type[asyncio.Queue] = asyncio.Queue,
+        reader: Optional[AsyncMultipartReader] = None,
     ):
-        self._queue = queue()
-        self._info: AsyncioFuture[Optional[MultipartSegment]] = AsyncioFuture()
-        self._parser = parser(get_boundary(headers))
+        self.reader: AsyncMultipartReader = reader or self.reader_class(
+            headers,
+            stream,
+            parser=parser,
+            queue=queue,
+            chunk_size=self.chunk_size,
+            max_body_size=self.max_body_size,
+        )
+        self._request_key: Optional[str] = None
+        self._part: Optional[AsyncPart] = None
+        self._part_loaded: bool = False
+        super().__init__(headers, stream)
 
-        self._stream_gen = self._step(stream)
+    @classmethod
+    def from_context(cls, context: "ContextModel", request_key: str) -> "AsyncStream":
+        state_key: str = f"pait_multipart_reader:{cls.reader_class.__name__}"
+        reader: Optional[AsyncMultipartReader] = getattr(context, "state", {}).get(state_key, None)
+        request = context.app_helper.request
+        request_stream = partial(request.stream, cls.read_size)
+        if reader is None:
+            reader = cls.reader_class(
+                request.header(), request_stream, chunk_size=cls.chunk_size, max_body_size=cls.max_body_size
+            )
+            context.set_to_state(state_key, reader)
+        stream = cls(request.header(), request_stream, reader=reader)
+        stream.set_request_key(request_key)
+        return stream
 
-        # Reclaim the resource after the request is processed
-        get_ctx().contextmanager_list.append(self)  # type: ignore
-        super().__init__(headers, stream)
+    def set_request_key(self, request_key: str) -> None:
+        if self._part_loaded:
+            raise RuntimeError("The file has been parsed and the request key cannot be set")
+        self._request_key = request_key
 
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        self._parser.__exit__(exc_type, exc_val, exc_tb)
+    @property
+    def form(self) -> Dict[str, str]:
+        """The text fields that have been read"""
+        return self.reader.form
 
-    async def _step(
-        self, stream: Callable[[], AsyncGenerator[bytes, None]]
-    ) -> AsyncGenerator[Optional[bytearray], None]:
-        async for chunk in stream():
-            if not chunk:
-                return
-            for result in self._parser.parse(chunk):
-                if isinstance(result, MultipartSegment):
-                    self._info.set_result(result)
-                else:
-                    if not self._info.done():
-                        self._info.set_result(None)
-                    if result is not None:
-                        await self._queue.put(result)
-                yield None
+    def parts(self) -> AsyncGenerator[AsyncPart, None]:
+        """Iterate over the file parts of the body (not only the bound part)"""
+        return self.reader.parts()
+
+    async def part(self) -> Optional[AsyncPart]:
+        if not self._part_loaded:
+            if self._request_key is None:
+                async for part in self.reader.parts():
+                    self._part = part
+                    break
+            else:
+                self._part = await self.reader.get_part(self._request_key)
+            self._part_loaded = True
+        return self._part
 
     async def filename(self) -> Optional[str]:
-        info = await self.info()
-        if info:
-            return info.filename
+        part = await self.part()
+        if part:
+            return part.filename
         return None
 
-    async def info(self) -> MultipartSegment:
-        if self._info.done():
-            return self._info.result()
+    async def info(self) -> Optional[MultipartSegment]:
+        part = await self.part()
+        if part:
+            return part.segment
+        return None
 
-        async for _ in self._stream_gen:
-            if self._info.done():
-                return self._info.result()
+    async def stream(self) -> AsyncGenerator[Union[bytes, memoryview], None]:
+        part = await self.part()
+        if part:
+            async for chunk in part.stream():
+                yield chunk
 
-    async def stream(self) -> AsyncGenerator[bytes, None]:
-        async for _ in self._stream_gen:
-            if self._queue.empty():
-                continue
-            yield await self._queue.get()
+    async def save_to(
+        self, target: SaveTargetType, checksum: Sequence[str] = (), buffer_size: int = 1024 * 1024
+    ) -> SaveResult:
+        """Write the data of the file to the target, see `AsyncPart.save_to` for details"""
+        return await async_save_to(self.stream(), target, checksum=checksum, buffer_size=buffer_size)
@@ -2,12 +2,13 @@ import asyncio
 import logging
 from concurrent.futures import Future as cFuture
 from queue import Queue
-from typing import Any, AsyncGenerator, Callable, Generator, Generic, Mapping, Optional, Type, TypeVar, Union
+from typing import Any, AsyncGenerator, Callable, Generator, Generic, Mapping, Optional, Sequence, Type, TypeVar, Union
 
 from streaming_form_data import StreamingFormDataParser
 from streaming_form_data.targets import BaseTarget
 
 from .util import BaseStream as _BaseStream
+from .util import BodySizeLimiter, SaveResult, SaveTargetType, async_save_to, save_to
 
 FutureT = Union[asyncio.Future, cFuture]
 QueueT = Union["asyncio.Queue[Optional[bytes]]", "Queue[Optional[bytes]]"]
@@ -38,6 +39,9 @@ class CustomTarget(BaseTarget):
 
 
 class BaseStream(_BaseStream, Generic[_T, _QueueT]):
+    # If set, a 413 exception is raised when the size of the body exceeds it
+    max_body_size: Optional[int] = None
+
     def __init__(
         self,
         headers: Mapping,
@@ -47,6 +51,7 @@ class BaseStream(_BaseStream, Generic[_T, _QueueT]):
         custom_target: Type[CustomTarget] = CustomTarget,
         streaming_form_data_parse: Type[StreamingFormDataParser] = StreamingFormDataParser,
     ):
+        self._limiter = BodySizeLimiter(headers, self.max_body_size)
         self._start_future = future
         self._buffer_queue = queue
 
@@ -62,6 +67,10 @@ class BaseStream(_BaseStream, Generic[_T, _QueueT]):
             raise RuntimeError("The file has been parsed and the request key cannot be set")
         self._parser.register(request_key, self._target)
 
+    def _parse(self, chunk: bytes) -> None:
+        self._limiter.feed(chunk)
+        self._parser.data_received(chunk)
+
 
 class Stream(BaseStream[Generator[bytes, None, None], "Queue[Optional[bytes]]"]):
 
@@ -85,21 +94,24 @@ class Stream(BaseStream[Generator[bytes, None, None], "Queue[Optional[bytes]]"])
     def _step_before_start(self) -> None:
         """Parse data until file information (file name, file type) is obtained"""
         for chunk in self._stream_gen:
-            self._parser.data_received(chunk)
+            self._parse(chunk)
             if self._start_future.done():
                 break
 
     def _step_after_start(self) -> Generator[bytes, None, None]:
         """Parse the data and return it if it is part of a file"""
-        for chunk in self._stream_gen:
-            self._parser.data_received(chunk)
-
-            if not self._buffer_queue.empty():
-                real_chunk = self._buffer_queue.get()
-                if real_chunk is not None:
-                    yield real_chunk
-                else:
+        while True:
+            # A chunk of body may contain several pieces of the file, return them all before reading the next chunk
+            while not self._buffer_queue.empty():
+                real_chunk = self._buffer_queue.get_nowait()
+                if real_chunk is None:
                     return
+                yield real_chunk
+            try:
+                chunk = next(self._stream_gen)
+            except StopIteration:
+                return
+            self._parse(chunk)
 
     def filename(self) -> Optional[str]:
         if not self._start_future.done():
@@ -110,6 +122,13 @@ class Stream(BaseStream[Generator[bytes, None, None], "Queue[Optional[bytes]]"])
         for chunk in self._step_after_start():
             yield chunk
 
+    def save_to(
+        self, target: SaveTargetType, checksum: Sequence[str] = (), buffer_size: int = 1024 * 1024
+    ) -> SaveResult:
+        """Write the data of the file to the file (path or file object),
+        and compute the checksums of the data in the same pass"""
+        return save_to(self.stream(), target, checksum=checksum, buffer_size=buffer_size)
+
 
 class AsyncStream(BaseStream[AsyncGenerator[bytes, None], "asyncio.Queue[Optional[bytes]]"]):
 
@@ -133,21 +152,24 @@ class AsyncStream(BaseStream[AsyncGenerator[bytes, None], "asyncio.Queue[Optiona
     async def _step_before_start(self) -> None:
         """Parse data until file information (file name, file type) is obtained"""
         async for chunk in self._stream_gen:
-            self._parser.data_received(chunk)
+            self._parse(chunk)
             if self._start_future.done():
                 break
 
     async def _step_after_start(self) -> AsyncGenerator[bytes, None]:
         """Parse the data and return it if it is part of a file"""
-        async for chunk in self._stream_gen:
-            self._parser.data_received(chunk)
-
-            if not self._buffer_queue.empty():
-                real_chunk = await self._buffer_queue.get()
-                if real_chunk is not None:
-                    yield real_chunk
-                else:
+        while True:
+            # A chunk of body may contain several pieces of the file, return them all before reading the next chunk
+            while not self._buffer_queue.empty():
+                real_chunk = self._buffer_queue.get_nowait()
+                if real_chunk is None:
                     return
+                yield real_chunk
+            try:
+                chunk = await self._stream_gen.__anext__()
+            except StopAsyncIteration:
+                return
+            self._parse(chunk)
 
     async def filename(self) -> Optional[str]:
         if not self._start_future.done():
@@ -157,3 +179,10 @@ class AsyncStream(BaseStream[AsyncGenerator[bytes, None], "asyncio.Queue[Optiona
     async def stream(self) -> AsyncGenerator[bytes, None]:
         async for chunk in self._step_after_start():
             yield chunk
+
+    async def save_to(
+        self, target: SaveTargetType, checksum: Sequence[str] = (), buffer_size: int = 1024 * 1024
+    ) -> SaveResult:
+        """Write the data of the file to the file (path or file object),
+        and compute the checksums of the data in the same pass"""
+        return await async_save_to(self.stream(), target, checksum=checksum, buffer_size=buffer_size)
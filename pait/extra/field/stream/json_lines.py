@@ -0,0 +1,150 @@
+import json
+from collections import deque
+from typing import Any, AsyncGenerator, AsyncIterable, Deque, Generator, Generic, Iterable, List, Optional, TypeVar
+
+from pait import _pydanitc_adapter
+from pait.exceptions import FieldValueTypeException
+
+_T = TypeVar("_T")
+
+# The line is skipped (blank line or invalid item)
+_SKIP: Any = object()
+
+
+class BaseJsonLines(Generic[_T]):
+    """Split the request body into lines and validate the JSON item of each line.
+
+    Only the current chunk of the body and the unfinished line are kept in memory,
+    so the memory usage does not grow with the size of the body.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pait_model_field: "_pydanitc_adapter.PaitModelField",
+        raise_error: bool = True,
+        max_line_size: Optional[int] = None,
+    ) -> None:
+        """
+        :param name: The name of the parameter
+        :param pait_model_field: Validate the JSON item of each line
+        :param raise_error: If True, raise `FieldValueTypeException` when the line is invalid,
+            otherwise skip the line and collect the exception into `error_list`
+        :param max_line_size: If set, raise `FieldValueTypeException` when the size of a line exceeds it
+            (whatever the value of `raise_error`), so an endless line can not use up the memory
+        """
+        self.name: str = name
+        self.raise_error: bool = raise_error
+        self.max_line_size: Optional[int] = max_line_size
+        # The exceptions of the invalid lines, only used when `raise_error` is False
+        self.error_list: List[FieldValueTypeException] = []
+        self._pait_model_field: "_pydanitc_adapter.PaitModelField" = pait_model_field
+        # The unfinished line at the end of the previous chunks
+        self._tail: bytearray = bytearray()
+        self._line_no: int = 0
+        self._line_deque: Deque[bytes] = deque()
+
+    def _feed(self, chunk: Optional[bytes]) -> None:
+        """Split the chunk into lines, an empty chunk means the end of the body"""
+        if not chunk:
+            if self._tail:
+                self._line_deque.append(bytes(self._tail))
+                self._tail = bytearray()
+            return
+        start: int = 0
+        index: int = chunk.find(b"\n")
+        if index != -1 and self._tail:
+            # The first line of the chunk finishes the unfinished line
+            self._tail += chunk[:index]
+            self._line_deque.append(bytes(self._tail))
+            self._tail = bytearray()
+            start = index + 1
+        end: int = chunk.rfind(b"\n")
+        if end >= start:
+            self._line_deque.extend(chunk[start:end].split(b"\n"))
+            start = end + 1
+        # Extend the unfinished line in place, so the long line is not copied again for each chunk
+        self._tail += chunk[start:]
+
+    def _check_line_size(self, line_size: int, line_no: int) -> None:
+        if self.max_line_size is not None and line_size > self.max_line_size:
+            raise FieldValueTypeException(
+                self.name, f"line {line_no}: The line is larger than {self.max_line_size} bytes"
+            )
+
+    def _check_tail(self) -> None:
+        """Check the unfinished line, it is called after the finished lines are parsed"""
+        self._check_line_size(len(self._tail), self._line_no + 1)
+
+    def _parse_line(self, line: bytes) -> Any:
+        self._line_no += 1
+        self._check_line_size(len(line), self._line_no)
+        if not line.strip():
+            return _SKIP
+        try:
+            return self._pait_model_field.validate(json.loads(line))
+        except Exception as e:
+            exc = FieldValueTypeException(self.name, f"line {self._line_no}: {e}")
+            if self.raise_error:
+                raise exc from e
+            self.error_list.append(exc)
+            return _SKIP
+
+
+class JsonLinesIterator(BaseJsonLines[_T]):
+    def __init__(self, stream: Iterable[bytes], *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stream: Iterable[bytes] = stream
+        self._gen: Generator[_T, None, None] = self._iter_item()
+
+    def _iter_item(self) -> Generator[_T, None, None]:
+        for chunk in self._stream:
+            if not chunk:
+                # The stream of some frameworks keep returning empty chunks at the end of the body
+                break
+            self._feed(chunk)
+            while self._line_deque:
+                item = self._parse_line(self._line_deque.popleft())
+                if item is not _SKIP:
+                    yield item
+            self._check_tail()
+        self._feed(None)
+        while self._line_deque:
+            item = self._parse_line(self._line_deque.popleft())
+            if item is not _SKIP:
+                yield item
+
+    def __iter__(self) -> "JsonLinesIterator[_T]":
+        return self
+
+    def __next__(self) -> _T:
+        return next(self._gen)
+
+
+class AsyncJsonLinesIterator(BaseJsonLines[_T]):
+    def __init__(self, stream: AsyncIterable[bytes], *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stream: AsyncIterable[bytes] = stream
+        self._gen: AsyncGenerator[_T, None] = self._iter_item()
+
+    async def _iter_item(self) -> AsyncGenerator[_T, None]:
+        async for chunk in self._stream:
+            if not chunk:
+                break
+            self._feed(chunk)
+            while self._line_deque:
+                item = self._parse_line(self._line_deque.popleft())
+                if item is not _SKIP:
+                    yield item
+            self._check_tail()
+        self._feed(None)
+        while self._line_deque:
+            item = self._parse_line(self._line_deque.popleft())
+            if item is not _SKIP:
+                yield item
+
+    def __aiter__(self) -> "AsyncJsonLinesIterator[_T]":
+        return self
+
+    async def __anext__(self) -> _T:
+        return await self._gen.__anext__()
@@ -1,9 +1,15 @@
 from inspect import Parameter
-from typing import TYPE_CHECKING, Type, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Optional, Type, TypeVar, Union
 
+from pydantic import Field
+from typing_extensions import get_args
+
+from pait import _pydanitc_adapter
 from pait.field import resource_parse
-from pait.field.http import File
+from pait.field.http import File, Json
+from pait.util import partial_wrapper
 
+from .json_lines import AsyncJsonLinesIterator, JsonLinesIterator
 from .util import BaseStream
 
 _StreamT = TypeVar("_StreamT", bound=BaseStream)
@@ -20,11 +26,8 @@ def request_field_pr_func(
     param_plugin: "BaseParamHandler",
 ) -> BaseStream:
     stream_file: "StreamFile" = pr.parameter.default
-    stream_class = pr.parameter.annotation
-    request = context.app_helper.request
-    stream = stream_class(request.header(), request.stream)
-    stream.set_request_key(stream_file.request_key)
-    return stream
+    stream_class: Type[BaseStream] = pr.parameter.annotation
+    return stream_class.from_context(context, stream_file.request_key)
 
 
 class StreamFile(File):
@@ -43,3 +46,90 @@ class StreamFile(File):
             parameter=parameter,
             parse_resource_func=request_field_pr_func,
         )
+
+
+def json_lines_pr_func(
+    pr: "resource_parse.ParseResourceParamDc",
+    context: "ContextModel",
+    param_plugin: "BaseParamHandler",
+    pait_model_field: "_pydanitc_adapter.PaitModelField",
+) -> Union[JsonLinesIterator, AsyncJsonLinesIterator]:
+    json_lines: "JsonLines" = pr.parameter.default
+    stream = context.app_helper.request.stream(json_lines.chunk_size)
+    kwargs: dict = {"raise_error": json_lines.raise_error, "max_line_size": json_lines.max_line_size}
+    if isinstance(stream, AsyncGenerator):
+        return AsyncJsonLinesIterator(stream, pr.name, pait_model_field, **kwargs)
+    return JsonLinesIterator(stream, pr.name, pait_model_field, **kwargs)
+
+
+class JsonLines(Json):
+    """Read the JSON Lines (NDJSON) request body line by line, e.g:
+
+        def demo(items: Iterator[Event] = JsonLines.i()) -> None: ...
+        async def demo(items: AsyncIterator[Event] = JsonLines.i()) -> None: ...
+
+    The item of each line is validated by the type of the iterator when it is read,
+    so the whole body never needs to be loaded into memory.
+    """
+
+    media_type: str = "application/x-ndjson"
+
+    def __init__(
+        self,
+        *args: Any,
+        raise_error: bool = True,
+        chunk_size: int = 64 * 1024,
+        max_line_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param raise_error: If True, raise `FieldValueTypeException` when a line is invalid,
+            otherwise skip the line and collect the exception into the `error_list` of the iterator
+        :param chunk_size: The size of the chunk read from the request body
+            (only works for the framework whose request stream supports it)
+        :param max_line_size: If set, raise `FieldValueTypeException` when the size of a line exceeds it
+        """
+        self.raise_error: bool = raise_error
+        self.chunk_size: int = chunk_size
+        self.max_line_size: Optional[int] = max_line_size
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def i(
+        cls,
+        *args: Any,
+        raise_error: bool = True,
+        chunk_size: int = 64 * 1024,
+        max_line_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        return cls(*args, raise_error=raise_error, chunk_size=chunk_size, max_line_size=max_line_size, **kwargs)
+
+    @staticmethod
+    def get_item_annotation(annotation: Any) -> Any:
+        """Get the type of the item from the annotation, e.g. `Event` of `AsyncIterator[Event]`"""
+        args = get_args(annotation)
+        return args[0] if args else Any
+
+    def get_openapi_annotation(self, annotation: Any) -> Any:
+        return List[self.get_item_annotation(annotation)]  # type: ignore[misc]
+
+    @classmethod
+    def pre_load(
+        cls, core_model: "PaitCoreModel", parameter: "Parameter", param_plugin: "Type[BaseParamHandler]"
+    ) -> resource_parse.ParseResourceParamDc:
+        parameter.default.set_request_key(parameter.name)
+        pait_model_field = _pydanitc_adapter.PaitModelField(
+            value_name=parameter.name,
+            annotation=cls.get_item_annotation(parameter.annotation),
+            field_info=Field(...),
+            request_param=parameter.default.get_field_name(),
+        )
+        return resource_parse.ParseResourceParamDc(
+            name=parameter.name,
+            annotation=parameter.annotation,
+            parameter=parameter,
+            parse_resource_func=partial_wrapper(
+                json_lines_pr_func, pait_model_field=pait_model_field  # type: ignore[arg-type]
+            ),
+        )
@@ -1,7 +1,169 @@
-from typing import Any, AsyncGenerator, Callable, Generator, Mapping, Union
+import hashlib
+import os
+from dataclasses import dataclass
+from dataclasses import field as dc_field
+from functools import partial
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pait.app.any.util import import_func_from_app_name
+from pait.g import get_ctx
+from pait.util import to_thread
+
+if TYPE_CHECKING:
+    from pait.model.context import ContextModel
+
+
+def gen_body_too_large_exc(max_body_size: int) -> Exception:
+    """Generate the 413 exception of the framework of the current request"""
+    return import_func_from_app_name("http_exception", get_ctx().app_helper.app_name)(
+        status_code=413, message=f"Request body is larger than {max_body_size} bytes"
+    )
+
+
+class BodySizeLimiter(object):
+    """Count the size of the request body that has been read, and raise 413 exception when the limit is exceeded"""
+
+    def __init__(self, headers: Mapping, max_body_size: Optional[int] = None) -> None:
+        self.max_body_size: Optional[int] = max_body_size
+        self.body_size: int = 0
+        if max_body_size is not None:
+            # Reject the request in advance if the declared length of the body exceeds the limit
+            content_length: str = headers.get("content-length", "") or ""
+            if content_length.isdigit() and int(content_length) > max_body_size:
+                raise gen_body_too_large_exc(max_body_size)
+
+    def feed(self, chunk: bytes) -> None:
+        if self.max_body_size is None:
+            return
+        self.body_size += len(chunk)
+        if self.body_size > self.max_body_size:
+            raise gen_body_too_large_exc(self.max_body_size)
+
+
+@dataclass
+class SaveResult(object):
+    # The number of bytes that have been written
+    size: int
+    # The hex digest of the data, the key is the name of the algorithm, e.g. `sha256`
+    checksum: Dict[str, str] = dc_field(default_factory=dict)
+
+
+SaveTargetType = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+class FileSink(object):
+    """Write the data of the stream to the file in large blocks,
+    and compute the checksums of the data before each block is written, so the data is stored and hashed in one pass
+    """
+
+    def __init__(self, target: SaveTargetType, checksum: Sequence[str] = (), buffer_size: int = 1024 * 1024) -> None:
+        """
+        :param target: The path of the file or a file object opened in binary mode
+        :param checksum: The names of the hash algorithms (see `hashlib.new`), e.g. `("sha256", "md5")`
+        :param buffer_size: The size of the block written to the file
+        """
+        self._hash_list: List[Tuple[str, Any]] = [(name, hashlib.new(name)) for name in checksum]
+        self._buffer: bytearray = bytearray()
+        self._buffer_size: int = buffer_size
+        self._path: Optional[str] = None
+        if isinstance(target, (str, os.PathLike)):
+            self._path = os.fspath(target)
+            # The data is buffered by the sink, so there is no need for another buffer of the file object
+            self._file: IO[bytes] = open(self._path, "wb", buffering=0)
+        else:
+            self._file = target
+        self.size: int = 0
+
+    def write(self, chunk: Union[bytes, memoryview]) -> bool:
+        """Buffer the chunk, return True if the buffer is full and needs to be flushed"""
+        self._buffer += chunk
+        self.size += len(chunk)
+        return len(self._buffer) >= self._buffer_size
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        for _, hash_obj in self._hash_list:
+            hash_obj.update(self._buffer)
+        with memoryview(self._buffer) as view:
+            offset = 0
+            while offset < len(view):
+                # The unbuffered file may write only part of the data
+                offset += self._file.write(view[offset:])
+        self._buffer.clear()
+
+    def close(self) -> SaveResult:
+        self.flush()
+        if self._path is not None:
+            self._file.close()
+        else:
+            self._file.flush()
+        return SaveResult(size=self.size, checksum={name: hash_obj.hexdigest() for name, hash_obj in self._hash_list})
+
+    def abort(self) -> None:
+        """Close and remove the file that is created by the sink"""
+        if self._path is not None:
+            self._file.close()
+            os.unlink(self._path)
+
+
+def save_to(
+    stream: Iterable[Union[bytes, memoryview]],
+    target: SaveTargetType,
+    checksum: Sequence[str] = (),
+    buffer_size: int = 1024 * 1024,
+) -> SaveResult:
+    """Write the data of the stream to the target, see `FileSink` for details"""
+    sink = FileSink(target, checksum=checksum, buffer_size=buffer_size)
+    try:
+        for chunk in stream:
+            if sink.write(chunk):
+                sink.flush()
+        return sink.close()
+    except BaseException:
+        sink.abort()
+        raise
+
+
+async def async_save_to(
+    stream: AsyncIterable[Union[bytes, memoryview]],
+    target: SaveTargetType,
+    checksum: Sequence[str] = (),
+    buffer_size: int = 1024 * 1024,
+) -> SaveResult:
+    """Write the data of the stream to the target, the blocking file operations are run in the thread"""
+    sink: FileSink = await to_thread(FileSink, target, checksum=checksum, buffer_size=buffer_size)
+    try:
+        async for chunk in stream:
+            if sink.write(chunk):
+                await to_thread(sink.flush)
+        return await to_thread(sink.close)
+    except BaseException:
+        await to_thread(sink.abort)
+        raise
 
 
 class BaseStream(object):
+    # The size of the chunk read from the request body
+    # (only works for the framework whose request stream supports it, e.g. flask reads the whole body without it)
+    read_size: int = 64 * 1024
+
     def __init__(
         self,
         headers: Mapping,
@@ -10,5 +172,13 @@ class BaseStream(object):
     ):
         pass
 
+    @classmethod
+    def from_context(cls, context: "ContextModel", request_key: str) -> "BaseStream":
+        """Create the stream of the request body, and bind it to the part whose name is `request_key`"""
+        request = context.app_helper.request
+        stream = cls(request.header(), partial(request.stream, cls.read_size))
+        stream.set_request_key(request_key)
+        return stream
+
     def set_request_key(self, request_key: str) -> None:
         pass
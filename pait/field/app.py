@@ -1,10 +1,10 @@
 import inspect
-from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Optional, Type, TypeVar
 
 from pait.exceptions import FieldValueTypeException
 from pait.field.base import BaseField
 from pait.field.resource_parse import ParseResourceParamDc
-from pait.types import CallType, ParamSpec
+from pait.types import CallType, Literal, ParamSpec
 from pait.util import FuncSig, get_func_sig, get_parameter_list_from_class, is_bounded_func, is_type
 
 if TYPE_CHECKING:
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 
 P = ParamSpec("P")
 R_T = TypeVar("R_T")
+DependScopeLiteral = Literal["request", "app"]
 
 
 def check_pre_depend(
@@ -32,6 +33,28 @@ def check_pre_depend(
         )
 
 
+def check_app_depend(
+    core_model: "PaitCoreModel", depend_func: CallType, param_plugin: "Type[BaseParamHandler]"
+) -> None:
+    """The result of the app scope depend is shared by all requests,
+    so the depend (and its sub depends) can not use the value of the request"""
+    param_list = list(get_func_sig(depend_func).param_list)
+    if inspect.isclass(depend_func):
+        param_list.extend(get_parameter_list_from_class(depend_func))
+    for parameter in param_list:
+        field_class = param_plugin.get_field_from_parameter(core_model, depend_func, parameter)
+        if field_class is None:
+            continue
+        if issubclass(field_class, Depends):
+            check_app_depend(core_model, parameter.default.func, param_plugin)
+        else:
+            raise FieldValueTypeException(
+                parameter.name,
+                f"The app scope depend:{depend_func} can not use the request value of {field_class.__name__}"
+                f" (param:{parameter.name}), because its result is shared by all requests",
+            )
+
+
 def request_depend_pr_func(
     pr: "ParseResourceParamDc",
     context: "ContextModel",
@@ -41,16 +64,49 @@ def request_depend_pr_func(
 
 
 class Depends(BaseField):
-    def __init__(self, func: CallType):
+    def __init__(
+        self,
+        func: CallType,
+        use_cache: bool = True,
+        scope: DependScopeLiteral = "request",
+        ttl: Optional[float] = None,
+    ):
+        """
+        :param func: The depend callable
+        :param use_cache: If True, the same depend callable only runs once in a request,
+            the others use the cached result
+        :param scope: The lifetime of the depend result.
+            request: the depend runs in every request.
+            app: the depend only runs once and the result is shared by all requests,
+                its context managers are exited when the app is shutdown (see `close_app_depend`).
+        :param ttl: Only for app scope, the result expires after `ttl` seconds and the depend runs again
+        """
+        if scope not in ("request", "app"):
+            raise ValueError(f"Not support scope: {scope}")
+        if scope == "app" and not use_cache:
+            raise ValueError("The result of app scope depend is always cached, can not set use_cache=False")
+        if ttl is not None and scope != "app":
+            raise ValueError("ttl only support app scope depend")
         self.func: CallType = func
+        self.use_cache: bool = use_cache
+        self.scope: DependScopeLiteral = scope
+        self.ttl: Optional[float] = ttl
 
     @classmethod
-    def i(cls, func: CallType) -> Any:
-        return cls(func)
+    def i(
+        cls, func: CallType, use_cache: bool = True, scope: DependScopeLiteral = "request", ttl: Optional[float] = None
+    ) -> Any:
+        return cls(func, use_cache=use_cache, scope=scope, ttl=ttl)
 
     @classmethod
-    def t(cls, func: Callable[P, R_T]) -> R_T:  # type: ignore
-        return cls(func)  # type: ignore
+    def t(  # type: ignore
+        cls,
+        func: Callable[P, R_T],
+        use_cache: bool = True,
+        scope: DependScopeLiteral = "request",
+        ttl: Optional[float] = None,
+    ) -> R_T:
+        return cls(func, use_cache=use_cache, scope=scope, ttl=ttl)  # type: ignore
 
     @classmethod
     def pre_check(
@@ -59,6 +115,8 @@ class Depends(BaseField):
         depend_func = getattr(parameter.default, "func")
         func_sig: FuncSig = get_func_sig(depend_func)  # get and cache func sig
         check_pre_depend(core_model, func_sig, param_plugin)
+        if parameter.default.scope == "app":
+            check_app_depend(core_model, depend_func, param_plugin)
         if not is_type(parameter.annotation, func_sig.return_param):
             raise FieldValueTypeException(
                 parameter.name,
@@ -70,10 +128,13 @@ class Depends(BaseField):
     def pre_load(
         cls, core_model: "PaitCoreModel", parameter: "inspect.Parameter", param_plugin: "Type[BaseParamHandler]"
     ) -> ParseResourceParamDc:
+        depends: Depends = parameter.default
         return ParseResourceParamDc(
             name=parameter.name,
             annotation=parameter.annotation,
             parameter=parameter,
             parse_resource_func=request_depend_pr_func,
-            sub=param_plugin.depend_handler(core_model, parameter.default.func),
+            sub=param_plugin.depend_handler(
+                core_model, depends.func, use_cache=depends.use_cache, scope=depends.scope, ttl=depends.ttl
+            ),
         )
@@ -291,17 +291,20 @@ class BaseRequestResourceField(BaseField, FieldInfo):
     ) -> ParseResourceParamDc:
         parameter.default.set_request_key(parameter.name)
         validate_request_value_cb = resource_parse.validate_request_value
+        normalize_request_value_cb = resource_parse.normalize_request_value
         if core_model.app_helper_class.app_name == "flask":
             validate_request_value_cb = resource_parse.flask_validate_request_value
+            normalize_request_value_cb = resource_parse.flask_normalize_request_value
+        # Creating a model field is very performance-intensive (especially for Pydantic V2),
+        # so it needs to be cached
+        pait_model_field = _pydanitc_adapter.PaitModelField(
+            value_name=parameter.name,
+            annotation=parameter.annotation,
+            field_info=parameter.default,
+            request_param=parameter.default.get_field_name(),
+        )
         rule_field_type_func_param_dict = dict(
-            # Creating a model field is very performance-intensive (especially for Pydantic V2),
-            # so it needs to be cached
-            pait_model_field=_pydanitc_adapter.PaitModelField(
-                value_name=parameter.name,
-                annotation=parameter.annotation,
-                field_info=parameter.default,
-                request_param=parameter.default.get_field_name(),
-            ),
+            pait_model_field=pait_model_field,
             validate_request_value_cb=validate_request_value_cb,
         )
 
@@ -315,6 +318,8 @@ class BaseRequestResourceField(BaseField, FieldInfo):
             annotation=parameter.annotation,
             parameter=parameter,
             parse_resource_func=partial_wrapper(param_func, **rule_field_type_func_param_dict),  # type:ignore[arg-type]
+            pait_model_field=pait_model_field,
+            normalize_request_value_cb=normalize_request_value_cb,
         )
 
     @property
@@ -345,6 +350,10 @@ class BaseRequestResourceField(BaseField, FieldInfo):
     def request_value_handle_by_default_factory(self, request_value: Mapping) -> Any:
         return request_value.get(self.request_key, self.default_factory())  # type:ignore[misc]
 
+    def get_openapi_annotation(self, annotation: Any) -> Any:
+        """The annotation used to generate the OpenAPI schema of the field"""
+        return annotation
+
     @property
     def links(self) -> "Optional[LinksModel]":
         return _pydanitc_adapter.get_field_extra_dict(self).get("links", None)
@@ -446,6 +455,9 @@ class Cookie(BaseRequestResourceField):
 class File(BaseRequestResourceField):
     media_type: str = "multipart/form-data"
 
+    def get_openapi_annotation(self, annotation: Any) -> Any:
+        return Any
+
 
 class Form(BaseRequestResourceField):
     media_type: str = "application/x-www-form-urlencoded"
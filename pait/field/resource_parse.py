@@ -2,16 +2,18 @@ import asyncio
 import inspect
 from dataclasses import MISSING, dataclass
 from dataclasses import field as dc_field
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Mapping, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Mapping, Optional, Type, Union
 
 from pydantic import BaseModel
 
 from pait import _pydanitc_adapter
 from pait.types import Protocol
+from pait.util import partial_wrapper
 
 if TYPE_CHECKING:
     from pait.field import BaseRequestResourceField
     from pait.model.context import ContextModel
+    from pait.param_handle.app_depend import AppDependCache
     from pait.param_handle.base import BaseParamHandler
     from pait.types import CallType
 
@@ -30,6 +32,14 @@ class PreLoadDc(object):
     call_handler: "CallType"
     param: "ParseResourceParamDcDict" = dc_field(default_factory=dict)
     cbv_param: Optional["ParseResourceParamDcDict"] = dc_field(default=None)
+    # If not None, the values of the request fields in `param` are validated together by it in a single pass
+    compiled_model_field: Optional[_pydanitc_adapter.PaitCompiledModelField] = dc_field(default=None)
+    # The name of the Depends params in `param` that are independent of each other and can be run concurrently
+    concurrent_depend_name_list: List[str] = dc_field(default_factory=list)
+    # If True, the result of the depend is cached in the request, and the same depend callable only runs once
+    use_cache: bool = dc_field(default=True)
+    # If not None, the depend is app scope, and its result is cached by it and shared by all requests
+    app_depend_cache: Optional["AppDependCache"] = dc_field(default=None)
 
 
 @dataclass
@@ -39,6 +49,10 @@ class ParseResourceParamDc(object):
     parameter: inspect.Parameter
     parse_resource_func: ParseResourceFuncProtocol
     sub: "PreLoadDc" = dc_field(default_factory=lambda: PreLoadDc(call_handler=empty_pr_func))
+    # Only the request field will set the value, it can be used to compile the validation of the request fields
+    pait_model_field: Optional[_pydanitc_adapter.PaitModelField] = dc_field(default=None)
+    # Only the request field will set the value, normalize the request value before it is validated
+    normalize_request_value_cb: Optional[Callable[[Any], Any]] = dc_field(default=None)
 
 
 ParseResourceParamDcDict = Dict[str, "ParseResourceParamDc"]
@@ -66,6 +80,21 @@ def get_real_request_value(parameter: inspect.Parameter, request_value: Mapping)
 #################################
 # Validate Request Value Handle #
 #################################
+def normalize_request_value(request_value: Any) -> Any:
+    return request_value
+
+
+def flask_normalize_request_value(request_value: Any) -> Any:
+    if not _pydanitc_adapter.is_v1 and isinstance(request_value, dict):
+        # Fix _model_field.validate method not support like flask ImmutableMultiDict:
+        #    e.g:
+        #       intput: ImmutableMultiDict([('pin-code', '6666'), ('template-token', 'xxx')])
+        #       output:{"pin-code": ["6666"], "template-token": ["xxx"]}
+        #       But the desired result is: {"pin-code": "6666", "template-token": "xxx"}
+        request_value = dict(request_value)
+    return request_value
+
+
 def flask_validate_request_value(
     parameter: inspect.Parameter, request_value: Mapping, pait_model_field: _pydanitc_adapter.PaitModelField
 ) -> Any:
@@ -76,14 +105,7 @@ def flask_validate_request_value(
         return annotation(**request_value)
     else:
         # parse annotation is python type and pydantic.field
-        if not _pydanitc_adapter.is_v1 and isinstance(request_value, dict):
-            # Fix _model_field.validate method not support like flask ImmutableMultiDict:
-            #    e.g:
-            #       intput: ImmutableMultiDict([('pin-code', '6666'), ('template-token', 'xxx')])
-            #       output:{"pin-code": ["6666"], "template-token": ["xxx"]}
-            #       But the desired result is: {"pin-code": "6666", "template-token": "xxx"}
-            request_value = dict(request_value)
-        return pait_model_field.validate(request_value)
+        return pait_model_field.validate(flask_normalize_request_value(request_value))
 
 
 def validate_request_value(
@@ -156,3 +178,59 @@ async def async_request_field_pr_func(
 ) -> Any:
     request_value = await async_request_field_get_value_pr_func(pr, context, param_plugin)
     return validate_request_value_cb(pr.parameter, request_value, pait_model_field)
+
+
+def compiled_request_field_pr_func(
+    pr: "ParseResourceParamDc",
+    context: "ContextModel",
+    param_plugin: "BaseParamHandler",
+    *,
+    normalize_request_value_cb: Callable[[Any], Any] = normalize_request_value,
+) -> Any:
+    """get the normalized request value, it will be validated by the `PaitCompiledModelField` of the pld"""
+    return normalize_request_value_cb(request_field_get_value_pr_func(pr, context, param_plugin))
+
+
+async def async_compiled_request_field_pr_func(
+    pr: "ParseResourceParamDc",
+    context: "ContextModel",
+    param_plugin: "BaseParamHandler",
+    *,
+    normalize_request_value_cb: Callable[[Any], Any] = normalize_request_value,
+) -> Any:
+    """get the normalized request value, it will be validated by the `PaitCompiledModelField` of the pld"""
+    return normalize_request_value_cb(await async_request_field_get_value_pr_func(pr, context, param_plugin))
+
+
+#######################
+# Compiled Validation #
+#######################
+def compile_pre_load_dc(pld: PreLoadDc, class_name: str, is_async_mode: bool) -> PreLoadDc:
+    """Merge the validation of all plain request fields of the pld into one `PaitCompiledModelField`,
+    each field will only get the value from the request, and then validate all values in a single pass.
+
+    Note: raw_return field, pydantic.BaseModel annotation field and field that the validation alias is not str
+     are still validated one by one
+    """
+    pr_list: List[ParseResourceParamDc] = []
+    for pr in pld.param.values():
+        if pr.pait_model_field is None or pr.parameter.default.raw_return:
+            continue
+        if inspect.isclass(pr.annotation) and issubclass(pr.annotation, BaseModel):
+            continue
+        if not isinstance(getattr(pr.parameter.default, "validation_alias", None), (str, type(None))):
+            continue
+        pr_list.append(pr)
+    if len(pr_list) < 2:
+        return pld
+
+    pld.compiled_model_field = _pydanitc_adapter.PaitCompiledModelField(
+        [pr.pait_model_field for pr in pr_list], class_name=class_name  # type: ignore[misc]
+    )
+    param_func = async_compiled_request_field_pr_func if is_async_mode else compiled_request_field_pr_func
+    for pr in pr_list:
+        pr.parse_resource_func = partial_wrapper(
+            param_func,  # type: ignore[arg-type]
+            normalize_request_value_cb=pr.normalize_request_value_cb or normalize_request_value,
+        )
+    return pld
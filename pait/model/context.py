@@ -1,4 +1,4 @@
-from dataclasses import MISSING, dataclass, field
+from dataclasses import MISSING
 from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 
 if TYPE_CHECKING:
@@ -9,25 +9,52 @@ if TYPE_CHECKING:
 __all__ = ["ContextModel"]
 
 
-@dataclass
 class ContextModel(object):
-    cbv_instance: Optional[Any]
-    app_helper: "BaseAppHelper"
-    pait_core_model: "PaitCoreModel"
-    # If it is a pre plugin,
-    #   args and kwargs are the parameters for the corresponding web framework to call the route.
-    # If it is a post plugin,
-    #   args and kwargs are the parameters filled in by the developer to write the routing function.
-    args: Sequence
-    kwargs: dict
+    # Each request creates a ContextModel object, so use __slots__ to save the memory footprint.
+    # The `contextmanager_list` is set by the param handler (and stream fields) when needed.
+    __slots__ = (
+        "cbv_instance",
+        "app_helper",
+        "pait_core_model",
+        "args",
+        "kwargs",
+        "state",
+        "depend_cache",
+        "contextmanager_list",
+    )
+
+    def __init__(
+        self,
+        cbv_instance: Optional[Any],
+        app_helper: "BaseAppHelper",
+        pait_core_model: "PaitCoreModel",
+        args: Sequence,
+        kwargs: dict,
+    ) -> None:
+        self.cbv_instance: Optional[Any] = cbv_instance
+        self.app_helper: "BaseAppHelper" = app_helper
+        self.pait_core_model: "PaitCoreModel" = pait_core_model
+        # If it is a pre plugin,
+        #   args and kwargs are the parameters for the corresponding web framework to call the route.
+        # If it is a post plugin,
+        #   args and kwargs are the parameters filled in by the developer to write the routing function.
+        self.args: Sequence = args
+        self.kwargs: dict = kwargs
 
     # If it is not used, then it is not initialized, saving memory footprint
-    state: Dict[str, Any] = field(init=False)
+    state: Dict[str, Any]
+    # The result of the depends that have been run in this request, the key is the id of the depend callable
+    depend_cache: Dict[int, Any]
 
     def _init_state(self) -> None:
         if not hasattr(self, "state"):
             self.state = {}
 
+    def get_depend_cache(self) -> Dict[int, Any]:
+        if not hasattr(self, "depend_cache"):
+            self.depend_cache = {}
+        return self.depend_cache
+
     def set_to_state(self, key: str, value: Any) -> None:
         self._init_state()
         self.state[key] = value
@@ -38,9 +65,13 @@ class ContextModel(object):
             raise KeyError(key)
         return value
 
-    def __str__(self) -> str:
-        self._init_state()
-        return super().__str__()
+    def __repr__(self) -> str:
+        # Only read the attributes, the state and the depend cache that are not initialized are shown as empty
+        field_str: str = ", ".join(
+            f"{key}={getattr(self, key, {})!r}"
+            for key in ("cbv_instance", "app_helper", "pait_core_model", "args", "kwargs", "state", "depend_cache")
+        )
+        return f"{self.__class__.__qualname__}({field_str})"
 
 
 PluginContext = ContextModel
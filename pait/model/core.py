@@ -12,6 +12,7 @@ from pait.model.status import PaitStatus
 from pait.model.tag import Tag
 from pait.param_handle import BaseParamHandler
 from pait.plugin import PluginManager, PluginProtocol, PostPluginProtocol, PrePluginProtocol
+from pait.plugin.base import PluginEntryType
 from pait.util import ImmutableDict, gen_tip_exc, ignore_pre_check
 
 if TYPE_CHECKING:
@@ -77,6 +78,7 @@ class DefaultValue(object):
 class PaitCoreModel(object):
     _param_handler_plugin: PluginManager["BaseParamHandler"]
     _main_plugin: PluginProtocol
+    _main_plugin_entry: PluginEntryType
 
     def __init__(
         self,
@@ -102,6 +104,8 @@ class PaitCoreModel(object):
         post_plugin_list: PostPluginListOptionalType = None,
         feature_code: Optional[str] = None,
         sync_to_thread: OptionalBoolType = None,
+        compiled_validation: OptionalBoolType = None,
+        concurrent_depend: OptionalBoolType = None,
         tip_exception_class: Optional[Type[TipException]] = DefaultValue.tip_exception_class,
         **kwargs: Any,
     ):
@@ -110,6 +114,8 @@ class PaitCoreModel(object):
         self.default_field_class = default_field_class
         self.func = func  # route func
         self.sync_to_thread = sync_to_thread
+        self._compiled_validation: bool = bool(compiled_validation)
+        self._concurrent_depend: bool = bool(concurrent_depend)
         self.tip_exception_class = tip_exception_class
         self.pait_id = f"{func.__module__}_{func.__qualname__}"
         # Some functions have the same md5 as the name and need to be distinguished by the feature code
@@ -161,6 +167,32 @@ class PaitCoreModel(object):
         if self._need_build_plugin:
             self.build_plugin_stack()
 
+    #######################
+    # compiled validation #
+    #######################
+    @property
+    def compiled_validation(self) -> bool:
+        return self._compiled_validation
+
+    @compiled_validation.setter
+    def compiled_validation(self, compiled_validation: bool) -> None:
+        """The validation rules of the request fields are generated in the build phase, so need to build again"""
+        self._compiled_validation = compiled_validation
+        self._need_build_plugin = True
+
+    ######################
+    # concurrent depend  #
+    ######################
+    @property
+    def concurrent_depend(self) -> bool:
+        return self._concurrent_depend
+
+    @concurrent_depend.setter
+    def concurrent_depend(self, concurrent_depend: bool) -> None:
+        """Which depends can be run concurrently is decided in the build phase, so need to build again"""
+        self._concurrent_depend = concurrent_depend
+        self._need_build_plugin = True
+
     #################
     # operation id  #
     #################
@@ -289,6 +321,11 @@ class PaitCoreModel(object):
     def main_plugin(self) -> PluginProtocol:
         return self._main_plugin
 
+    @property
+    def main_plugin_entry(self) -> PluginEntryType:
+        """The entry of the plugin stack, each plugin has resolved how to call the next plugin at build time"""
+        return self._main_plugin_entry
+
     def build_plugin_stack(self) -> None:
         plugin_manager_list: List[PluginManager] = (
             self._plugin_list + [self._param_handler_plugin] + self._post_plugin_list
@@ -299,6 +336,7 @@ class PaitCoreModel(object):
         self._main_plugin = self.func  # type: ignore
         for plugin_manager in reversed(plugin_manager_list):
             self._main_plugin = plugin_manager.get_plugin(self._main_plugin, self)
+        self._main_plugin_entry = self._main_plugin.get_entry()
         self._need_build_plugin = False
 
     def add_plugin(
@@ -0,0 +1,4 @@
+from pait.openapi.build import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Iterable, List, Optional, Sequence, Type, Union
+
+from pait.g import config
+from pait.openapi.openapi import OpenAPI, ServerModel
+
+__all__ = ["load_app_from_string", "build_openapi", "openapi_content", "write_openapi_file", "main"]
+
+
+def load_app_from_string(app_path: str, factory: bool = False) -> Any:
+    """Import the app by the string in the format of `<module>:<attribute>`, e.g. `example.main:app`
+
+    :param app_path: The import path of the app, the attribute can be nested, e.g. `module:obj.app`
+    :param factory: If True, the attribute is a function that returns the app, e.g. `module:create_app`
+    """
+    module_name, _, attr_path = app_path.partition(":")
+    if not module_name or not attr_path:
+        raise ValueError(f"The app path must be in the format of `<module>:<attribute>`, not `{app_path}`")
+    # Make the module in the current working directory importable, which is the same as `python -m`
+    if "" not in sys.path and os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    app: Any = importlib.import_module(module_name)
+    for attr in attr_path.split("."):
+        try:
+            app = getattr(app, attr)
+        except AttributeError:
+            raise ValueError(f"Can not found attribute `{attr_path}` in module `{module_name}`")
+    if factory:
+        app = app()
+    return app
+
+
+def build_openapi(
+    app: Any,
+    title: str = "",
+    server_url_list: Optional[List[str]] = None,
+    openapi: Optional[Type[OpenAPI]] = None,
+) -> OpenAPI:
+    """Generate the OpenAPI document of the app
+
+    :param app: The app instance
+    :param title: The title of the document
+    :param server_url_list: The url of the servers of the document
+    :param openapi: OpenAPI class
+    """
+    pait_openapi: OpenAPI = (openapi or OpenAPI)(
+        app, server_model_list=[ServerModel(url=url) for url in server_url_list or []] or None
+    )
+    if title:
+        pait_openapi.model.info.title = title
+    return pait_openapi
+
+
+def openapi_content(pait_openapi: OpenAPI, file_format: str = "json", **kwargs: Any) -> str:
+    """Serialize the OpenAPI document
+
+    :param pait_openapi: The OpenAPI instance
+    :param file_format: The format of the document, support `json` and `yaml`
+    :param kwargs: The param of the serialization function
+    """
+    if file_format == "json":
+        return pait_openapi.content(**kwargs)
+    elif file_format == "yaml":
+        try:
+            import yaml  # type: ignore
+        except ImportError:
+            raise ImportError("Please install `pyyaml` to generate the OpenAPI document in yaml format")
+
+        def _yaml_serialization(content_dict: dict, **_kwargs: Any) -> str:
+            return yaml.safe_dump(json.loads(json.dumps(content_dict, cls=config.json_encoder)), **_kwargs)
+
+        return pait_openapi.content(_yaml_serialization, **kwargs)
+    else:
+        raise ValueError(f"Not support format: {file_format}")
+
+
+def write_openapi_file(content: Union[str, Iterable[bytes]], output: str) -> None:
+    """Write the document (the string or the chunks of `OpenAPI.iter_content`) to a temporary file first
+    and then rename it, so that the reader will never read a half-written document"""
+    dir_name: str = os.path.dirname(os.path.abspath(output))
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".openapi-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in [content.encode()] if isinstance(content, str) else content:
+                f.write(chunk)
+        # The temporary file is only readable by the owner, use the mode of a file created by `open`
+        umask: int = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, output)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _get_file_format(output: str) -> str:
+    return "yaml" if output.endswith((".yaml", ".yml")) else "json"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m pait.openapi", description="Pait OpenAPI command line tool"
+    )
+    sub_parsers = parser.add_subparsers(dest="command")
+    build_parser: argparse.ArgumentParser = sub_parsers.add_parser(
+        "build", help="Generate the OpenAPI document of the app and write it to the file"
+    )
+    build_parser.add_argument("app", help="The import path of the app, e.g. `example.main:app`")
+    build_parser.add_argument("-o", "--output", action="append", default=[], help="The output file, default: stdout")
+    build_parser.add_argument(
+        "--format",
+        choices=["json", "yaml"],
+        default=None,
+        help="The format of the document, by default, it is determined by the extension of the output file",
+    )
+    build_parser.add_argument("--factory", action="store_true", help="The app is a function that returns the app")
+    build_parser.add_argument("--title", default="", help="The title of the document")
+    build_parser.add_argument(
+        "--server-url", action="append", default=[], dest="server_url_list", help="The url of the server"
+    )
+    build_parser.add_argument("--indent", type=int, default=None, help="The indent of the json document")
+    args: argparse.Namespace = parser.parse_args(argv)
+    if args.command != "build":
+        parser.print_help()
+        parser.exit(2)
+
+    pait_openapi: OpenAPI = build_openapi(
+        load_app_from_string(args.app, factory=args.factory),
+        title=args.title,
+        server_url_list=args.server_url_list,
+    )
+    for output in args.output or ["-"]:
+        file_format: str = args.format or _get_file_format(output)
+        kwargs: dict = {"indent": args.indent} if args.indent is not None and file_format == "json" else {}
+        if file_format == "json":
+            # The json document is written chunk by chunk, without building the whole string
+            content: Union[str, Iterable[bytes]] = pait_openapi.iter_content(**kwargs)
+        else:
+            content = openapi_content(pait_openapi, file_format=file_format, **kwargs)
+        if output != "-":
+            write_openapi_file(content, output)
+        elif isinstance(content, str):
+            sys.stdout.write(content)
+        else:
+            for chunk in content:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.flush()
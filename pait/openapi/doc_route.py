@@ -1,7 +1,9 @@
-import json
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 from urllib.parse import urlencode
 
 from any_api.openapi import web_ui
@@ -10,8 +12,8 @@ from pydantic import BaseModel, Field
 from pait.app.any.util import import_func_from_app
 from pait.app.base.simple_route import SimpleRoute
 from pait.core import Pait
-from pait.field import Depends, Path, Query
-from pait.g import config, get_ctx
+from pait.field import Depends, Header, Path, Query
+from pait.g import config, get_ctx, pait_data
 from pait.model.response import HtmlResponseModel, JsonResponseModel
 from pait.model.status import PaitStatus
 from pait.model.tag import Tag
@@ -55,10 +57,27 @@ class DocEnum(str, Enum):
     pass
 
 
+def _match_etag(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for item in if_none_match.split(","):
+        item = item.strip()
+        if item.startswith("W/"):
+            item = item[2:]
+        if item == etag:
+            return True
+    return False
+
+
 class AddDocRoute(object):
     not_found_exc: Exception
     pait: Pait
     add_multi_simple_route: staticmethod
+    gen_raw_response: staticmethod
+    # The maximum number of OpenAPI documents (different template variables, scheme and host) that are cached
+    openapi_cache_size: int = 32
 
     def __init__(
         self,
@@ -73,6 +92,7 @@ class AddDocRoute(object):
         pait: Optional[Pait] = None,
         add_multi_simple_route: Optional[Callable] = None,
         not_found_exc: Optional[Exception] = None,
+        openapi_file: Optional[str] = None,
     ):
         """
         :param app: The app instance to which the doc route is bound
@@ -97,6 +117,10 @@ class AddDocRoute(object):
         :param pait: instance of pait
         :param add_multi_simple_route: add_multi_simple_route
         :param not_found_exc:  not_found_exc
+        :param openapi_file: The path of the OpenAPI document(json format) generated in advance,
+            e.g. by `python -m pait.openapi build module:app -o openapi.json`.
+            If set, the route serves the file (loaded once) instead of generating the document at runtime,
+            so the template variables, scheme and host of the request are not applied to the document.
         """
         if pin_code:
             logging.info(f"doc route start pin code:{pin_code}")
@@ -126,6 +150,17 @@ class AddDocRoute(object):
             or getattr(self, "not_found_exc", None)
             or import_func_from_app("http_exception", app=app)(status_code=404, message="Not Found")
         )
+        self._gen_raw_response: Callable = getattr(self, "gen_raw_response", None) or import_func_from_app(
+            "gen_raw_response", app=app, module_name="adapter.response"
+        )
+        # key: (scheme, host, template variables), value: (version of pait data, content, etag)
+        self._openapi_cache: "OrderedDict[Tuple, Tuple[int, bytes, str]]" = OrderedDict()
+        self._openapi_lock: threading.Lock = threading.Lock()
+        self._openapi_file_content: Optional[Tuple[bytes, str]] = None
+        if openapi_file:
+            with open(openapi_file, "rb") as f:
+                content: bytes = f.read()
+            self._openapi_file_content = (content, self._gen_etag(content))
         self._gen_route(app)
 
     def _get_request_pin_code(self, pin_code: str = Query.i("", alias="pin-code")) -> Optional[str]:
@@ -205,6 +240,38 @@ class AddDocRoute(object):
         _doc_route.__qualname__ = _doc_route.__qualname__.replace("._doc_route", "." + _doc_route.__name__)
         return _doc_route
 
+    @staticmethod
+    def _gen_etag(content: bytes) -> str:
+        return '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+
+    def _get_openapi_content(self, app: Any, scheme: str, hostname: str, url_dict: Dict[str, Any]) -> Tuple[bytes, str]:
+        """Generate the OpenAPI document and its ETag, the result is cached until the pait data is changed"""
+        if self._openapi_file_content:
+            return self._openapi_file_content
+        key: Tuple = (scheme, hostname, tuple(sorted((k, str(v)) for k, v in url_dict.items())))
+        cache_value: Optional[Tuple[int, bytes, str]] = self._openapi_cache.get(key, None)
+        if cache_value and cache_value[0] == pait_data.version:
+            return cache_value[1], cache_value[2]
+        with self._openapi_lock:
+            # Only one request generates the document, and the others wait for it
+            # Read the version before the document is generated, if the pait data is changed during the generation
+            # (including the first `load_app` of the app), the cached document is regenerated by the next request
+            version: int = pait_data.version
+            cache_value = self._openapi_cache.get(key, None)
+            if cache_value and cache_value[0] == version:
+                return cache_value[1], cache_value[2]
+            with TemplateContext(url_dict):
+                pait_openapi: OpenAPI = self.openapi(app)
+                pait_openapi.model.info.title = self.title
+                pait_openapi.model.servers.insert(0, ServerModel(url=f"{scheme}://{hostname}"))
+                content: bytes = b"".join(pait_openapi.iter_content())
+            etag: str = self._gen_etag(content)
+            self._openapi_cache.pop(key, None)
+            if len(self._openapi_cache) >= self.openapi_cache_size:
+                self._openapi_cache.popitem(last=False)
+            self._openapi_cache[key] = (version, content, etag)
+        return content, etag
+
     def _get_openapi_route(self, app: Any) -> Callable:
         @self._doc_pait(
             pre_depend_list=[self._get_request_pin_code],
@@ -213,14 +280,19 @@ class AddDocRoute(object):
         )
         def _openapi_route(
             url_dict: Dict[str, Any] = Depends.i(self._get_request_template_map(extra_key=True)),
-        ) -> dict:
-            re = get_ctx().app_helper.request.request_extend()
-            _scheme: str = self.scheme or re.scheme
-            with TemplateContext(url_dict):
-                pait_openapi: OpenAPI = self.openapi(app)
-                pait_openapi.model.info.title = self.title
-                pait_openapi.model.servers.insert(0, ServerModel(url=f"{_scheme}://{re.hostname}"))
-                return json.loads(pait_openapi.content())
+            if_none_match: str = Header.i(
+                "", alias="If-None-Match", description="Return 304 if the document is not modified"
+            ),
+        ) -> Any:
+            app_helper = get_ctx().app_helper
+            re = app_helper.request.request_extend()
+            content, etag = self._get_openapi_content(app, self.scheme or re.scheme, re.hostname, url_dict)
+            headers: Dict[str, str] = {"ETag": etag, "Cache-Control": "no-cache"}
+            # The response of tornado is written by the request handler
+            args: tuple = (app_helper.cbv_instance,) if app_helper.app_name == "tornado" else ()
+            if _match_etag(if_none_match, etag):
+                return self._gen_raw_response(*args, b"", status_code=304, headers=headers)
+            return self._gen_raw_response(*args, content, headers=headers)
 
         return _openapi_route
 
@@ -237,6 +309,7 @@ def add_doc_route(
     pait: Optional[Pait] = None,
     add_multi_simple_route: Optional[Callable] = None,
     not_found_exc: Optional[Exception] = None,
+    openapi_file: Optional[str] = None,
 ) -> None:
     AddDocRoute(
         scheme=scheme,
@@ -250,4 +323,5 @@ def add_doc_route(
         pait=pait,
         add_multi_simple_route=add_multi_simple_route,
         not_found_exc=not_found_exc,
+        openapi_file=openapi_file,
     )
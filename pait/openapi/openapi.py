@@ -1,7 +1,8 @@
 import inspect
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+import weakref
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type, Union, get_type_hints
 
 from any_api.openapi import ApiModel as _ApiModel
 from any_api.openapi import ExternalDocumentationModel, HttpParamTypeLiteral, InfoModel
@@ -17,7 +18,7 @@ from pydantic.fields import FieldInfo
 from pait import _pydanitc_adapter
 from pait.app.any.util import import_func_from_app
 from pait.data import PaitCoreProxyModel
-from pait.field import BaseRequestResourceField, Depends, File
+from pait.field import BaseRequestResourceField, Depends
 from pait.g import config
 from pait.model.core import PaitCoreModel
 from pait.types import CallType
@@ -27,7 +28,7 @@ from pait.util._util import get_parameter_list_from_class
 HttpParamTypeDictType = Dict[HttpParamTypeLiteral, List[RequestModel]]
 
 
-__all__ = ["LinksModel", "ApiModel", "ParsePaitModel", "OpenAPI"]
+__all__ = ["LinksModel", "ApiModel", "ParsePaitModel", "OpenAPI", "get_parse_pait_model"]
 
 
 class ApiModel(_ApiModel):
@@ -51,6 +52,27 @@ class ApiModel(_ApiModel):
         }
 
 
+# The same pydantic model is usually used by many routes, so its type hints only need to be parsed once
+_model_type_hints_cache: "weakref.WeakKeyDictionary[Type[BaseModel], Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _get_model_type_hints(pydantic_model: Type[BaseModel]) -> Dict[str, Any]:
+    """Get the type hints of the pydantic model, the result is cached and should not be modified"""
+    type_hints: Optional[Dict[str, Any]] = _model_type_hints_cache.get(pydantic_model, None)
+    if type_hints is None:
+        type_hints = get_type_hints(pydantic_model)
+        _model_type_hints_cache[pydantic_model] = type_hints
+    return type_hints
+
+
+# The models synthesized by `ParsePaitModel` for each route, only the last model of each class name is kept,
+# key: class name, value: (((field name, annotation, field class, id of field info), ...), model, field infos).
+# The value also holds the field infos, so their ids will not be reused while the entry exists
+_synthesized_model_cache: (
+    "weakref.WeakKeyDictionary[PaitCoreModel, Dict[str, Tuple[Tuple, Type[BaseModel], Tuple[Any, ...]]]]"
+) = weakref.WeakKeyDictionary()
+
+
 class ParsePaitModel(object):
     def __init__(self, pait_model: PaitCoreModel) -> None:
         self.pait_model: PaitCoreModel = pait_model
@@ -59,6 +81,8 @@ class ParsePaitModel(object):
         self.http_param_type_alias_dict: Dict[str, HttpParamTypeLiteral] = {"multiquery": "query"}
 
         self.param_field_dict: Dict[str, BaseRequestResourceField] = {}
+        # key: id of the field converted by `default_field_class`, value: the pydantic field it is converted from
+        self._source_field_dict: Dict[int, FieldInfo] = {}
         self.http_param_type_annotation_dict: Dict[HttpParamTypeLiteral, Dict[str, Tuple[Type, FieldInfo]]] = {}
 
         for extra_openapi_model in self.pait_model.extra_openapi_model_list:
@@ -69,6 +93,28 @@ class ParsePaitModel(object):
 
         self.build()
 
+    def _create_pydantic_model(self, annotation_dict: Dict[str, Tuple[Any, Any]], class_name: str) -> Type[BaseModel]:
+        """Same as `create_pydantic_model`, but the same class name and fields (the same field info object,
+        or the field converted from the same pydantic field) reuse the same model,
+        so parsing the route again does not create new classes every time"""
+        field_list: List[Any] = [self._source_field_dict.get(id(field), field) for _, field in annotation_dict.values()]
+        key: Tuple = tuple(
+            (name, annotation, type(field), id(source_field))
+            for (name, (annotation, field)), source_field in zip(annotation_dict.items(), field_list)
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # The annotation is not hashable, can not be cached
+            return create_pydantic_model(annotation_dict, class_name=class_name)
+        model_dict = _synthesized_model_cache.setdefault(self.pait_model, {})
+        cache_value = model_dict.get(class_name, None)
+        if cache_value is None or cache_value[0] != key:
+            # Replace the model of the old fields, so the cache of each route does not grow
+            cache_value = (key, create_pydantic_model(annotation_dict, class_name=class_name), tuple(field_list))
+            model_dict[class_name] = cache_value
+        return cache_value[1]
+
     def build(self) -> None:
         for http_param_type, annotation_dict in self.http_param_type_annotation_dict.items():
             http_param_type = self.http_param_type_alias_dict.get(http_param_type, http_param_type)
@@ -79,7 +125,7 @@ class ParsePaitModel(object):
                     description="",
                     media_type_list=[self.param_field_dict[http_param_type].media_type],
                     openapi_serialization=self.param_field_dict[http_param_type].openapi_serialization,
-                    model=create_pydantic_model(
+                    model=self._create_pydantic_model(
                         annotation_dict,
                         class_name=(
                             f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}"
@@ -92,18 +138,19 @@ class ParsePaitModel(object):
     def _parse_base_model(
         self, _pydantic_model: Type[BaseModel], default_field_class: Optional[Type[BaseRequestResourceField]] = None
     ) -> None:
-        from typing import get_type_hints
-
+        type_hints: Dict[str, Any] = _get_model_type_hints(_pydantic_model)
         for field_name, model_field in _pydanitc_adapter.model_fields(_pydantic_model).items():
-            param_annotation = get_type_hints(_pydantic_model)[field_name]
+            param_annotation = type_hints[field_name]
             field = _pydanitc_adapter.get_field_info(model_field)
             if not isinstance(field, BaseRequestResourceField):
+                source_field: FieldInfo = field
                 if self.pait_model.default_field_class:
                     field = self.pait_model.default_field_class.from_pydantic_field(field)
                 elif default_field_class:
                     field = default_field_class.from_pydantic_field(field)
                 else:
                     continue
+                self._source_field_dict[id(field)] = source_field
             if not field.openapi_include:
                 continue
             if isinstance(field, BaseRequestResourceField) and field.alias:
@@ -135,7 +182,7 @@ class ParsePaitModel(object):
                         continue
                     if not pait_field.raw_return:
                         self._parse_base_model(
-                            create_pydantic_model(
+                            self._create_pydantic_model(
                                 {parameter.name: (parameter.annotation, pait_field)},
                                 class_name=(
                                     f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}"
@@ -192,7 +239,7 @@ class ParsePaitModel(object):
             for field_name, parameter in single_field_list:
                 field: BaseRequestResourceField = parameter.default
                 key: str = field.alias or parameter.name
-                annotation = parameter.annotation if not isinstance(field, File) else Any
+                annotation = field.get_openapi_annotation(parameter.annotation)
                 if key in _column_name_set:
                     # Since the same name cannot exist together in a Dict,
                     #  it will be parsed directly when a Key exists
@@ -200,7 +247,7 @@ class ParsePaitModel(object):
                     #  class Demo(BaseModel):
                     #      header_token: str = Header(alias="token")
                     #      query_token: str = Query(alias="token")
-                    _pydantic_model: Type[BaseModel] = create_pydantic_model(
+                    _pydantic_model: Type[BaseModel] = self._create_pydantic_model(
                         {parameter.name: (annotation, field)},
                         class_name=(
                             f"{self.pait_model.func_name.title()}"
@@ -212,13 +259,58 @@ class ParsePaitModel(object):
                     _column_name_set.add(key)
                     annotation_dict[parameter.name] = (annotation, field)
 
-            _pydantic_model = create_pydantic_model(
+            _pydantic_model = self._create_pydantic_model(
                 annotation_dict,
                 class_name=(f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}SingleFieldModel"),
             )
             self._parse_base_model(_pydantic_model)
 
 
+# Cache the parse result of each route, it is removed when the core model of the route is changed,
+# so the OpenAPI document only needs to parse the changed routes when it is regenerated
+_parse_pait_model_cache: "weakref.WeakKeyDictionary[PaitCoreModel, ParsePaitModel]" = weakref.WeakKeyDictionary()
+
+
+def _remove_parse_pait_model_cache(pait_model: PaitCoreModel, key: str, value: Any) -> None:
+    _parse_pait_model_cache.pop(pait_model, None)
+
+
+def get_parse_pait_model(pait_model: PaitCoreModel) -> ParsePaitModel:
+    """Get the parse result of the route, it will be parsed again only after the core model is changed"""
+    parse_pait_model: Optional[ParsePaitModel] = _parse_pait_model_cache.get(pait_model, None)
+    if parse_pait_model is None:
+        parse_pait_model = ParsePaitModel(pait_model)
+        if _remove_parse_pait_model_cache not in pait_model._change_notify_list:
+            pait_model.add_change_notify(_remove_parse_pait_model_cache)
+        _parse_pait_model_cache[pait_model] = parse_pait_model
+    return parse_pait_model
+
+
+def _reset_multiform_model(parse_pait_model: ParsePaitModel) -> None:
+    """any_api marks the multiform model after handling it (and skips the marked model),
+    and modifies the schema of the model in place (pydantic v1 caches the schema of the model),
+    so the state needs to be reset before the model is reused by the next OpenAPI document"""
+    for request_model in parse_pait_model.http_param_type_dict.get("multiform", []):
+        for model in request_model.model if isinstance(request_model.model, tuple) else (request_model.model,):
+            if "multiform_model_set" in model.__dict__:
+                delattr(model, "multiform_model_set")
+            if _pydanitc_adapter.is_v1:
+                model.__schema_cache__.clear()  # type: ignore[attr-defined]
+
+
+def _iter_encode(encoder: json.JSONEncoder, obj: Any, depth: int) -> Iterator[str]:
+    """Encode the dict level by level (e.g. path by path), and encode the deeper value in one go by the encoder"""
+    if depth <= 0 or not isinstance(obj, dict) or not obj:
+        yield from encoder.iterencode(obj)
+        return
+    first: bool = True
+    for key, value in sorted(obj.items()) if encoder.sort_keys else obj.items():
+        yield ("{" if first else encoder.item_separator) + encoder.encode(str(key)) + encoder.key_separator
+        yield from _iter_encode(encoder, value, depth - 1)
+        first = False
+    yield "}"
+
+
 class OpenAPI(object):
     load_app: staticmethod
 
@@ -248,7 +340,8 @@ class OpenAPI(object):
         for pait_id, pait_model in self._pait_dict.items():
             pait_model = PaitCoreProxyModel.get_core_model(pait_model)
             try:
-                parse_pait_model: ParsePaitModel = ParsePaitModel(pait_model)
+                parse_pait_model: ParsePaitModel = get_parse_pait_model(pait_model)
+                _reset_multiform_model(parse_pait_model)
                 api_model_list.append(
                     ApiModel(
                         path=pait_model.openapi_path,
@@ -287,3 +380,22 @@ class OpenAPI(object):
         if serialization_callback is json.dumps and "cls" not in kwargs:
             kwargs["cls"] = config.json_encoder
         return self._openapi.content(serialization_callback, **kwargs)
+
+    def iter_content(self, chunk_size: int = 64 * 1024, **kwargs: Any) -> Iterator[bytes]:
+        """Serialize the OpenAPI document to json incrementally (path by path),
+        and yield the utf-8 bytes in chunks of about `chunk_size`, without building the whole json string.
+
+        :param chunk_size: The size of each chunk
+        :param kwargs: The param of the json encoder, the same as `json.dumps`
+        """
+        encoder: json.JSONEncoder = kwargs.pop("cls", config.json_encoder)(**kwargs)
+        # The indented json needs the indent level of the parent, so it is encoded by the encoder in one go
+        depth: int = 3 if encoder.indent is None else 0
+        buffer: bytearray = bytearray()
+        for item in _iter_encode(encoder, self.dict, depth):
+            buffer += item.encode()
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
@@ -2,19 +2,52 @@ import asyncio
 import inspect
 import sys
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from contextvars import ContextVar
+from dataclasses import MISSING
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Self  # type: ignore
 
+from pait import _pydanitc_adapter
 from pait.exceptions import PaitBaseException
 from pait.field import resource_parse
 from pait.model.context import ContextModel
+from pait.param_handle.app_depend import AppDependCache, ContextManagerListType, async_exit_contextmanager_list
 from pait.param_handle.base import BaseParamHandler, raise_multiple_exc
+from pait.plugin.base import PluginEntryType
 from pait.util import gen_tip_exc, get_pait_handler, to_thread
 
 
 class AsyncParamHandleContext(ContextModel):
-    contextmanager_list: List[Union[AbstractAsyncContextManager, AbstractContextManager]]
+    contextmanager_list: ContextManagerListType
+
+
+# When depends are run concurrently, each of them collects the context managers it enters in its own list,
+# so that they can be registered in the declared order instead of the order in which they are completed.
+# It is also used to collect the context managers of app scope depends, which belong to the app.
+_concurrent_contextmanager_list_context: ContextVar[Optional[ContextManagerListType]] = ContextVar(
+    "_concurrent_contextmanager_list_context", default=None
+)
+
+
+def get_contextmanager_list(context: "AsyncParamHandleContext") -> ContextManagerListType:
+    contextmanager_list = _concurrent_contextmanager_list_context.get()
+    if contextmanager_list is None:
+        return context.contextmanager_list
+    return contextmanager_list
+
+
+async def _run_with_own_contextmanager_list(
+    coro: Awaitable,
+) -> Tuple[Any, Optional[Exception], ContextManagerListType]:
+    # Each coroutine run by `asyncio.gather` is wrapped in its own task (and its own copy of the context),
+    # so the context var set here is only visible to this depend
+    contextmanager_list: ContextManagerListType = []
+    _concurrent_contextmanager_list_context.set(contextmanager_list)
+    try:
+        return await coro, None, contextmanager_list
+    except Exception as e:
+        return None, e, contextmanager_list
 
 
 async def run_func(context: "AsyncParamHandleContext", func: Callable, *args: Any, **kwargs: Any) -> Any:
@@ -38,11 +71,15 @@ class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
         context: "AsyncParamHandleContext",
         _object: Any,
         prd: resource_parse.ParseResourceParamDcDict,
+        compiled_model_field: Optional[_pydanitc_adapter.PaitCompiledModelField] = None,
+        concurrent_depend_name_list: Optional[List[str]] = None,
     ) -> Tuple[List[Any], Dict[str, Any]]:
         args_param_list: List[Any] = []
         kwargs_param_dict: Dict[str, Any] = {}
 
         for param_name, pr in prd.items():
+            if concurrent_depend_name_list and param_name in concurrent_depend_name_list:
+                continue
             try:
                 value = pr.parse_resource_func(pr, context, self)
                 if asyncio.iscoroutine(value) or asyncio.isfuture(value) or asyncio.iscoroutinefunction(value):
@@ -59,12 +96,105 @@ class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
                     _object, e, pr.parameter, tip_exception_class=self.pait_core_model.tip_exception_class
                 )
 
+        if concurrent_depend_name_list:
+            exc_list: List[Exception] = []
+            result_list = await self.concurrent_depend_handle(
+                context, [prd[param_name].sub for param_name in concurrent_depend_name_list]
+            )
+            for param_name, (value, exc) in zip(concurrent_depend_name_list, result_list):
+                if exc is None:
+                    kwargs_param_dict[param_name] = value
+                elif isinstance(exc, PaitBaseException):
+                    exc_list.append(
+                        gen_tip_exc(
+                            _object,
+                            exc,
+                            prd[param_name].parameter,
+                            tip_exception_class=self.pait_core_model.tip_exception_class,
+                        )
+                    )
+                else:
+                    exc_list.append(exc)
+            raise_multiple_exc(exc_list)
+
+        if compiled_model_field:
+            # The value of the request field always in kwargs, validate them in a single pass
+            kwargs_param_dict.update(compiled_model_field.validate(kwargs_param_dict))
         return args_param_list, kwargs_param_dict
 
     async def depend_handle(
         self,
         context: "AsyncParamHandleContext",
         pld: "resource_parse.PreLoadDc",
+    ) -> Any:
+        if pld.app_depend_cache:
+            return await self.app_depend_handle(context, pld, pld.app_depend_cache)
+        if not pld.use_cache:
+            return await self._depend_handle(context, pld)
+        depend_cache = context.get_depend_cache()
+        key = id(pld.call_handler)
+        future: Optional[asyncio.Future] = depend_cache.get(key, None)
+        if future is not None:
+            # The depend is running or has been run (maybe in a concurrent depend), wait for its result
+            return await future
+
+        future = asyncio.get_running_loop().create_future()
+        depend_cache[key] = future
+        try:
+            value = await self._depend_handle(context, pld)
+        except Exception as e:
+            future.set_exception(e)
+            # The exception is raised by this call, no need to log it if no one else waits for the future
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            if not future.done():
+                # e.g. the task is cancelled
+                future.cancel()
+        return value
+
+    async def app_depend_handle(
+        self,
+        context: "AsyncParamHandleContext",
+        pld: "resource_parse.PreLoadDc",
+        app_depend_cache: AppDependCache,
+    ) -> Any:
+        value = app_depend_cache.get()
+        if value is not MISSING:
+            return value
+        future = app_depend_cache.future
+        if future is not None and not future.done():
+            # Other requests are running the depend, wait for its result instead of running it again
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        app_depend_cache.future = future
+        # The context managers entered by the depend belong to the app, not the request
+        contextmanager_list: ContextManagerListType = []
+        token = _concurrent_contextmanager_list_context.set(contextmanager_list)
+        try:
+            value = await self._depend_handle(context, pld)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            await async_exit_contextmanager_list(contextmanager_list, *sys.exc_info())
+            raise
+        else:
+            expired_contextmanager_list = app_depend_cache.set(value, contextmanager_list)
+            future.set_result(value)
+        finally:
+            _concurrent_contextmanager_list_context.reset(token)
+            if not future.done():
+                future.cancel()
+        await async_exit_contextmanager_list(expired_contextmanager_list)
+        return value
+
+    async def _depend_handle(
+        self,
+        context: "AsyncParamHandleContext",
+        pld: "resource_parse.PreLoadDc",
     ) -> Any:
         pait_handler = pld.call_handler
         if inspect.isclass(pait_handler):
@@ -78,24 +208,56 @@ class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
 
         # Get the real pait_handler of the depend class
         pait_handler = get_pait_handler(pait_handler)
-        _func_args, _func_kwargs = await self.prd_handle(context, pait_handler, pld.param)
+        _func_args, _func_kwargs = await self.prd_handle(
+            context, pait_handler, pld.param, pld.compiled_model_field, pld.concurrent_depend_name_list
+        )
         func_result = await run_func(context, pait_handler, *_func_args, **_func_kwargs)
+        # Only the context manager that has been entered needs to be exited
         if isinstance(func_result, AbstractAsyncContextManager):
-            context.contextmanager_list.append(func_result)
-            return await func_result.__aenter__()
+            value = await func_result.__aenter__()
+            get_contextmanager_list(context).append(func_result)
+            return value
         elif isinstance(func_result, AbstractContextManager):
-            context.contextmanager_list.append(func_result)
-            return await run_func(context, func_result.__enter__)
+            value = await run_func(context, func_result.__enter__)
+            get_contextmanager_list(context).append(func_result)
+            return value
         else:
             return func_result
 
+    async def concurrent_depend_handle(
+        self, context: "AsyncParamHandleContext", pld_list: List["resource_parse.PreLoadDc"]
+    ) -> List[Tuple[Any, Optional[Exception]]]:
+        """Run independent depends concurrently and return the (value, exception) of each depend in order.
+
+        The context managers entered by the depends are registered in the order of `pld_list`,
+        so the teardown order is the same as when the depends are run one by one.
+        """
+        result_list = await asyncio.gather(
+            *[_run_with_own_contextmanager_list(self.depend_handle(context, pld)) for pld in pld_list]
+        )
+        contextmanager_list = get_contextmanager_list(context)
+        value_list: List[Tuple[Any, Optional[Exception]]] = []
+        for value, exc, sub_contextmanager_list in result_list:
+            contextmanager_list.extend(sub_contextmanager_list)
+            value_list.append((value, exc))
+        return value_list
+
     async def _gen_param(self, context: "AsyncParamHandleContext") -> None:
         # check param from pre depend
-        for pre_depend_dc in self._pait_pre_depend_dc:
-            await self.depend_handle(context, pre_depend_dc)
+        if self.pait_core_model.concurrent_depend and len(self._pait_pre_depend_dc) > 1:
+            raise_multiple_exc(
+                [exc for _, exc in await self.concurrent_depend_handle(context, self._pait_pre_depend_dc) if exc]
+            )
+        else:
+            for pre_depend_dc in self._pait_pre_depend_dc:
+                await self.depend_handle(context, pre_depend_dc)
 
         context.args, context.kwargs = await self.prd_handle(
-            context, self._pait_pre_load_dc.call_handler, self._pait_pre_load_dc.param
+            context,
+            self._pait_pre_load_dc.call_handler,
+            self._pait_pre_load_dc.param,
+            self._pait_pre_load_dc.compiled_model_field,
+            self._pait_pre_load_dc.concurrent_depend_name_list,
         )
 
         if context.cbv_instance:
@@ -104,6 +266,23 @@ class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
             context.cbv_instance.__dict__.update(kwargs)
         return None
 
+    async def _simple_route_call(self, context: "ContextModel") -> Any:
+        """The route only uses the simple fields, so there is no context manager to exit"""
+        if context.cbv_instance:
+            return await self(context)
+        context.args, context.kwargs = await self.prd_handle(
+            context,  # type: ignore[arg-type]
+            self._pait_pre_load_dc.call_handler,
+            self._pait_pre_load_dc.param,
+            self._pait_pre_load_dc.compiled_model_field,
+        )
+        return await run_func(context, self.call_next, context)  # type: ignore[arg-type]
+
+    def get_entry(self) -> PluginEntryType:
+        if self._pait_simple_route and type(self).__call__ is AsyncParamHandler.__call__:
+            return self._simple_route_call
+        return super().get_entry()
+
     async def __call__(self, context: "ContextModel") -> Any:
         error: Optional[Exception] = None
         result: Any = None
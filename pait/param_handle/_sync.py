@@ -1,14 +1,18 @@
 import inspect
 import sys
 from contextlib import AbstractContextManager
+from dataclasses import MISSING
 from typing import Any, Dict, List, Optional, Tuple
 
 from typing_extensions import Self  # type: ignore
 
+from pait import _pydanitc_adapter
 from pait.exceptions import PaitBaseException
 from pait.field import resource_parse
 from pait.model.context import ContextModel
+from pait.param_handle.app_depend import AppDependCache, exit_contextmanager_list
 from pait.param_handle.base import BaseParamHandler, raise_multiple_exc
+from pait.plugin.base import PluginEntryType
 from pait.util import gen_tip_exc, get_pait_handler
 
 
@@ -22,6 +26,7 @@ class ParamHandler(BaseParamHandler[ParamHandleContext]):
         context: "ParamHandleContext",
         _object: Any,
         prd: resource_parse.ParseResourceParamDcDict,
+        compiled_model_field: Optional[_pydanitc_adapter.PaitCompiledModelField] = None,
     ) -> Tuple[List[Any], Dict[str, Any]]:
         args_param_list: List[Any] = []
         kwargs_param_dict: Dict[str, Any] = {}
@@ -38,12 +43,59 @@ class ParamHandler(BaseParamHandler[ParamHandleContext]):
                     _object, e, pr.parameter, tip_exception_class=self.pait_core_model.tip_exception_class
                 )
 
+        if compiled_model_field:
+            # The value of the request field always in kwargs, validate them in a single pass
+            kwargs_param_dict.update(compiled_model_field.validate(kwargs_param_dict))
         return args_param_list, kwargs_param_dict
 
     def depend_handle(
         self,
         context: "ParamHandleContext",
         pld: "resource_parse.PreLoadDc",
+    ) -> Any:
+        if pld.app_depend_cache:
+            return self.app_depend_handle(context, pld, pld.app_depend_cache)
+        if not pld.use_cache:
+            return self._depend_handle(context, pld)
+        depend_cache = context.get_depend_cache()
+        key = id(pld.call_handler)
+        if key not in depend_cache:
+            depend_cache[key] = self._depend_handle(context, pld)
+        return depend_cache[key]
+
+    def app_depend_handle(
+        self,
+        context: "ParamHandleContext",
+        pld: "resource_parse.PreLoadDc",
+        app_depend_cache: AppDependCache,
+    ) -> Any:
+        value = app_depend_cache.get()
+        if value is not MISSING:
+            return value
+        with app_depend_cache.lock:
+            # Other threads may have run the depend while waiting for the lock
+            value = app_depend_cache.get()
+            if value is not MISSING:
+                return value
+            # The context managers entered by the depend belong to the app, not the request
+            request_contextmanager_list = context.contextmanager_list
+            context.contextmanager_list = []
+            try:
+                value = self._depend_handle(context, pld)
+            except Exception:
+                exit_contextmanager_list(context.contextmanager_list, *sys.exc_info())
+                raise
+            else:
+                expired_contextmanager_list = app_depend_cache.set(value, context.contextmanager_list)
+            finally:
+                context.contextmanager_list = request_contextmanager_list
+        exit_contextmanager_list(expired_contextmanager_list)
+        return value
+
+    def _depend_handle(
+        self,
+        context: "ParamHandleContext",
+        pld: "resource_parse.PreLoadDc",
     ) -> Any:
         pait_handler = pld.call_handler
         if inspect.isclass(pait_handler):
@@ -57,7 +109,7 @@ class ParamHandler(BaseParamHandler[ParamHandleContext]):
 
         # Get the real pait_handler of the depend class
         pait_handler = get_pait_handler(pait_handler)
-        _func_args, _func_kwargs = self.prd_handle(context, pait_handler, pld.param)
+        _func_args, _func_kwargs = self.prd_handle(context, pait_handler, pld.param, pld.compiled_model_field)
         func_result: Any = pait_handler(*_func_args, **_func_kwargs)
         if isinstance(func_result, AbstractContextManager):
             context.contextmanager_list.append(func_result)
@@ -71,7 +123,10 @@ class ParamHandler(BaseParamHandler[ParamHandleContext]):
             self.depend_handle(context, pre_depend_dc)
 
         context.args, context.kwargs = self.prd_handle(
-            context, self._pait_pre_load_dc.call_handler, self._pait_pre_load_dc.param
+            context,
+            self._pait_pre_load_dc.call_handler,
+            self._pait_pre_load_dc.param,
+            self._pait_pre_load_dc.compiled_model_field,
         )
         if context.cbv_instance:
             prd = self.get_cbv_prd_from_context(context)
@@ -79,6 +134,25 @@ class ParamHandler(BaseParamHandler[ParamHandleContext]):
             context.cbv_instance.__dict__.update(kwargs)
         return None
 
+    def _simple_route_call(self, context: ContextModel) -> Any:
+        """The route only uses the simple fields, so there is no context manager to exit"""
+        if context.cbv_instance:
+            return self(context)
+        # The simple fields do not enter any context manager, so the `contextmanager_list` is not initialized
+        param_handle_context: ParamHandleContext = context  # type: ignore
+        context.args, context.kwargs = self.prd_handle(
+            param_handle_context,
+            self._pait_pre_load_dc.call_handler,
+            self._pait_pre_load_dc.param,
+            self._pait_pre_load_dc.compiled_model_field,
+        )
+        return self.call_next(context)
+
+    def get_entry(self) -> PluginEntryType:
+        if self._pait_simple_route and type(self).__call__ is ParamHandler.__call__:
+            return self._simple_route_call
+        return super().get_entry()
+
     def __call__(self, context: ContextModel) -> Any:
         error: Optional[Exception] = None
         result: Any = None
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import MISSING
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from pait.types import CallType
+
+__all__ = [
+    "AppDependCache",
+    "async_close_app_depend",
+    "async_exit_contextmanager_list",
+    "close_app_depend",
+    "exit_contextmanager_list",
+    "get_app_depend_cache",
+]
+
+ContextManagerType = Union[AbstractAsyncContextManager, AbstractContextManager]
+ContextManagerListType = List[ContextManagerType]
+# The sync param handler only collects the sync context managers
+_ContextManagerT = TypeVar("_ContextManagerT", bound=ContextManagerType)
+
+
+def exit_contextmanager_list(
+    contextmanager_list: List[_ContextManagerT], exc_type: Any = None, exc_val: Any = None, exc_tb: Any = None
+) -> None:
+    """Exit the context managers in the reverse order in which they were entered"""
+    while contextmanager_list:
+        contextmanager = contextmanager_list.pop()
+        if isinstance(contextmanager, AbstractContextManager):
+            contextmanager.__exit__(exc_type, exc_val, exc_tb)
+        else:
+            raise RuntimeError(f"Can not exit {contextmanager} in sync mode, please use `async_close_app_depend`")
+
+
+async def async_exit_contextmanager_list(
+    contextmanager_list: List[_ContextManagerT], exc_type: Any = None, exc_val: Any = None, exc_tb: Any = None
+) -> None:
+    """Exit the context managers in the reverse order in which they were entered"""
+    while contextmanager_list:
+        contextmanager = contextmanager_list.pop()
+        if isinstance(contextmanager, AbstractContextManager):
+            contextmanager.__exit__(exc_type, exc_val, exc_tb)
+        else:
+            await contextmanager.__aexit__(exc_type, exc_val, exc_tb)
+
+
+class AppDependCache(object):
+    """Cache the result of the depend whose scope is app.
+
+    The depend only runs once (or once every `ttl` seconds) and the result is shared by all requests.
+    The context managers entered by the depend (and its sub depends) are not exited at the end of the request,
+    but when the result expires or the app is shutdown.
+    """
+
+    def __init__(self, call_handler: CallType, ttl: Optional[float] = None) -> None:
+        self.call_handler: CallType = call_handler
+        self.ttl: Optional[float] = ttl
+        self.contextmanager_list: ContextManagerListType = []
+        # Make sure that only one thread or coroutine runs the depend at the same time
+        self.lock: threading.Lock = threading.Lock()
+        self.future: Optional[asyncio.Future] = None
+
+        self._value: Any = MISSING
+        self._expire_time: float = 0.0
+
+    def get(self) -> Any:
+        """return MISSING if the depend has not been run or the result has expired"""
+        if self.ttl is not None and self._expire_time <= time.monotonic():
+            return MISSING
+        return self._value
+
+    def set(self, value: Any, contextmanager_list: Sequence[ContextManagerType]) -> ContextManagerListType:
+        """Cache the new result, return the context managers of the expired result, the caller needs to exit them"""
+        expired_contextmanager_list = self.contextmanager_list
+        self._value = value
+        self.contextmanager_list = list(contextmanager_list)
+        if self.ttl is not None:
+            self._expire_time = time.monotonic() + self.ttl
+        return expired_contextmanager_list
+
+    def clear(self) -> ContextManagerListType:
+        """Clear the result, return the context managers of the result, the caller needs to exit them"""
+        self.future = None
+        return self.set(MISSING, [])
+
+
+_app_depend_cache_dict: Dict[Tuple[int, Optional[float]], AppDependCache] = {}
+
+
+def get_app_depend_cache(call_handler: CallType, ttl: Optional[float] = None) -> AppDependCache:
+    """The same depend callable (with the same ttl) shares the same cache in all routes"""
+    key = (id(call_handler), ttl)
+    if key not in _app_depend_cache_dict:
+        _app_depend_cache_dict[key] = AppDependCache(call_handler, ttl=ttl)
+    return _app_depend_cache_dict[key]
+
+
+def close_app_depend() -> None:
+    """Clear the result of all app scope depends and exit their context managers, usually called at app shutdown"""
+    for app_depend_cache in _app_depend_cache_dict.values():
+        exit_contextmanager_list(app_depend_cache.clear())
+
+
+async def async_close_app_depend() -> None:
+    """Clear the result of all app scope depends and exit their context managers, usually called at app shutdown"""
+    for app_depend_cache in _app_depend_cache_dict.values():
+        await async_exit_contextmanager_list(app_depend_cache.clear())
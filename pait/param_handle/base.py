@@ -1,11 +1,13 @@
 import inspect
-from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 from pydantic import BaseModel
 from typing_extensions import Self  # type: ignore
 
+from pait import _pydanitc_adapter
 from pait.exceptions import PaitBaseException
-from pait.field import BaseField, app, other, resource_parse
+from pait.field import BaseField, app, http, other, resource_parse
+from pait.param_handle.app_depend import get_app_depend_cache
 from pait.plugin.base import PluginProtocol
 from pait.types import CallType
 from pait.util import FuncSig, gen_tip_exc, get_func_sig, get_parameter_list_from_class
@@ -28,12 +30,30 @@ def raise_multiple_exc(exc_list: List[Exception]) -> None:
 
 
 _CtxT = TypeVar("_CtxT", bound="ContextModel")
+# These fields only read values from the request, and will not enter any context manager
+_simple_field_class_set: Set[Type[BaseField]] = {
+    http.Body,
+    http.Cookie,
+    http.File,
+    http.Form,
+    http.Header,
+    http.Json,
+    http.MultiForm,
+    http.MultiQuery,
+    http.Path,
+    http.Query,
+    other.PaitModelField,
+    other.RequestField,
+}
 
 
 class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
     is_async_mode: bool = False
     _pait_pre_load_dc: resource_parse.PreLoadDc
     _pait_pre_depend_dc: List[resource_parse.PreLoadDc]
+    # If True, the route only uses the simple fields (so there is no context manager to exit),
+    # and the param handler can use a faster call path
+    _pait_simple_route: bool
 
     @staticmethod
     def is_self_param(parameter: inspect.Parameter) -> bool:
@@ -134,6 +154,7 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
         context: _CtxT,
         _object: Union[FuncSig, Type, None],
         prd: resource_parse.ParseResourceParamDcDict,
+        compiled_model_field: Optional[_pydanitc_adapter.PaitCompiledModelField] = None,
     ) -> Tuple[List[Any], Dict[str, Any]]:
         raise NotImplementedError()
 
@@ -171,7 +192,14 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
     # pre load handler #
     ####################
     @classmethod
-    def depend_handler(cls, pait_core_model: "PaitCoreModel", func: CallType) -> resource_parse.PreLoadDc:
+    def depend_handler(
+        cls,
+        pait_core_model: "PaitCoreModel",
+        func: CallType,
+        use_cache: bool = True,
+        scope: app.DependScopeLiteral = "request",
+        ttl: Optional[float] = None,
+    ) -> resource_parse.PreLoadDc:
         """gen depend's pre-load dataclass"""
         func_sig: FuncSig = get_func_sig(func, cache_sig=False)
         func_class_prd = None
@@ -181,12 +209,67 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
                 func,
                 get_parameter_list_from_class(func),
             )
-        return resource_parse.PreLoadDc(
-            call_handler=func,  # depend func gen pait handler in pre-load
-            param=cls.get_param_rule_from_parameter_list(pait_core_model, func_sig.func, func_sig.param_list),
-            cbv_param=func_class_prd,
+        return cls.init_pre_load_dc(
+            pait_core_model,
+            resource_parse.PreLoadDc(
+                call_handler=func,  # depend func gen pait handler in pre-load
+                param=cls.get_param_rule_from_parameter_list(pait_core_model, func_sig.func, func_sig.param_list),
+                cbv_param=func_class_prd,
+                use_cache=use_cache,
+                app_depend_cache=get_app_depend_cache(func, ttl=ttl) if scope == "app" else None,
+            ),
+        )
+
+    @classmethod
+    def init_pre_load_dc(
+        cls, pait_core_model: "PaitCoreModel", pld: resource_parse.PreLoadDc
+    ) -> resource_parse.PreLoadDc:
+        """Optimize the pre-load dataclass according to the config of the route"""
+        return cls.concurrent_depend_pre_load_dc(pait_core_model, cls.compile_pre_load_dc(pait_core_model, pld))
+
+    @classmethod
+    def compile_pre_load_dc(
+        cls, pait_core_model: "PaitCoreModel", pld: resource_parse.PreLoadDc
+    ) -> resource_parse.PreLoadDc:
+        """If the route enable compiled validation, merge the validation of the request fields into one model"""
+        if not pait_core_model.compiled_validation:
+            return pld
+        call_handler = pld.call_handler
+        class_name = getattr(call_handler, "__name__", call_handler.__class__.__name__)
+        return resource_parse.compile_pre_load_dc(
+            pld, class_name=f"{class_name.title()}CompiledModel", is_async_mode=cls.is_async_mode
         )
 
+    @classmethod
+    def concurrent_depend_pre_load_dc(
+        cls, pait_core_model: "PaitCoreModel", pld: resource_parse.PreLoadDc
+    ) -> resource_parse.PreLoadDc:
+        """If the route enable concurrent depend, mark the Depends of the pre-load dataclass that can run concurrently.
+
+        The Depends params of the same function are independent of each other
+        (each one only relies on its own sub depends, which are resolved inside it),
+        so they form one level of the dependency graph.
+        """
+        if not (cls.is_async_mode and pait_core_model.concurrent_depend):
+            return pld
+        depend_name_list = [name for name, pr in pld.param.items() if isinstance(pr.parameter.default, app.Depends)]
+        if len(depend_name_list) > 1:
+            pld.concurrent_depend_name_list = depend_name_list
+        return pld
+
+    @classmethod
+    def is_simple_prd(
+        cls, pait_core_model: "PaitCoreModel", _object: Any, prd: resource_parse.ParseResourceParamDcDict
+    ) -> bool:
+        """Whether the param (and the sub param) only uses the simple fields"""
+        for pr in prd.values():
+            field_class = cls.get_field_from_parameter(pait_core_model, _object, pr.parameter)
+            if field_class not in _simple_field_class_set:
+                return False
+            if pr.sub.param and not cls.is_simple_prd(pait_core_model, pr.parameter.annotation, pr.sub.param):
+                return False
+        return True
+
     @classmethod
     def pre_load_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> Dict:
         super().pre_load_hook(pait_core_model, kwargs)
@@ -195,8 +278,14 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
         kwargs["_pait_pre_depend_dc"] = [
             cls.depend_handler(pait_core_model, pre_depend) for pre_depend in pait_core_model.pre_depend_list
         ]
-        kwargs["_pait_pre_load_dc"] = resource_parse.PreLoadDc(
-            call_handler=func_sig.func,
-            param=cls.get_param_rule_from_parameter_list(pait_core_model, func_sig.func, func_sig.param_list),
+        kwargs["_pait_pre_load_dc"] = cls.init_pre_load_dc(
+            pait_core_model,
+            resource_parse.PreLoadDc(
+                call_handler=func_sig.func,
+                param=cls.get_param_rule_from_parameter_list(pait_core_model, func_sig.func, func_sig.param_list),
+            ),
+        )
+        kwargs["_pait_simple_route"] = not kwargs["_pait_pre_depend_dc"] and cls.is_simple_prd(
+            pait_core_model, func_sig.func, kwargs["_pait_pre_load_dc"].param
         )
         return kwargs
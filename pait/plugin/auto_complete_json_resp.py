@@ -2,7 +2,7 @@ import copy
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 from pait.model.response import BaseResponseModel, JsonResponseModel
-from pait.plugin.base import GetPaitResponseModelFuncType, PrePluginProtocol
+from pait.plugin.base import GetPaitResponseModelFuncType, PluginEntryType, PrePluginProtocol
 from pait.util import get_pait_response_model as _get_pait_response_model
 
 if TYPE_CHECKING:
@@ -63,6 +63,9 @@ class AutoCompleteJsonRespPlugin(PrePluginProtocol):
         else:
             return self._sync_call(context)
 
+    def get_entry(self) -> PluginEntryType:
+        return self.get_sync_or_async_entry(AutoCompleteJsonRespPlugin)
+
     @classmethod
     def build(  # type: ignore
         cls,  # type: ignore
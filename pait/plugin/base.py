@@ -11,6 +11,14 @@ _PluginT = TypeVar("_PluginT", bound="PluginProtocol")
 _NextPluginT = Union[_PluginT, Callable]
 logger: logging.Logger = logging.getLogger(__name__)
 GetPaitResponseModelFuncType = Callable[[List[Type["BaseResponseModel"]]], Type["BaseResponseModel"]]
+PluginEntryType = Callable[["PluginContext"], Any]
+
+
+def gen_route_entry(func: Callable) -> PluginEntryType:
+    def route_entry(context: "PluginContext") -> Any:
+        return func(*context.args, **context.kwargs)
+
+    return route_entry
 
 
 class PluginProtocol(object):
@@ -26,6 +34,10 @@ class PluginProtocol(object):
                 if getattr(self, k, None) is not None:
                     continue
                 setattr(self, k, v)
+        # How to call the next plugin is resolved once at build time, instead of being checked on every call
+        self.call_next: PluginEntryType = (
+            next_plugin.get_entry() if isinstance(next_plugin, PluginProtocol) else gen_route_entry(next_plugin)
+        )
         self.__post_init__(**kwargs)
 
     def __post_init__(self, **kwargs: Any) -> None:
@@ -56,10 +68,18 @@ class PluginProtocol(object):
 
     def __call__(self, context: "PluginContext") -> Any:
         """The entry function called by the plugin."""
-        if isinstance(self.next_plugin, PluginProtocol):
-            return self.next_plugin(context)
-        else:
-            return self.next_plugin(*context.args, **context.kwargs)
+        return self.call_next(context)
+
+    def get_entry(self) -> PluginEntryType:
+        """Return the function called by the previous plugin (or the route dispatch), it is resolved at build time"""
+        return self.__call__
+
+    def get_sync_or_async_entry(self, plugin_class: Type["PluginProtocol"]) -> PluginEntryType:
+        """The `__call__` of `plugin_class` only selects `_async_call` or `_sync_call` according to `is_async_mode`,
+        if the plugin does not override it, the variant can be selected at build time"""
+        if type(self).__call__ is plugin_class.__call__:
+            return getattr(self, "_async_call" if self.is_async_mode else "_sync_call")
+        return self.__call__
 
 
 class PrePluginProtocol(PluginProtocol):
@@ -1,10 +1,47 @@
+import asyncio
+import hashlib
+import json
+import math
 import pickle
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Type, Union
+import random
+import string
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent import futures
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import MISSING
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
+from pydantic import BaseModel
 from redis.asyncio import Redis  # type: ignore
 from redis.asyncio import Redis as AsyncioRedis
+from redis.client import NEVER_DECODE  # type: ignore
 
-from pait.app.any import set_app_attribute
+from pait._pydanitc_adapter import model_dump
+from pait.app.any import get_app_attribute, set_app_attribute
 from pait.field import BaseRequestResourceField, ExtraParam
 from pait.g import get_ctx
 from pait.model.response import FileResponseModel
@@ -18,36 +55,762 @@ if TYPE_CHECKING:
 
 
 class CacheRespExtraParam(ExtraParam):
-    pass
+    """The cache key only includes the value of the parameters with `CacheRespExtraParam`
+    (the parameter can be any field, such as `Header` (e.g. Accept-Language) or `Cookie`)"""
+
+
+# The value of these types are converted to the cache key by `str`
+_str_key_type_set: Set[type] = {str, int, float, bool, type(None)}
+
+
+def _canonical_key_value(value: Any) -> Any:
+    """Convert the value to the JSON-serializable value, and the value of the same content is the same"""
+    if type(value) in _str_key_type_set:
+        return value
+    if isinstance(value, BaseModel):
+        return _canonical_key_value(model_dump(value))
+    if isinstance(value, Mapping):
+        return {str(k): _canonical_key_value(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical_key_value(i) for i in value), key=_dumps_key_value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical_key_value(i) for i in value]
+    return str(value)
+
+
+def _dumps_key_value(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def gen_cache_key_part(value: Any) -> str:
+    """Convert the value of the route function's parameter to the part of the cache key"""
+    if type(value) in _str_key_type_set:
+        return str(value)
+    value = _canonical_key_value(value)
+    return value if isinstance(value, str) else _dumps_key_value(value)
+
+
+# The cached value that supports refresh starts with the tag, followed by the time it is fresh until
+# and the time (seconds) it took to generate
+refresh_tag: bytes = b"s"
+_refresh_header_size: int = 1 + struct.calcsize("!dd")
+
+
+class BaseCacheSerializer(object):
+    """Convert the response of the route to bytes that can be stored in the cache backend, and vice versa"""
+
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        raise NotImplementedError
+
+
+class PickleCacheSerializer(BaseCacheSerializer):
+    """Serialize any value by pickle"""
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value)
+
+    # The old version of the plugin stored the pickle data as a latin1 str by the redis client with
+    # `decode_responses=True`, so the redis stored its utf-8 encoding (the pickle data starts with b"\x80")
+    legacy_prefix: bytes = "\x80".encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, bytes) and data[:2] == self.legacy_prefix:
+            data = data.decode("utf-8")
+        if isinstance(data, str):
+            # The value cached by the old version of the plugin
+            data = data.encode("latin1")
+        return pickle.loads(data)
+
+
+class CacheSerializer(PickleCacheSerializer):
+    """The default serializer, the cached data starts with a tag that marks the format of the data:
+
+    - JSON: The pydantic model, it is stored as JSON with the import path of its class, and is loaded as the
+        same model class, so the route returns the same type whether the cache is hit or not.
+        The model whose class can not be imported (e.g. defined in a function) is stored by pickle.
+    - Response: The rendered response of the web framework, the body is stored as-is with status and headers,
+        so the cache hit does not need to render the response again. The web framework's plugin implements
+        `dump_response` and `load_response`.
+    - Pickle: The other values (such as dict and exception), in CPython, pickle loads the builtin types faster
+        than json.
+    - Compressed: If the size of the data is larger than `compress_min_size`, the data is compressed by zlib.
+    """
+
+    json_tag: bytes = b"j"
+    response_tag: bytes = b"r"
+    pickle_tag: bytes = b"p"
+    compress_tag: bytes = b"z"
+
+    def __init__(self, compress_min_size: Optional[int] = None, compress_level: int = 6) -> None:
+        """
+        :param compress_min_size: The data larger than this size (bytes) will be compressed, None means not compress
+        :param compress_level: The zlib compress level
+        """
+        self.compress_min_size: Optional[int] = compress_min_size
+        self.compress_level: int = compress_level
+        self._model_class_dict: Dict[str, Type[BaseModel]] = {}
+
+    def dump_response(self, value: Any) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        """return the status code, headers and body of the web framework response, return None if it is not a
+        response object that can be dumped"""
+        return None
+
+    def load_response(self, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> Any:
+        raise NotImplementedError
+
+    def _get_model_class(self, model_path: str) -> Type[BaseModel]:
+        model_class: Optional[Type[BaseModel]] = self._model_class_dict.get(model_path, None)
+        if model_class is None:
+            module_name, _, qualname = model_path.partition(":")
+            value: Any = import_module(module_name)
+            for name in qualname.split("."):
+                value = getattr(value, name)
+            model_class = self._model_class_dict[model_path] = value
+        return model_class
+
+    def _dump_json(self, value: Any) -> Optional[bytes]:
+        if not isinstance(value, BaseModel):
+            return None
+        model_class: Type[BaseModel] = type(value)
+        model_path: str = f"{model_class.__module__}:{model_class.__qualname__}"
+        try:
+            if self._get_model_class(model_path) is not model_class:
+                return None
+            model_dict: dict = model_dump(value, by_alias=True)
+            # Only the model that can be rebuilt as the same value is stored as JSON
+            if model_class(**model_dict) != value:
+                return None
+            return json.dumps([model_path, model_dict], separators=(",", ":")).encode()
+        except (ImportError, AttributeError, TypeError, ValueError):
+            # e.g. the model is defined in a function or has the datetime field
+            return None
+
+    def dumps(self, value: Any) -> bytes:
+        data: Optional[bytes] = self._dump_json(value)
+        if data is not None:
+            data = self.json_tag + data
+        else:
+            response_info = self.dump_response(value)
+            if response_info is not None:
+                status_code, headers, body = response_info
+                meta: bytes = json.dumps([status_code, headers], separators=(",", ":")).encode()
+                data = self.response_tag + struct.pack("!I", len(meta)) + meta + body
+            else:
+                data = self.pickle_tag + super().dumps(value)
+        if self.compress_min_size is not None and len(data) > self.compress_min_size:
+            data = self.compress_tag + zlib.compress(data, self.compress_level)
+        return data
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, str):
+            return super().loads(data)
+        tag: bytes = data[:1]
+        if tag == self.compress_tag:
+            data = zlib.decompress(memoryview(data)[1:])
+            tag = data[:1]
+        if tag == self.json_tag:
+            model_path, model_dict = json.loads(data[1:])
+            return self._get_model_class(model_path)(**model_dict)
+        elif tag == self.response_tag:
+            (meta_size,) = struct.unpack_from("!I", data, 1)
+            status_code, headers = json.loads(data[5 : 5 + meta_size])
+            return self.load_response(status_code, [(key, value) for key, value in headers], data[5 + meta_size :])
+        elif tag == self.pickle_tag:
+            return pickle.loads(memoryview(data)[1:])
+        # The value cached by the old version of the plugin
+        return super().loads(data)
+
+
+class LocalCache(object):
+    """The in-process cache in front of redis, it is used to cache the response of the hot key.
+
+    The cache is a LRU cache with ttl, and the total size of the cached value will not exceed `max_size` (bytes).
+    When multiple requests miss the same key at the same time, only one of them calls the loader,
+    and the others wait for its result (single-flight).
+    """
+
+    def __init__(self, max_size: int = 16 * 1024 * 1024, ttl: float = 1.0) -> None:
+        """
+        :param max_size: The max total size (bytes) of the cached value
+        :param ttl: The time (seconds) the value is cached in the process
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self.size: int = 0
+        # The number of requests that get the value from the local cache (including waiting for the loading value)
+        self.hit_count: int = 0
+        # The number of requests that call the loader
+        self.miss_count: int = 0
+
+        self._lock: threading.Lock = threading.Lock()
+        # key: (expire time, value, size)
+        self._cache_dict: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._future_dict: Dict[str, futures.Future] = {}
+        self._async_future_dict: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def get_size(value: Any) -> int:
+        if isinstance(value, (str, bytes)):
+            return len(value)
+        return sys.getsizeof(value)
+
+    def get(self, key: str) -> Any:
+        """return MISSING if the key not found or the value is expired"""
+        with self._lock:
+            item = self._cache_dict.get(key, None)
+            if item is None:
+                return MISSING
+            if item[0] <= time.monotonic():
+                self._pop(key)
+                return MISSING
+            self._cache_dict.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: Any) -> None:
+        size: int = self.get_size(value)
+        with self._lock:
+            self._pop(key)
+            if size > self.max_size:
+                return
+            while self._cache_dict and self.size + size > self.max_size:
+                self._pop(next(iter(self._cache_dict)))
+            self._cache_dict[key] = (time.monotonic() + self.ttl, value, size)
+            self.size += size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache_dict.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        item = self._cache_dict.pop(key, None)
+        if item is not None:
+            self.size -= item[2]
+
+    def get_or_load(self, key: str, loader: Callable[[], Tuple[Any, Any]]) -> Tuple[Any, Any]:
+        """Get the value from the local cache, if not found, call the loader (only one thread calls it at the same time)
+
+        The loader returns the value to be cached and the extra result,
+        the extra result is MISSING if the value is not returned by the loader of this call.
+        """
+        value: Any = self.get(key)
+        if value is MISSING:
+            with self._lock:
+                future: Optional[futures.Future] = self._future_dict.get(key, None)
+                is_loader: bool = future is None
+                if future is None:
+                    future = self._future_dict[key] = futures.Future()
+            if is_loader:
+                self.miss_count += 1
+                try:
+                    value, result = loader()
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise e
+                else:
+                    self.set(key, value)
+                    future.set_result(value)
+                    return value, result
+                finally:
+                    with self._lock:
+                        self._future_dict.pop(key, None)
+            value = future.result()
+        self.hit_count += 1
+        return value, MISSING
+
+    async def async_get_or_load(self, key: str, loader: Callable[[], Awaitable[Tuple[Any, Any]]]) -> Tuple[Any, Any]:
+        """Get the value from the local cache, if not found, call the loader (only one coroutine calls it at the same
+        time)"""
+        value: Any = self.get(key)
+        if value is MISSING:
+            future: Optional[asyncio.Future] = self._async_future_dict.get(key, None)
+            if future is None:
+                self.miss_count += 1
+                future = self._async_future_dict[key] = asyncio.get_running_loop().create_future()
+                try:
+                    value, result = await loader()
+                except BaseException as e:
+                    future.set_exception(e)
+                    # Avoid the warning of `Future exception was never retrieved` if no one is waiting
+                    future.exception()
+                    raise e
+                else:
+                    self.set(key, value)
+                    future.set_result(value)
+                    return value, result
+                finally:
+                    self._async_future_dict.pop(key, None)
+            value = await asyncio.shield(future)
+        self.hit_count += 1
+        return value, MISSING
+
+
+# The number of keys deleted (or scanned) by one redis command
+_redis_batch_size: int = 500
+
+
+def _escape_redis_pattern(pattern: str) -> str:
+    for char in "\\*?[]":
+        pattern = pattern.replace(char, "\\" + char)
+    return pattern
+
+
+def _is_lock_key(name: str, key: str) -> bool:
+    """The lock key of the route is `{name}:lock` or `{name}:lock:{params}`, see CacheResponsePlugin._gen_key"""
+    lock_name: str = name + ":lock"
+    return key == lock_name or key.startswith(lock_name + ":")
+
+
+class BaseCacheBackend(object):
+    """The storage of CacheResponsePlugin, the sync method is used by the sync route,
+    and the async method is used by the async route"""
+
+    # The prefix of the key that stores the cache keys of the tag
+    tag_key_prefix: str = "pait_cache_tag:"
+
+    def get(self, key: str) -> Any:
+        """return None (or an empty value) if the key not found"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        """Set the value of the key, it will expire after `ex` seconds (if ex is not None)"""
+        raise NotImplementedError
+
+    def lock(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> ContextManager:
+        """The lock that ensures only one request calls the route function when the cache is missing"""
+        raise NotImplementedError
+
+    def try_lock(self, name: str, timeout: Optional[float] = None) -> Optional[Callable[[], Any]]:
+        """Try to acquire the lock without blocking, return the function that releases the lock,
+        or None if the lock is held by others. It is used to refresh the stale (or about to expire) cache"""
+        raise NotImplementedError
+
+    def add_tag(self, key: str, tag_list: List[str], ex: Optional[int] = None) -> None:
+        """Record the key in the index of each tag, so that it can be deleted by `invalidate_tag`"""
+        raise NotImplementedError
+
+    def invalidate_tag(self, *tag: str) -> int:
+        """Delete all the cache of the tags, return the number of deleted keys"""
+        raise NotImplementedError
+
+    def invalidate_name(self, *name: str) -> int:
+        """Delete all the cache of the routes (the cache key starts with the `name` of the CacheResponsePlugin),
+        return the number of deleted keys"""
+        raise NotImplementedError
+
+    async def async_get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    async def async_set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def async_add_tag(self, key: str, tag_list: List[str], ex: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def async_invalidate_tag(self, *tag: str) -> int:
+        raise NotImplementedError
+
+    async def async_invalidate_name(self, *name: str) -> int:
+        raise NotImplementedError
+
+    def async_lock(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> AsyncContextManager:
+        raise NotImplementedError
+
+    async def async_try_lock(self, name: str, timeout: Optional[float] = None) -> Optional[Callable[[], Awaitable]]:
+        raise NotImplementedError
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """Use redis as the storage, the sync route should use `redis.Redis` and the async route should use
+    `redis.asyncio.Redis`"""
+
+    def __init__(self, redis: Union[Redis, AsyncioRedis]) -> None:
+        self.check_redis(redis)
+        self.redis: Union[Redis, AsyncioRedis] = redis
+
+    @staticmethod
+    def check_redis(redis: Union[Redis, AsyncioRedis]) -> None:
+        if redis.connection_pool.connection_kwargs["decode_responses"] is False:
+            raise ValueError("Please set redis`s param:decode_responses to True")
+
+    def get(self, key: str) -> Any:
+        # Get the raw bytes even if the param decode_responses of redis is True
+        return self.redis.execute_command("GET", key, **{NEVER_DECODE: []})
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        self.redis.set(key, value, ex=ex)
+
+    def lock(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> ContextManager:
+        return self.redis.lock(name, timeout=timeout, sleep=sleep, blocking_timeout=blocking_timeout)
+
+    def try_lock(self, name: str, timeout: Optional[float] = None) -> Optional[Callable[[], Any]]:
+        lock = self.redis.lock(name, timeout=timeout)
+        return lock.release if lock.acquire(blocking=False) else None
+
+    def add_tag(self, key: str, tag_list: List[str], ex: Optional[int] = None) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        for tag in tag_list:
+            pipe.sadd(self.tag_key_prefix + tag, key)
+            pipe.ttl(self.tag_key_prefix + tag)
+        result_list: list = pipe.execute()
+        if ex:
+            # The index of the tag lives as long as the longest-lived key in it (ttl is -1 if it is new)
+            for tag, ttl in zip(tag_list, result_list[1::2]):
+                if ttl < ex:
+                    pipe.expire(self.tag_key_prefix + tag, ex)
+            pipe.execute()
+
+    def invalidate_tag(self, *tag: str) -> int:
+        pipe = self.redis.pipeline(transaction=True)
+        for _tag in tag:
+            pipe.smembers(self.tag_key_prefix + _tag)
+            pipe.delete(self.tag_key_prefix + _tag)
+        key_set: Set[str] = set()
+        for member_set in pipe.execute()[::2]:
+            key_set.update(member_set)
+        return self._delete_key_list(list(key_set))
+
+    def invalidate_name(self, *name: str) -> int:
+        key_list: List[str] = []
+        for _name in name:
+            key_list.append(_name)
+            for key in self.redis.scan_iter(match=_escape_redis_pattern(_name) + ":*", count=_redis_batch_size):
+                if not _is_lock_key(_name, key):
+                    key_list.append(key)
+        return self._delete_key_list(key_list)
+
+    def _delete_key_list(self, key_list: List[str]) -> int:
+        count: int = 0
+        for index in range(0, len(key_list), _redis_batch_size):
+            count += self.redis.delete(*key_list[index : index + _redis_batch_size])
+        return count
+
+    async def async_get(self, key: str) -> Any:
+        return await self.redis.execute_command("GET", key, **{NEVER_DECODE: []})
+
+    async def async_set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        await self.redis.set(key, value, ex=ex)  # type: ignore
+
+    def async_lock(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> AsyncContextManager:
+        return self.redis.lock(name, timeout=timeout, sleep=sleep, blocking_timeout=blocking_timeout)
+
+    async def async_try_lock(self, name: str, timeout: Optional[float] = None) -> Optional[Callable[[], Awaitable]]:
+        lock = self.redis.lock(name, timeout=timeout)
+        return lock.release if await lock.acquire(blocking=False) else None
+
+    async def async_add_tag(self, key: str, tag_list: List[str], ex: Optional[int] = None) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        for tag in tag_list:
+            pipe.sadd(self.tag_key_prefix + tag, key)
+            pipe.ttl(self.tag_key_prefix + tag)
+        result_list: list = await pipe.execute()
+        if ex:
+            for tag, ttl in zip(tag_list, result_list[1::2]):
+                if ttl < ex:
+                    pipe.expire(self.tag_key_prefix + tag, ex)
+            await pipe.execute()
+
+    async def async_invalidate_tag(self, *tag: str) -> int:
+        pipe = self.redis.pipeline(transaction=True)
+        for _tag in tag:
+            pipe.smembers(self.tag_key_prefix + _tag)
+            pipe.delete(self.tag_key_prefix + _tag)
+        key_set: Set[str] = set()
+        for member_set in (await pipe.execute())[::2]:
+            key_set.update(member_set)
+        return await self._async_delete_key_list(list(key_set))
+
+    async def async_invalidate_name(self, *name: str) -> int:
+        key_list: List[str] = []
+        for _name in name:
+            key_list.append(_name)
+            async for key in self.redis.scan_iter(match=_escape_redis_pattern(_name) + ":*", count=_redis_batch_size):
+                if not _is_lock_key(_name, key):
+                    key_list.append(key)
+        return await self._async_delete_key_list(key_list)
+
+    async def _async_delete_key_list(self, key_list: List[str]) -> int:
+        count: int = 0
+        for index in range(0, len(key_list), _redis_batch_size):
+            count += await self.redis.delete(*key_list[index : index + _redis_batch_size])
+        return count
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """Use the memory of the process as the storage, it is suitable for single node deployment and testing.
+
+    Note: The lock only works in the current process, and the `timeout` and `sleep` params of the lock are ignored
+    """
+
+    def __init__(self) -> None:
+        # key: (expire time, value)
+        self._cache_dict: Dict[str, Tuple[Optional[float], Any]] = {}
+        self._purge_size: int = 1024
+        self._lock: threading.Lock = threading.Lock()
+        # name: (lock, the number of requests that use the lock)
+        self._lock_dict: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._async_lock_dict: Dict[str, Tuple[asyncio.Lock, int]] = {}
+        # tag: cache keys
+        self._tag_dict: Dict[str, Set[str]] = {}
+
+    def _purge_expired(self) -> None:
+        now: float = time.monotonic()
+        for key in [key for key, (expire_time, _) in self._cache_dict.items() if expire_time and expire_time <= now]:
+            self._cache_dict.pop(key, None)
+        for tag in list(self._tag_dict.keys()):
+            key_set = {key for key in self._tag_dict[tag] if key in self._cache_dict}
+            if key_set:
+                self._tag_dict[tag] = key_set
+            else:
+                self._tag_dict.pop(tag, None)
+
+    def get(self, key: str) -> Any:
+        item = self._cache_dict.get(key, None)
+        if item is None:
+            return None
+        expire_time, value = item
+        if expire_time and expire_time <= time.monotonic():
+            self._cache_dict.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        with self._lock:
+            if len(self._cache_dict) >= self._purge_size:
+                # Clean up the expired keys, so that the memory will not grow indefinitely
+                self._purge_expired()
+                self._purge_size = max(len(self._cache_dict) * 2, 1024)
+            self._cache_dict[key] = (time.monotonic() + ex if ex else None, value)
+
+    def delete(self, key: str) -> None:
+        self._cache_dict.pop(key, None)
+
+    def add_tag(self, key: str, tag_list: List[str], ex: Optional[int] = None) -> None:
+        with self._lock:
+            for tag in tag_list:
+                self._tag_dict.setdefault(tag, set()).add(key)
+
+    def _delete_key_list(self, key_list: Iterable[str]) -> int:
+        return len([key for key in key_list if self._cache_dict.pop(key, None) is not None])
+
+    def invalidate_tag(self, *tag: str) -> int:
+        with self._lock:
+            key_set: Set[str] = set()
+            for _tag in tag:
+                key_set.update(self._tag_dict.pop(_tag, ()))
+            return self._delete_key_list(key_set)
+
+    def invalidate_name(self, *name: str) -> int:
+        with self._lock:
+            return self._delete_key_list(
+                [
+                    key
+                    for key in list(self._cache_dict.keys())
+                    for _name in name
+                    if key == _name or (key.startswith(_name + ":") and not _is_lock_key(_name, key))
+                ]
+            )
+
+    @contextmanager
+    def lock(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> Iterator[None]:
+        with self._lock:
+            lock, count = self._lock_dict.get(name, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._lock_dict[name] = (lock, count + 1)
+        try:
+            if not lock.acquire(timeout=-1 if blocking_timeout is None else blocking_timeout):
+                raise TimeoutError(f"Unable to acquire lock:{name} within {blocking_timeout} seconds")
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            self._unref_lock(name)
+
+    def _unref_lock(self, name: str) -> None:
+        with self._lock:
+            lock, count = self._lock_dict[name]
+            if count <= 1:
+                self._lock_dict.pop(name, None)
+            else:
+                self._lock_dict[name] = (lock, count - 1)
+
+    def try_lock(self, name: str, timeout: Optional[float] = None) -> Optional[Callable[[], Any]]:
+        with self._lock:
+            if name in self._lock_dict:
+                return None
+            lock: threading.Lock = threading.Lock()
+            lock.acquire()
+            self._lock_dict[name] = (lock, 1)
+
+        def release() -> None:
+            lock.release()
+            self._unref_lock(name)
+
+        return release
+
+    async def async_get(self, key: str) -> Any:
+        return self.get(key)
+
+    async def async_set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        self.set(key, value, ex=ex)
+
+    async def async_add_tag(self, key: str, tag_list: List[str], ex: Optional[int] = None) -> None:
+        self.add_tag(key, tag_list, ex=ex)
+
+    async def async_invalidate_tag(self, *tag: str) -> int:
+        return self.invalidate_tag(*tag)
+
+    async def async_invalidate_name(self, *name: str) -> int:
+        return self.invalidate_name(*name)
+
+    @asynccontextmanager
+    async def async_lock(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        lock, count = self._async_lock_dict.get(name, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._async_lock_dict[name] = (lock, count + 1)
+        try:
+            try:
+                await asyncio.wait_for(lock.acquire(), blocking_timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Unable to acquire lock:{name} within {blocking_timeout} seconds")
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            self._unref_async_lock(name)
+
+    def _unref_async_lock(self, name: str) -> None:
+        lock, count = self._async_lock_dict[name]
+        if count <= 1:
+            self._async_lock_dict.pop(name, None)
+        else:
+            self._async_lock_dict[name] = (lock, count - 1)
+
+    async def async_try_lock(self, name: str, timeout: Optional[float] = None) -> Optional[Callable[[], Awaitable]]:
+        if name in self._async_lock_dict:
+            return None
+        lock: asyncio.Lock = asyncio.Lock()
+        await lock.acquire()
+        self._async_lock_dict[name] = (lock, 1)
+
+        async def release() -> None:
+            lock.release()
+            self._unref_async_lock(name)
+
+        return release
 
 
 class CacheResponsePlugin(PostPluginProtocol):
     _cache_plugin_redis_key: str = "_cache_plugin_redis"
+    _cache_plugin_backend_key: str = "_cache_plugin_backend"
     _cache_name_param_set: Set[str] = set()
 
     name: str
     lock_name: str
     include_exc: Optional[Tuple[Type[Exception]]] = None
     redis: Union[Redis, AsyncioRedis, None] = None
+    backend: Optional[BaseCacheBackend] = None
+    serializer: Optional[BaseCacheSerializer] = None
     enable_cache_name_merge_param: bool
     cache_time: Optional[int]
+    stale_time: Optional[int] = None
+    early_refresh_beta: Optional[float] = None
     timeout: Optional[float]
     sleep: Optional[float]
     blocking_timeout: Optional[float]
+    local_cache: Optional[LocalCache] = None
+    max_key_length: Optional[int] = None
+    tag_list: Optional[List[str]] = None
 
     def __post_init__(self, **kwargs: Any) -> None:
         self.lock_name: str = self.name + ":" + "lock"
         self._cache_name_param_set = kwargs.pop("_cache_name_param_set")
+        # Sort the parameter names so that the key is the same in different processes
+        self._cache_name_param_list: List[str] = sorted(self._cache_name_param_set)
+        if self.backend is None and self.redis is not None:
+            self.backend = RedisCacheBackend(self.redis)
+        if self.serializer is None:
+            self.serializer = self.default_serializer()
+        # If True, the cached value carries the time it is fresh until and the time it took to generate,
+        # so that the request can decide whether to refresh it
+        self._enable_refresh: bool = bool(self.stale_time or self.early_refresh_beta)
+        self._backend_cache_time: Optional[int] = (
+            self.cache_time + self.stale_time if self.cache_time and self.stale_time else self.cache_time
+        )
+
+    @classmethod
+    def default_serializer(cls) -> BaseCacheSerializer:
+        """The serializer used when the `serializer` param is not set, the web framework's plugin can override it"""
+        return CacheSerializer()
 
     @classmethod
     def check_redis(cls, redis: Union[Redis, AsyncioRedis]) -> None:
-        if redis.connection_pool.connection_kwargs["decode_responses"] is False:
-            raise ValueError("Please set redis`s param:decode_responses to True")
+        RedisCacheBackend.check_redis(redis)
 
     @classmethod
     def set_redis_to_app(cls, app: Any, redis: Union[Redis, AsyncioRedis]) -> None:
-        cls.check_redis(redis)
-        set_app_attribute(app, cls._cache_plugin_redis_key, redis)
+        cls.set_backend_to_app(app, RedisCacheBackend(redis))
+
+    @classmethod
+    def set_backend_to_app(cls, app: Any, backend: BaseCacheBackend) -> None:
+        set_app_attribute(app, cls._cache_plugin_backend_key, backend)
+
+    @classmethod
+    def get_backend_from_app(cls, app: Any) -> BaseCacheBackend:
+        """Get the backend set by `set_backend_to_app` (or `set_redis_to_app`), it can be used to invalidate
+        the cache, e.g: `CacheResponsePlugin.get_backend_from_app(app).invalidate_tag("user:1")`"""
+        return get_app_attribute(app, cls._cache_plugin_backend_key)
 
     @classmethod
     def pre_check_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> None:
@@ -60,6 +823,8 @@ class CacheResponsePlugin(PostPluginProtocol):
                 f"{cls.__name__} not support {FileResponseModel.__class__.__name__}"
             )
         if kwargs.get("redis", None) is not None:
+            if kwargs.get("backend", None) is not None:
+                raise ValueError("Only one of redis and backend can be set")
             cls.check_redis(kwargs["redis"])
         return None
 
@@ -79,98 +844,190 @@ class CacheResponsePlugin(PostPluginProtocol):
             for extra_param in default.extra_param_list:
                 if not isinstance(extra_param, CacheRespExtraParam):
                     continue
-                cache_name_param_set.add(default.alias or param.name)
+                # The key of the route function's kwargs is the name of the parameter, not the alias
+                cache_name_param_set.add(param.name)
         kwargs["_cache_name_param_set"] = cache_name_param_set
+
+        param_name_set: Set[str] = {param.name for param in fun_sig.param_list}
+        for tag in kwargs.get("tag_list", None) or []:
+            for _, field_name, _, _ in string.Formatter().parse(tag):
+                if field_name is None:
+                    continue
+                if field_name.split(".")[0].split("[")[0] not in param_name_set:
+                    raise ValueError(
+                        f"Can not found param:{field_name} of tag:{tag} in {pait_core_model.func.__qualname__}"
+                    )
         return kwargs
 
-    def _get_redis(self) -> Union[Redis, AsyncioRedis]:
-        redis: Union[Redis, AsyncioRedis, None] = self.redis or get_ctx().app_helper.get_attributes(
-            self._cache_plugin_redis_key, None
-        )
+    def _get_backend(self) -> BaseCacheBackend:
+        if self.backend:
+            return self.backend
+        app_helper = get_ctx().app_helper
+        backend: Optional[BaseCacheBackend] = app_helper.get_attributes(self._cache_plugin_backend_key, None)
+        if backend:
+            return backend
+        redis: Union[Redis, AsyncioRedis, None] = app_helper.get_attributes(self._cache_plugin_redis_key, None)
         if not redis:
-            raise ValueError("Not found redis client")  # pragma: no cover
-        return redis
+            raise ValueError("Not found cache backend")  # pragma: no cover
+        return RedisCacheBackend(redis)
 
     def _loads(self, response: Any, *args: Any, **kwargs: Any) -> Any:
-        return pickle.loads(response.encode("latin1"))
+        return self.serializer.loads(response)  # type: ignore[union-attr]
 
     def _dumps(self, response: Any, *args: Any, **kwargs: Any) -> Any:
-        return pickle.dumps(response).decode("latin1")
+        return self.serializer.dumps(response)  # type: ignore[union-attr]
 
     def _gen_key(self, *args: Any, **kwargs: Any) -> Tuple[str, str]:
         real_key: str = self.name
         real_lock_key: str = self.lock_name
         if self.enable_cache_name_merge_param:
-            args_key_list: list = [str(i) for i in args] if args else []
+            args_key_list: list = [gen_cache_key_part(i) for i in args] if args else []
             if kwargs:
-                if self._cache_name_param_set:
-                    for key in self._cache_name_param_set:
-                        args_key_list.append(str(kwargs[key]))
+                if self._cache_name_param_list:
+                    for key in self._cache_name_param_list:
+                        args_key_list.append(gen_cache_key_part(kwargs[key]))
                 else:
                     for value in kwargs.values():
-                        args_key_list.append(str(value))
+                        args_key_list.append(gen_cache_key_part(value))
             if args_key_list:
                 key_join_str = ":".join(args_key_list)
+                if self.max_key_length and len(key_join_str) > self.max_key_length:
+                    # Keep the name in the key, so the keys of the route can still be found by the prefix
+                    key_join_str = hashlib.blake2b(key_join_str.encode(), digest_size=16).hexdigest()
                 real_key = f"{self.name}:{key_join_str}"
                 real_lock_key = f"{self.lock_name}:{key_join_str}"
         return real_key, real_lock_key
 
+    def _gen_tag_list(self, **kwargs: Any) -> List[str]:
+        return [tag.format(**kwargs) for tag in self.tag_list]  # type: ignore[union-attr]
+
+    def _pack(self, data: Any, duration: float) -> Any:
+        if not self._enable_refresh:
+            return data
+        return refresh_tag + struct.pack("!dd", time.time() + (self.cache_time or 0), duration) + data
+
+    def _unpack(self, value: Any) -> Any:
+        # Only the value cached with the refresh header starts with the tag, other values may start with the same byte
+        if self._enable_refresh and isinstance(value, bytes) and value[:1] == refresh_tag:
+            return value[_refresh_header_size:]
+        return value
+
+    def _need_refresh(self, value: Any) -> bool:
+        """Whether the cached value is stale, or is about to expire (probabilistic early refresh, see XFetch)"""
+        if not self._enable_refresh or not isinstance(value, bytes) or value[:1] != refresh_tag:
+            return False
+        fresh_until, duration = struct.unpack_from("!dd", value, 1)
+        now: float = time.time()
+        if now >= fresh_until:
+            return True
+        if self.early_refresh_beta:
+            return now - duration * self.early_refresh_beta * math.log(1 - random.random()) >= fresh_until
+        return False
+
+    async def _async_refresh(
+        self, context: "PluginContext", backend: BaseCacheBackend, real_key: str
+    ) -> Tuple[Any, Any]:
+        start_time: float = time.monotonic()
+        try:
+            result = await super().__call__(context)
+        except Exception as e:
+            if self.include_exc and isinstance(e, self.include_exc):
+                result = e
+            else:
+                raise e
+        value = self._pack(self._dumps(result, *context.args, **context.kwargs), time.monotonic() - start_time)
+        await backend.async_set(real_key, value, ex=self._backend_cache_time)
+        if self.tag_list:
+            await backend.async_add_tag(real_key, self._gen_tag_list(**context.kwargs), ex=self._backend_cache_time)
+        return value, result
+
+    async def _async_load(self, context: "PluginContext", real_key: str, real_lock_key: str) -> Tuple[Any, Any]:
+        """return the cached value (dumps result) and the result of the route (MISSING if the value is from backend)"""
+        backend: BaseCacheBackend = self._get_backend()
+        value: Any = await backend.async_get(real_key)
+        if value:
+            if self._need_refresh(value):
+                # Only one request refreshes the value, and the other requests return the stale value
+                release = await backend.async_try_lock(real_lock_key, timeout=self.timeout)
+                if release is not None:
+                    try:
+                        return await self._async_refresh(context, backend, real_key)
+                    finally:
+                        await release()
+            return value, MISSING
+        async with backend.async_lock(
+            real_lock_key,
+            timeout=self.timeout,
+            sleep=self.sleep,
+            blocking_timeout=self.blocking_timeout,
+        ):
+            value = await backend.async_get(real_key)
+            if value:
+                return value, MISSING
+            return await self._async_refresh(context, backend, real_key)
+
     async def _async_cache(self, context: "PluginContext") -> Any:
         real_key, real_lock_key = self._gen_key(*context.args, **context.kwargs)
-        redis: AsyncioRedis = self._get_redis()
-        result: Any = await redis.get(real_key)
-        if result:
-            result = self._loads(result, *context.args, **context.kwargs)
+        if self.local_cache is None:
+            value, result = await self._async_load(context, real_key, real_lock_key)
         else:
-            async with redis.lock(
-                real_lock_key,
-                timeout=self.timeout,
-                sleep=self.sleep,
-                blocking_timeout=self.blocking_timeout,
-            ):
-                result = await redis.get(real_key)
-                if result:
-                    result = self._loads(result, *context.args, **context.kwargs)
-                else:
-                    try:
-                        result = await super().__call__(context)
-                    except Exception as e:
-                        if self.include_exc and isinstance(e, self.include_exc):
-                            result = e
-                        else:
-                            raise e
-                    await redis.set(  # type: ignore
-                        real_key, self._dumps(result, *context.args, **context.kwargs), ex=self.cache_time
-                    )
+            value, result = await self.local_cache.async_get_or_load(
+                real_key, lambda: self._async_load(context, real_key, real_lock_key)
+            )
+        if result is MISSING:
+            result = self._loads(self._unpack(value), *context.args, **context.kwargs)
         if isinstance(result, Exception):
             raise result
         return result
 
+    def _refresh(self, context: "PluginContext", backend: BaseCacheBackend, real_key: str) -> Tuple[Any, Any]:
+        start_time: float = time.monotonic()
+        try:
+            result = super().__call__(context)
+        except Exception as e:
+            if self.include_exc and isinstance(e, self.include_exc):
+                result = e
+            else:
+                raise e
+        value = self._pack(self._dumps(result, *context.args, **context.kwargs), time.monotonic() - start_time)
+        backend.set(real_key, value, ex=self._backend_cache_time)
+        if self.tag_list:
+            backend.add_tag(real_key, self._gen_tag_list(**context.kwargs), ex=self._backend_cache_time)
+        return value, result
+
+    def _load(self, context: "PluginContext", real_key: str, real_lock_key: str) -> Tuple[Any, Any]:
+        """return the cached value (dumps result) and the result of the route (MISSING if the value is from backend)"""
+        backend: BaseCacheBackend = self._get_backend()
+        value: Any = backend.get(real_key)
+        if value:
+            if self._need_refresh(value):
+                # Only one request refreshes the value, and the other requests return the stale value
+                release = backend.try_lock(real_lock_key, timeout=self.timeout)
+                if release is not None:
+                    try:
+                        return self._refresh(context, backend, real_key)
+                    finally:
+                        release()
+            return value, MISSING
+        with backend.lock(
+            real_lock_key,
+            timeout=self.timeout,
+            sleep=self.sleep,
+            blocking_timeout=self.blocking_timeout,
+        ):
+            value = backend.get(real_key)
+            if value:
+                return value, MISSING
+            return self._refresh(context, backend, real_key)
+
     def _cache(self, context: "PluginContext") -> Any:
         real_key, real_lock_key = self._gen_key(*context.args, **context.kwargs)
-        redis: Redis = self._get_redis()
-        result: Any = redis.get(real_key)
-        if result:
-            result = self._loads(result, *context.args, **context.kwargs)
+        if self.local_cache is None:
+            value, result = self._load(context, real_key, real_lock_key)
         else:
-            with redis.lock(
-                real_lock_key,
-                timeout=self.timeout,
-                sleep=self.sleep,
-                blocking_timeout=self.blocking_timeout,
-            ):
-                result = redis.get(real_key)
-                if result:
-                    result = self._loads(result, *context.args, **context.kwargs)
-                else:
-                    try:
-                        result = super().__call__(context)
-                    except Exception as e:
-                        if self.include_exc and isinstance(e, self.include_exc):
-                            result = e
-                        else:
-                            raise e
-                    redis.set(real_key, self._dumps(result, *context.args, **context.kwargs), ex=self.cache_time)
+            value, result = self.local_cache.get_or_load(real_key, lambda: self._load(context, real_key, real_lock_key))
+        if result is MISSING:
+            result = self._loads(self._unpack(value), *context.args, **context.kwargs)
         if isinstance(result, Exception):
             raise result
         return result
@@ -186,32 +1043,64 @@ class CacheResponsePlugin(PostPluginProtocol):
         cls,
         *,
         redis: Union[Redis, AsyncioRedis, None] = None,
+        backend: Optional[BaseCacheBackend] = None,
+        serializer: Optional[BaseCacheSerializer] = None,
         include_exc: Optional[Tuple[Type[Exception]]] = None,
         name: str = "",
         enable_cache_name_merge_param: bool = False,
         cache_time: Optional[int] = None,
+        stale_time: Optional[int] = None,
+        early_refresh_beta: Optional[float] = None,
         timeout: Optional[float] = None,
         sleep: Optional[float] = None,
         blocking_timeout: Optional[float] = None,
+        local_cache: Optional[LocalCache] = None,
+        max_key_length: Optional[int] = None,
+        tag_list: Optional[List[str]] = None,
     ) -> "PluginManager":  # type: ignore
         """
-        :param redis: redis client
+        :param redis: redis client, it is equivalent to `backend=RedisCacheBackend(redis)`
+        :param backend: The storage of the cache, default is the backend (or redis) set by `set_backend_to_app`
+            (or `set_redis_to_app`)
+        :param serializer: Convert the response to bytes stored in the backend, default is `CacheSerializer`
+            (the web framework's plugin will use the `CacheSerializer` that supports the framework's response)
         :param include_exc: Exception types that support caching
         :param name: cache key name
         :param enable_cache_name_merge_param:
             Whether to distinguish between different caches by the parameters received by the routing function
         :param cache_time: cache time
+        :param stale_time: After the cache time, the stale response can still be returned for `stale_time` seconds,
+            during this time, only one request refreshes the cache and the other requests return the stale response
+            instead of waiting for the lock.
+        :param early_refresh_beta: If set, the cache may be refreshed by one request before it expires,
+            the probability increases as the expiration time approaches and the time the route takes increases
+            (the greater the beta, the earlier the refresh, 1.0 is a good default).
         :param timeout: redis lock timeout param
         :param sleep: redis lock sleep param
         :param blocking_timeout: redis lock blocking_timeout param
+        :param local_cache: The in-process cache in front of redis, it can be shared by multiple routes.
+            Note: The response may be cached in the process for `local_cache.ttl` seconds after redis is changed
+        :param max_key_length: If the parameters part of the cache key is longer than this value,
+            it will be replaced by its hash value (32 characters), None (the default) means no limit.
+            Note: Enabling it changes the keys of the cache whose parameters part is longer than the value
+        :param tag_list: The tags of the cache, the tag can be a template formatted by the parameters of
+            the route function, e.g: `user:{uid}`. All the cache of the tag can be deleted by
+            `backend.invalidate_tag`, and all the cache of the route can be deleted by `backend.invalidate_name`
         """
         return super().build(
             name=name,
             redis=redis,
+            backend=backend,
+            serializer=serializer,
             include_exc=include_exc,
             enable_cache_name_merge_param=enable_cache_name_merge_param,
             cache_time=cache_time or 5 * 60,
+            stale_time=stale_time,
+            early_refresh_beta=early_refresh_beta,
             timeout=timeout,
             sleep=sleep,
             blocking_timeout=blocking_timeout,
+            local_cache=local_cache,
+            max_key_length=max_key_length,
+            tag_list=tag_list,
         )
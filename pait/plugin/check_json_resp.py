@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type
 
 from pait.model.response import BaseResponseModel, JsonResponseModel
-from pait.plugin.base import GetPaitResponseModelFuncType, PrePluginProtocol
+from pait.plugin.base import GetPaitResponseModelFuncType, PluginEntryType, PrePluginProtocol
 from pait.util import get_pait_response_model as _get_pait_response_model
 
 if TYPE_CHECKING:
@@ -58,6 +58,9 @@ class CheckJsonRespPlugin(PrePluginProtocol):
         else:
             return self._sync_call(context)
 
+    def get_entry(self) -> PluginEntryType:
+        return self.get_sync_or_async_entry(CheckJsonRespPlugin)
+
     @classmethod
     def build(  # type: ignore
         cls,  # type: ignore
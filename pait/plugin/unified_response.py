@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 from pait.model.core import PaitCoreModel
 from pait.model.response import BaseResponseModel, FileResponseModel, JsonResponseModel
-from pait.plugin.base import GetPaitResponseModelFuncType, PluginManager, PrePluginProtocol
+from pait.plugin.base import GetPaitResponseModelFuncType, PluginEntryType, PluginManager, PrePluginProtocol
 from pait.util import get_pait_response_model as _get_pait_response_model
 
 if TYPE_CHECKING:
@@ -43,6 +43,9 @@ class UnifiedResponsePlugin(UnifiedResponsePluginProtocol, metaclass=ABCMeta):
             return self._async_call(context)
         return self._sync_call(context)
 
+    def get_entry(self) -> PluginEntryType:
+        return self.get_sync_or_async_entry(UnifiedResponsePlugin)
+
     def _sync_call(self, context: "PluginContext") -> Any:
         response: Any = super(UnifiedResponsePlugin, self).__call__(context)
         return self._gen_response(response, context)
@@ -595,6 +595,89 @@ class BaseTest(object):
                 file_dict={"stream": f},
             ).json()
 
+    def multipart_limit_route(self, route: Callable, ignore_path: bool = False) -> None:
+        with NamedTemporaryFile(delete=True) as f:
+            f.write(b"Hello Word!" * 50)
+            f.seek(0)
+            assert {
+                "filename": f.name.split("/")[-1] if ignore_path else f.name,
+                "length": 550,
+                "coalesced": True,
+            } == self.test_helper(self.client, route, file_dict={"stream": f}).json()
+
+        # The body is larger than the `max_body_size`(1024 bytes) of the stream
+        with NamedTemporaryFile(delete=True) as f:
+            f.write(b"Hello Word!" * 100)
+            f.seek(0)
+            test_helper = self.test_helper(self.client, route, file_dict={"stream": f})
+            resp = test_helper.post()
+            assert 413 == test_helper._get_status_code(resp)
+            assert "Request body is larger than 1024 bytes" in test_helper._get_text(resp)
+
+    def multipart_save_route(self, route: Callable, ignore_path: bool = False) -> None:
+        file_content: bytes = b"Hello Word!" * 1000
+        with NamedTemporaryFile(delete=True) as f:
+            f.write(file_content)
+            f.seek(0)
+            assert {
+                "filename": f.name.split("/")[-1] if ignore_path else f.name,
+                "size": len(file_content),
+                "file_size": len(file_content),
+                "checksum": {
+                    "sha256": hashlib.sha256(file_content).hexdigest(),
+                    "md5": hashlib.md5(file_content).hexdigest(),
+                },
+            } == self.test_helper(self.client, route, file_dict={"stream": f}).json()
+
+    def multipart_parts_route(self, route: Callable, ignore_path: bool = False) -> None:
+        with NamedTemporaryFile(delete=True) as f1, NamedTemporaryFile(delete=True) as f2:
+            f1.write(b"Hello Word!")
+            f1.seek(0)
+            f2.write(b"Hello Pait!!")
+            f2.seek(0)
+            assert {
+                "form": {"a": "1", "b": "2"},
+                "file": {
+                    "stream": {"filename": f1.name.split("/")[-1] if ignore_path else f1.name, "length": 11},
+                    "other": {"filename": f2.name.split("/")[-1] if ignore_path else f2.name, "length": 12},
+                },
+            } == self.test_helper(
+                self.client,
+                route,
+                form_dict={"a": "1", "b": "2"},
+                file_dict={"stream": f1, "other": f2},
+                strict_inspection_check_json_content=False,
+            ).json()
+
+    def multipart_multi_file_route(self, route: Callable, ignore_path: bool = False) -> None:
+        with NamedTemporaryFile(delete=True) as f1, NamedTemporaryFile(delete=True) as f2:
+            f1.write(b"Hello Word!")
+            f1.seek(0)
+            f2.write(b"Hello Pait!!")
+            f2.seek(0)
+            assert {
+                "avatar": {"filename": f1.name.split("/")[-1] if ignore_path else f1.name, "length": 11},
+                "doc": {"filename": f2.name.split("/")[-1] if ignore_path else f2.name, "length": 12},
+            } == self.test_helper(
+                self.client,
+                route,
+                form_dict={"a": "1"},
+                file_dict={"avatar": f1, "doc": f2},
+                strict_inspection_check_json_content=False,
+            ).json()
+
+        # The stream parameters must be read in the order of the parts in the body
+        with NamedTemporaryFile(delete=True) as f1, NamedTemporaryFile(delete=True) as f2:
+            assert (
+                self.test_helper(
+                    self.client,
+                    route,
+                    file_dict={"doc": f2, "avatar": f1},
+                    strict_inspection_check_json_content=False,
+                ).json()["msg"]
+                == "The part `doc` has been skipped, please read the parts in the order of the request body"
+            )
+
     def api_route_health(self, route: Callable) -> None:
         assert self.test_helper(self.client, route).json() == {"code": 0, "msg": "ok", "data": {}}
 
@@ -1088,13 +1088,26 @@ class _TestOtherOpenAPI(BasicTestOpenAPI):
     def test_file_route(self) -> None:
         stream_for_data_dict = self.pait_openapi.model.paths.pop("/api/file/stream-for-data")
         multipart_dict = self.pait_openapi.model.paths.pop("/api/file/multipart")
+        multipart_limit_dict = self.pait_openapi.model.paths.pop("/api/file/multipart-limit")
+        multipart_save_dict = self.pait_openapi.model.paths.pop("/api/file/multipart-save")
 
-        for file_route_dict in [stream_for_data_dict, multipart_dict]:
+        for file_route_dict in [stream_for_data_dict, multipart_dict, multipart_limit_dict, multipart_save_dict]:
             assert file_route_dict["post"].tags == ["field"]
             assert file_route_dict["post"].pait_info["group"] == "file"
             assert file_route_dict["post"].pait_info["status"] == "release"
             assert "stream" in file_route_dict["post"].request_body.content["multipart/form-data"].schema_["properties"]
 
+        multipart_parts_dict = self.pait_openapi.model.paths.pop("/api/file/multipart-parts")
+        assert (
+            "stream" in multipart_parts_dict["post"].request_body.content["multipart/form-data"].schema_["properties"]
+        )
+        json_lines_dict = self.pait_openapi.model.paths.pop("/api/file/json-lines")
+        assert "application/x-ndjson" in json_lines_dict["post"].request_body.content
+        multipart_multi_file_dict = self.pait_openapi.model.paths.pop("/api/file/multipart-multi-file")
+        assert {"avatar", "doc"} == set(
+            multipart_multi_file_dict["post"].request_body.content["multipart/form-data"].schema_["properties"]
+        )
+
 
 class BaseTestOpenAPI(
     _TestDependOpenAPI, _TestFieldOpenAPI, _TestSecurityOpenAPI, _TestResponseOpenAPI, _TestOtherOpenAPI
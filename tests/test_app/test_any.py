@@ -150,6 +150,16 @@ def demo() -> Any:
 empty_simple_route: SimpleRoute = SimpleRoute(url="/", methods=["get"], route=demo)
 
 
+class TestAppDepend(BaseTestApp):
+    def test_add_app_depend_shutdown_hook(self, mocker: MockFixture) -> None:
+        for i in app_list:
+            patch = mocker.patch(f"pait.app.{i}.add_app_depend_shutdown_hook")
+            any.add_app_depend_shutdown_hook(
+                importlib.import_module(f"example.{i}_example.main_example").create_app()  # type: ignore
+            )
+            patch.assert_called()
+
+
 class TestAttribute(BaseTestApp):
     def test_set_app_attribute(self, mocker: MockFixture) -> None:
         for i in app_list:
@@ -1,10 +1,14 @@
 import difflib
 import json
+import os
 import random
+import stat
 import sys
 from contextlib import contextmanager
 from functools import partial
-from typing import Callable, Generator, Optional, Type
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Generator, List, Optional, Type
 from unittest import mock
 
 import pytest
@@ -20,9 +24,11 @@ from pait.app.any import get_app_attribute, set_app_attribute
 from pait.app.base.simple_route import SimpleRoute
 from pait.app.flask import TestHelper as _TestHelper
 from pait.app.flask import add_multi_simple_route, add_simple_route, load_app, pait
+from pait.g import pait_data
 from pait.model import response
 from pait.model.context import ContextModel
-from pait.openapi.doc_route import default_doc_fn_dict
+from pait.openapi.build import build_openapi, write_openapi_file
+from pait.openapi.doc_route import AddDocRoute, default_doc_fn_dict
 from pait.openapi.openapi import InfoModel, OpenAPI, ServerModel
 from tests.conftest import enable_plugin
 from tests.test_app.base_api_test import BaseTest
@@ -174,6 +180,55 @@ class TestFlask:
                 > 0.95
             )
 
+            resp = client.get("/openapi.json?pin-code=6666")
+            etag = resp.headers["ETag"]
+            assert client.get("/openapi.json?pin-code=6666", headers={"If-None-Match": etag}).status_code == 304
+            assert client.get("/openapi.json?pin-code=6666", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+            resp = client.get("/openapi.json?pin-code=6666&template-token=xxx", headers={"If-None-Match": etag})
+            assert resp.status_code == 200 and resp.headers["ETag"] != etag
+
+    def test_doc_route_cache(self) -> None:
+        with client_ctx() as client:
+            doc_route = AddDocRoute(app=client.application, prefix="/cache-doc", title="Cache Doc")
+            version = pait_data.version
+            content = client.get("/cache-doc/openapi.json").get_data()
+            # The document is cached with the version read before it is generated
+            assert [i[0] for i in doc_route._openapi_cache.values()] == [version]
+            if version != pait_data.version:
+                # The first `load_app` updated the pait data, so the document is generated again
+                assert client.get("/cache-doc/openapi.json").get_data() == content
+            with mock.patch.object(doc_route, "openapi") as patch_openapi:
+                assert client.get("/cache-doc/openapi.json").get_data() == content
+                patch_openapi.assert_not_called()
+            assert [i[0] for i in doc_route._openapi_cache.values()] == [pait_data.version]
+
+            # The document is regenerated after the pait data is changed
+            pait_data.version += 1
+            with mock.patch.object(doc_route, "openapi", wraps=doc_route.openapi) as patch_openapi:
+                assert client.get("/cache-doc/openapi.json").status_code == 200
+                patch_openapi.assert_called_once()
+            assert [i[0] for i in doc_route._openapi_cache.values()] == [pait_data.version]
+
+    def test_doc_route_by_openapi_file(self, tmp_path: Path) -> None:
+        with client_ctx() as client:
+            openapi_file = str(tmp_path / "openapi.json")
+            write_openapi_file(build_openapi(client.application, title="Offline Doc").content(), openapi_file)
+            doc_route = AddDocRoute(
+                app=client.application, prefix="/file-doc", title="File Doc", openapi_file=openapi_file
+            )
+            with mock.patch.object(doc_route, "openapi") as patch_openapi:
+                resp = client.get("/file-doc/openapi.json")
+                patch_openapi.assert_not_called()
+            with open(openapi_file, "rb") as f:
+                assert resp.get_data() == f.read()
+            # The file has the same mode as the file created by `open`, not the private mode of the temporary file
+            umask: int = os.umask(0)
+            os.umask(umask)
+            assert stat.S_IMODE(os.stat(openapi_file).st_mode) == 0o666 & ~umask
+            assert (resp.get_json() or {})["info"]["title"] == "Offline Doc"
+            resp = client.get("/file-doc/openapi.json", headers={"If-None-Match": resp.headers["ETag"]})
+            assert resp.status_code == 304
+
     def test_auto_load_app_class(self) -> None:
         for i in auto_load_app.app_list:
             sys.modules.pop(i, None)
@@ -338,7 +393,7 @@ class TestFlask:
             assert result.json == {"demo": 1}
 
             class HeaderModel(BaseModel):
-                demo: str = Field(alias="x-demo", example="123")  # type:ignore[call-arg]
+                demo: str = Field(alias="x-demo", example="123")  # type: ignore[call-arg]
 
             class MyHtmlResponseModel(response.HtmlResponseModel):
                 media_type = "application/demo"
@@ -385,6 +440,46 @@ class TestFlask:
         base_test.file_route(main_example.stream_for_data_route)
         base_test.file_route(main_example.multipart_route)
 
+    def test_multipart_limit_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_limit_route(main_example.multipart_limit_route)
+
+    def test_stream_read_size(self, client: FlaskClient, mocker: MockFixture) -> None:
+        from pait.app.flask.adapter.request import Request
+        from pait.extra.field.stream.by_multipart import MultipartReader
+        from pait.extra.field.stream.util import BaseStream
+
+        file_content: bytes = b"Hello Word!" * 50000
+        stream_spy = mocker.spy(Request, "stream")
+        parse_spy = mocker.spy(MultipartReader, "_parse")
+        for url in ("/api/file/multipart", "/api/file/stream-for-data"):
+            resp = client.post(url, data={"stream": (BytesIO(file_content), "demo.txt")})
+            assert (resp.get_json() or {})["length"] == len(file_content)
+        # The request body is read by chunks of `read_size` instead of a single chunk of the whole body
+        assert [call.args[1:] for call in stream_spy.call_args_list] == [(BaseStream.read_size,)] * 2
+        chunk_size_list: List[int] = [len(call.args[1]) for call in parse_spy.call_args_list]
+        assert max(chunk_size_list) <= BaseStream.read_size
+        assert len([i for i in chunk_size_list if i]) > len(file_content) // BaseStream.read_size
+
+    def test_multipart_save_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_save_route(main_example.multipart_save_route)
+
+    def test_json_lines_route(self, client: FlaskClient) -> None:
+        body: bytes = (
+            b'{"uid": 100, "user_name": "so1n"}\n{"uid": 5, "user_name": "so1n"}\nnot json\n\n{"uid": 200, "user_name": "so1n"}'
+        )
+        resp_dict: dict = (
+            client.post("/api/file/json-lines", data=body, content_type="application/x-ndjson").get_json() or {}
+        )
+        assert resp_dict["uid_list"] == [100, 200]
+        # The invalid lines are skipped and collected
+        assert [i.split(":")[0] for i in resp_dict["error_list"]] == ["line 2", "line 3"]
+
+    def test_multipart_parts_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_parts_route(main_example.multipart_parts_route)
+
+    def test_multipart_multi_file_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_multi_file_route(main_example.multipart_multi_file_route)
+
     def test_api_route(self, base_test: BaseTest) -> None:
         from example.flask_example.api_route import APIRouteCBV, get_user_info, health, login
 
@@ -170,6 +170,10 @@ class TestSanic:
                 > 0.95
             )
 
+            etag = client.get("/openapi.json?pin-code=6666")[1].headers["ETag"]
+            assert client.get("/openapi.json?pin-code=6666", headers={"If-None-Match": etag})[1].status_code == 304
+            assert client.get("/openapi.json?pin-code=6666", headers={"If-None-Match": "*"})[1].status_code == 304
+
     def test_text_response(self, client: SanicTestClient) -> None:
         response_test_helper(client, main_example.text_response_route, response.TextResponseModel)
 
@@ -262,6 +266,29 @@ class TestSanic:
         base_test.file_route(main_example.stream_for_data_route, ignore_path=True)
         base_test.file_route(main_example.multipart_route, ignore_path=True)
 
+    def test_multipart_limit_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_limit_route(main_example.multipart_limit_route, ignore_path=True)
+
+    def test_multipart_save_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_save_route(main_example.multipart_save_route, ignore_path=True)
+
+    def test_json_lines_route(self, client: SanicTestClient) -> None:
+        body: bytes = (
+            b'{"uid": 100, "user_name": "so1n"}\n{"uid": 5, "user_name": "so1n"}\nnot json\n\n{"uid": 200, "user_name": "so1n"}'
+        )
+        resp_dict: dict = client.post(
+            "/api/file/json-lines", content=body, headers={"content-type": "application/x-ndjson"}
+        )[1].json
+        assert resp_dict["uid_list"] == [100, 200]
+        # The invalid lines are skipped and collected
+        assert [i.split(":")[0] for i in resp_dict["error_list"]] == ["line 2", "line 3"]
+
+    def test_multipart_parts_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_parts_route(main_example.multipart_parts_route, ignore_path=True)
+
+    def test_multipart_multi_file_route(self, base_test: BaseTest) -> None:
+        base_test.multipart_multi_file_route(main_example.multipart_multi_file_route, ignore_path=True)
+
     def test_api_key_route(self, base_test: BaseTest) -> None:
         base_test.api_key_route(main_example.api_key_cookie_route, {"cookie_dict": {"token": "my-token"}})
         base_test.api_key_route(main_example.api_key_header_route, {"header_dict": {"token": "my-token"}})
@@ -1,5 +1,7 @@
+import asyncio
 import difflib
 import json
+import pickle
 import random
 import sys
 from functools import partial
@@ -17,7 +19,7 @@ from pait.app import auto_load_app
 from pait.app.any import get_app_attribute, set_app_attribute
 from pait.app.base.simple_route import SimpleRoute
 from pait.app.tornado import TestHelper as _TestHelper
-from pait.app.tornado import add_multi_simple_route, add_simple_route, load_app, pait
+from pait.app.tornado import add_app_depend_shutdown_hook, add_multi_simple_route, add_simple_route, load_app, pait
 from pait.model import response
 from pait.openapi.doc_route import default_doc_fn_dict
 from pait.openapi.openapi import InfoModel, OpenAPI, ServerModel
@@ -132,6 +134,12 @@ class TestTornado(BaseTestTornado):
             > 0.95
         )
 
+        response = self.fetch("/openapi.json?pin-code=6666")
+        assert response.headers["Content-Type"] == "application/json"
+        etag = response.headers["ETag"]
+        assert self.fetch("/openapi.json?pin-code=6666", headers={"If-None-Match": etag}).code == 304
+        assert self.fetch("/openapi.json?pin-code=6666", headers={"If-None-Match": '"a"'}).code == 200
+
     def test_auto_load_app_class(self) -> None:
         for i in auto_load_app.app_list:
             sys.modules.pop(i, None)
@@ -325,6 +333,67 @@ class TestTornado(BaseTestTornado):
             app="tornado",
         )
 
+    def test_cache_response_with_old_version_value(self) -> None:
+        from tornado.httputil import HTTPHeaders
+
+        redis: Redis = Redis(decode_responses=True)
+        test_helper: _TestHelper = _TestHelper(
+            self, main_example.CacheResponse1Handler.get, query_dict={"key1": "old-version", "key2": 1}
+        )
+        assert test_helper.get().code == 200
+        key_list = [key for key in redis.scan_iter(match="*old-version") if not key.startswith("pait_cache_tag")]
+        assert len(key_list) == 1
+        try:
+            # The old version of the plugin cached the attributes of the handler as the dict
+            headers: HTTPHeaders = HTTPHeaders()
+            headers.add("Content-Type", "text/html; charset=UTF-8")
+            headers.add("X-Demo", "old")
+            old_cache_dict: dict = {"write_buffer": [b"old version"], "status_code": 200, "headers": headers}
+            redis.set(key_list[0], pickle.dumps(old_cache_dict).decode("latin1"))
+            resp: HTTPResponse = test_helper.get()
+            assert resp.body == b"old version"
+            assert resp.headers["X-Demo"] == "old"
+        finally:
+            redis.delete(key_list[0])
+
+    def test_cache_serializer(self) -> None:
+        from pait.app.tornado.plugin.cache_response import CacheSerializer, TornadoCacheResponse
+        from pait.plugin.cache_response import PickleCacheSerializer
+
+        dump_value_list: list = []
+
+        class DemoSerializer(PickleCacheSerializer):
+            def dumps(self, value: Any) -> bytes:
+                dump_value_list.append(value)
+                return super().dumps(value)
+
+        handler = main_example.CacheResponse1Handler.get
+        test_helper: _TestHelper = _TestHelper(self, handler, query_dict={"key1": "serializer", "key2": 1})
+        plugin_manager = main_example.CacheResponsePlugin.build(
+            serializer=DemoSerializer(), cache_time=10, enable_cache_name_merge_param=True
+        )
+        try:
+            with enable_plugin(handler, plugin_manager, is_replace=True):
+                body: bytes = test_helper.get().body
+                assert test_helper.get().body == body
+        finally:
+            redis: Redis = Redis(decode_responses=True)
+            for key in redis.scan_iter(match="*serializer"):
+                redis.delete(key)
+        # The custom serializer only gets the response written to the handler, not the handler of tornado
+        assert len(dump_value_list) == 1
+        assert isinstance(dump_value_list[0], TornadoCacheResponse)
+        assert dump_value_list[0].body == body and dump_value_list[0].status_code == 200
+
+        data = CacheSerializer().dumps(dump_value_list[0])
+        assert data[:1] == CacheSerializer.response_tag
+        assert CacheSerializer().loads(data) == dump_value_list[0]
+        # The dict returned by the route is not the response, even if it has the same keys
+        response_dict: dict = {"status_code": 200, "headers": [], "body": b""}
+        data = CacheSerializer().dumps(response_dict)
+        assert data[:1] == CacheSerializer.pickle_tag
+        assert CacheSerializer().loads(data) == response_dict
+
     def test_cache_other_response_type(self) -> None:
         main_example.CacheResponsePlugin.set_redis_to_app(self._app, main_example.Redis(decode_responses=True))
         self.base_test.cache_other_response_type(
@@ -697,3 +766,19 @@ class TestDocPluginWithCachePluginExample(BaseTestTornadoDocExample):
 
     def test_plugin_with_cache_plugin(self) -> None:
         BaseTestDocExample(self, _TestHelper).plugin_with_cache_plugin(self.demo.DemoHandler.get)
+
+
+class TestAppDependShutdownHook:
+    def test_add_app_depend_shutdown_hook(self) -> None:
+        close_mock = mock.AsyncMock()
+
+        async def main() -> None:
+            add_app_depend_shutdown_hook(Application())
+            for _ in range(3):
+                await asyncio.sleep(0)
+            # The context managers are not exited until the event loop of the app is shutdown
+            close_mock.assert_not_awaited()
+
+        with mock.patch("pait.app.tornado._app_depend.async_close_app_depend", close_mock):
+            asyncio.run(main())
+        close_mock.assert_awaited_once()
@@ -1,6 +1,7 @@
+import asyncio
 from dataclasses import dataclass
 from dataclasses import field as dc_field
-from typing import Any, List, Mapping, Optional, Type, Union
+from typing import Any, Awaitable, List, Mapping, Optional, Type, Union, cast
 
 import pytest
 from pydantic import BaseModel, Field
@@ -39,6 +40,44 @@ class TestBaseAppHelper:
         with pytest.raises(ValueError):
             MyAppHelper([1, 2, 3], {"a": 1, "b": 2, "c": 3})
 
+    def test_request_source_memo(self) -> None:
+        class DemoRequest(object):
+            pass
+
+        call_list: List[str] = []
+
+        class DemoPaitRequest(BaseRequest):
+            RequestType = DemoRequest
+
+            def query(self) -> dict:
+                call_list.append("query")
+                return {"a": 1}
+
+            async def body(self) -> dict:
+                call_list.append("body")
+                return {"b": 2}
+
+        class DemoSubPaitRequest(DemoPaitRequest):
+            def header(self) -> dict:
+                call_list.append("header")
+                return {"c": 3}
+
+        async def _check_body(pait_request: BaseRequest) -> None:
+            assert await pait_request.body() == {"b": 2}
+            # `json` reads the body, so it is awaitable when the body method is async
+            assert await cast(Awaitable[dict], pait_request.json()) == {"b": 2}
+
+        for _ in range(2):
+            request = DemoSubPaitRequest(DemoRequest(), [], {})
+            for _ in range(3):
+                assert request.query() == {"a": 1}
+                assert request.header() == {"c": 3}
+            asyncio.run(_check_body(request))
+        # Each source is only materialized once per request object
+        assert call_list == ["query", "header", "body"] * 2
+        assert DemoSubPaitRequest.query is DemoPaitRequest.query
+        assert DemoPaitRequest.query.__name__ == "query"
+
 
 class TestSecurity:
     def test_base_security(self) -> None:
@@ -1,5 +1,5 @@
 from pait.app.base import BaseAppHelper
-from pait.data import PaitCoreProxyModel
+from pait.data import PaitCoreProxyModel, PaitData
 from pait.model.core import PaitCoreModel
 from pait.model.response import BaseResponseModel
 from pait.param_handle import ParamHandler
@@ -15,3 +15,19 @@ class TestPaitCoreProxyModel:
         proxy_core.response_model_list.append(BaseResponseModel)  # type: ignore
         assert core_model.response_model_list != proxy_core.response_model_list
         assert PaitCoreProxyModel.get_core_model(proxy_core) is core_model
+
+
+class TestPaitData:
+    def test_version(self) -> None:
+        pait_data = PaitData()
+        core_model = PaitCoreModel(lambda x: x, BaseAppHelper, ParamHandler)
+        pait_data.register("demo", core_model)
+        assert pait_data.version == 1
+
+        core_model.summary = "demo"
+        assert pait_data.version == 2
+        # Set the same value does not change the version
+        core_model.summary = "demo"
+        assert pait_data.version == 2
+        pait_data.get_core_model("demo", core_model.pait_id, "/demo", "/demo", {"GET"})
+        assert pait_data.version > 2
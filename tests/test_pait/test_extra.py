@@ -1,10 +1,20 @@
-from typing import TYPE_CHECKING, List, Optional, Type
+import asyncio
+import hashlib
+import random
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, List, Optional, Tuple, Type
 
 import pytest
 from pydantic import BaseConfig, BaseModel, Field
 
+from pait._pydanitc_adapter import PaitModelField
 from pait.app.base import BaseAppHelper
+from pait.exceptions import FieldValueTypeException
 from pait.extra import config
+from pait.extra.field.stream._multipart import MultipartSegment, PushMultipartParser
+from pait.extra.field.stream.json_lines import AsyncJsonLinesIterator, JsonLinesIterator
+from pait.extra.field.stream.util import save_to
 from pait.model.core import PaitCoreModel
 from pait.model.response import BaseResponseModel, JsonResponseModel
 from pait.model.status import PaitStatus
@@ -264,3 +274,157 @@ class TestApplyFun:
                 config.apply_param_handler(BaseParamHandler, config.MatchRule(key="main_plugin"))(i)  # type: ignore
         exec_msg = e.value.args[0]
         assert exec_msg == "Not support key:main_plugin"
+
+
+class TestPushMultipartParser:
+    def test_zero_copy(self) -> None:
+        data: bytes = b"Hello Word!" * 100
+        body: bytes = (
+            b'--boundary\r\nContent-Disposition: form-data; name="stream"; filename="demo.txt"\r\n\r\n'
+            + data
+            + b"\r\n--boundary--\r\n"
+        )
+        # The second delimiter straddles the last two chunks
+        chunk_list: List[bytes] = [body[:300], body[300:700], body[700:-10], body[-10:]]
+        parser = PushMultipartParser("boundary")
+        result_list = [result for chunk in chunk_list for result in parser.parse(chunk)]
+        parser.close()
+
+        assert isinstance(result_list[0], MultipartSegment)
+        assert result_list[-1] is None
+        data_list: List[memoryview] = [i for i in result_list[1:-1] if isinstance(i, memoryview)]
+        assert len(data_list) == len(result_list) - 2
+        assert b"".join(data_list) == data
+        # Only the data that straddles chunks is copied
+        assert data_list[0].obj is chunk_list[0]
+        assert data_list[1].obj is not chunk_list[1]
+        assert data_list[2].obj is chunk_list[1]
+        assert all(i.readonly for i in data_list)
+
+    def test_random_chunk_split(self) -> None:
+        file_data: bytes = bytes(range(256)) * 40
+        # The data contains the parts of the delimiter, which must not be treated as the delimiter
+        text_data: bytes = b"\r\n--boundar\r\n-boundary" * 30
+        body: bytes = (
+            b'--boundary\r\nContent-Disposition: form-data; name="a"\r\n\r\n'
+            + text_data
+            + b'\r\n--boundary\r\nContent-Disposition: form-data; name="b"; filename="demo.bin"\r\n\r\n'
+            + file_data
+            + b'\r\n--boundary\r\nContent-Disposition: form-data; name="c"\r\n\r\n'
+            + b"\r\n--boundary--\r\n"
+        )
+        expect_result: List[Tuple[str, bytes]] = [("a", text_data), ("b", file_data), ("c", b"")]
+        rand: random.Random = random.Random(20231018)
+        for _ in range(200):
+            chunk_list: List[bytes] = []
+            index: int = 0
+            while index < len(body):
+                size: int = rand.randint(1, 128)
+                chunk_list.append(body[index : index + size])
+                index += size
+
+            parser = PushMultipartParser("boundary")
+            result: List[Tuple[str, bytes]] = []
+            for chunk in chunk_list:
+                for item in parser.parse(chunk):
+                    if isinstance(item, MultipartSegment):
+                        result.append((item.name, b""))
+                    elif item is not None:
+                        result[-1] = (result[-1][0], result[-1][1] + bytes(item))
+            parser.close()
+            assert result == expect_result, [len(i) for i in chunk_list]
+
+
+class TestSaveTo:
+    def test_save_to_file_object(self) -> None:
+        data: bytes = b"Hello Word!" * 100
+        f = BytesIO()
+        save_result = save_to(
+            (memoryview(data)[i : i + 7] for i in range(0, len(data), 7)), f, checksum=("sha256",), buffer_size=64
+        )
+        assert f.getvalue() == data
+        assert save_result.size == len(data)
+        assert save_result.checksum == {"sha256": hashlib.sha256(data).hexdigest()}
+
+    def test_remove_file_when_error(self, tmp_path: Path) -> None:
+        def _stream() -> Generator[bytes, None, None]:
+            yield b"Hello Word!"
+            raise RuntimeError("The connection is closed")
+
+        path: Path = tmp_path / "upload"
+        with pytest.raises(RuntimeError):
+            save_to(_stream(), path, buffer_size=1)
+        assert not path.exists()
+
+
+class TestJsonLines:
+    class Event(BaseModel):
+        uid: int
+
+    body: bytes = b'{"uid": 1}\n\n{"uid": 2}\r\n{"uid": "a"}\n{"uid": 4}'
+
+    def _get_chunk_list(self) -> List[bytes]:
+        # The lines straddle chunks
+        return [self.body[i : i + 3] for i in range(0, len(self.body), 3)]
+
+    def _get_pait_model_field(self) -> PaitModelField:
+        return PaitModelField(value_name="items", annotation=self.Event, field_info=Field(...), request_param="body")
+
+    def test_iterator(self) -> None:
+        items: JsonLinesIterator = JsonLinesIterator(
+            self._get_chunk_list(), "items", self._get_pait_model_field(), raise_error=False
+        )
+        assert [item.uid for item in items] == [1, 2, 4]
+        assert len(items.error_list) == 1
+        assert items.error_list[0].param == "items"
+        assert items.error_list[0].msg.startswith("line 4:")
+
+        items = JsonLinesIterator(self._get_chunk_list(), "items", self._get_pait_model_field())
+        assert next(items).uid == 1
+        assert next(items).uid == 2
+        with pytest.raises(FieldValueTypeException) as e:
+            next(items)
+        assert e.value.msg.startswith("line 4:")
+
+    def test_async_iterator(self) -> None:
+        async def _stream() -> AsyncGenerator[bytes, None]:
+            for chunk in self._get_chunk_list():
+                yield chunk
+
+        async def _main() -> None:
+            items: AsyncJsonLinesIterator = AsyncJsonLinesIterator(
+                _stream(), "items", self._get_pait_model_field(), raise_error=False
+            )
+            assert [item.uid async for item in items] == [1, 2, 4]
+            assert items.error_list[0].msg.startswith("line 4:")
+
+        asyncio.run(_main())
+
+    def test_long_line(self) -> None:
+        # The long line straddles many chunks and is accumulated in place
+        body: bytes = b'{"uid": 1}\n{"uid": ' + b" " * 1000 + b"2}\n" + b'{"uid": 3}'
+        chunk_list: List[bytes] = [body[i : i + 7] for i in range(0, len(body), 7)]
+        items: JsonLinesIterator = JsonLinesIterator(chunk_list, "items", self._get_pait_model_field())
+        assert [item.uid for item in items] == [1, 2, 3]
+
+    def test_max_line_size(self) -> None:
+        body: bytes = b'{"uid": 1}\n{"uid": ' + b" " * 1000 + b"2}\n" + b'{"uid": 3}'
+        # The unfinished line exceeds the limit before its end is read
+        chunk_list: List[bytes] = [body[i : i + 7] for i in range(0, len(body), 7)]
+        items: JsonLinesIterator = JsonLinesIterator(
+            chunk_list, "items", self._get_pait_model_field(), raise_error=False, max_line_size=100
+        )
+        assert next(items).uid == 1
+        with pytest.raises(FieldValueTypeException) as e:
+            next(items)
+        assert e.value.msg == "line 2: The line is larger than 100 bytes"
+
+        # The finished line in a single chunk also exceeds the limit
+        items = JsonLinesIterator([body], "items", self._get_pait_model_field(), max_line_size=100)
+        assert next(items).uid == 1
+        with pytest.raises(FieldValueTypeException) as e:
+            next(items)
+        assert e.value.msg == "line 2: The line is larger than 100 bytes"
+
+        items = JsonLinesIterator(chunk_list, "items", self._get_pait_model_field(), max_line_size=2000)
+        assert [item.uid for item in items] == [1, 2, 3]
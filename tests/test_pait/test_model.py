@@ -92,6 +92,21 @@ class TestContextModel:
         ctx.set_to_state("aaa", 123)
         assert ctx.get_form_state("aaa") == 123
 
+    def test_slots(self) -> None:
+        ctx = context.ContextModel(None, None, None, [], {})  # type: ignore[arg-type]
+        assert not hasattr(ctx, "__dict__")
+        ctx.contextmanager_list = []  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            ctx.demo = 1  # type: ignore[attr-defined]
+        assert str(ctx) == (
+            "ContextModel(cbv_instance=None, app_helper=None, pait_core_model=None, args=[], kwargs={},"
+            " state={}, depend_cache={})"
+        )
+        assert repr(ctx) == str(ctx)
+        # The str and repr of the context do not initialize the state and the depend cache
+        assert not hasattr(ctx, "state")
+        assert not hasattr(ctx, "depend_cache")
+
 
 def demo() -> None:
     pass
@@ -1,7 +1,10 @@
 import importlib
-from typing import Dict
+import json
+from pathlib import Path
+from typing import Dict, List, Type
 
 import pytest
+from flask import Flask
 from pydantic import BaseModel, Field
 
 from pait import _pydanitc_adapter, field
@@ -9,7 +12,8 @@ from pait.app.auto_load_app import app_list
 from pait.app.base import BaseAppHelper
 from pait.app.base.security.api_key import BaseAPIKey
 from pait.model.core import PaitCoreModel
-from pait.openapi.openapi import HttpParamTypeLiteral, ParsePaitModel
+from pait.openapi import build, openapi
+from pait.openapi.openapi import HttpParamTypeLiteral, ParsePaitModel, get_parse_pait_model
 from pait.param_handle import ParamHandler
 
 
@@ -121,6 +125,85 @@ class TestParsePaitModel:
         with pytest.raises(ValueError):
             ParsePaitModel(core_model)
 
+    def test_get_parse_pait_model(self) -> None:
+        def demo(a: int = field.Query.i()) -> None:
+            pass
+
+        class ExtraModel(BaseModel):
+            b: str = field.Body.i()
+
+        core_model = PaitCoreModel(demo, BaseAppHelper, ParamHandler)
+        parse_pait_model = get_parse_pait_model(core_model)
+        assert get_parse_pait_model(core_model) is parse_pait_model
+        self.check_result_by_http_param_type_dict(parse_pait_model, {"a": "query"})
+
+        # Only the changed route is parsed again
+        core_model.extra_openapi_model_list = [ExtraModel]
+        new_parse_pait_model = get_parse_pait_model(core_model)
+        assert new_parse_pait_model is not parse_pait_model
+        assert get_parse_pait_model(core_model) is new_parse_pait_model
+        self.check_result_by_http_param_type_dict(new_parse_pait_model, {"a": "query", "b": "body"})
+
+    def test_synthesized_model_cache(self) -> None:
+        class DemoModel(BaseModel):
+            c: int = field.Header.i()
+
+        def demo(
+            a: int = field.Query.i(), b: int = field.Query.i(alias="a"), model: DemoModel = field.Json.i()
+        ) -> None:
+            pass
+
+        def get_model_set(parse_pait_model: ParsePaitModel) -> set:
+            return {i.model for value in parse_pait_model.http_param_type_dict.values() for i in value}
+
+        core_model = PaitCoreModel(demo, BaseAppHelper, ParamHandler)
+        model_set = get_model_set(ParsePaitModel(core_model))
+        model_dict = openapi._synthesized_model_cache[core_model]
+        # SingleFieldModel, SameNameModel, RawReturnModel and HttpParamModel of query and json
+        assert len(model_dict) == 5
+        # Parsing the route again reuses the synthesized models
+        assert get_model_set(ParsePaitModel(core_model)) == model_set
+        assert len(openapi._synthesized_model_cache[core_model]) == 5
+
+        # Only the models of the changed param type are synthesized again
+        class ExtraModel(BaseModel):
+            d: str = field.Query.i()
+
+        core_model.extra_openapi_model_list = [ExtraModel]
+        new_model_set = get_model_set(ParsePaitModel(core_model))
+        assert len(new_model_set - model_set) == 1
+        # The new model replaces the old model of the same class name
+        assert len(openapi._synthesized_model_cache[core_model]) == 5
+
+    def test_synthesized_model_cache_with_default_field_class(self) -> None:
+        class DemoModel(BaseModel):
+            a: int = Field()
+            b: str = Field(description="demo")
+
+        def demo(model: DemoModel) -> None:
+            pass
+
+        core_model = PaitCoreModel(demo, BaseAppHelper, ParamHandler, default_field_class=field.Query)
+        model_list: List[Type[BaseModel]] = []
+        for index in range(5):
+            core_model.summary = f"demo {index}"
+            parse_pait_model = get_parse_pait_model(core_model)
+            model_list.extend(i.model for value in parse_pait_model.http_param_type_dict.values() for i in value)
+        # The fields converted by `default_field_class` are new objects in each parse,
+        # but they are converted from the same pydantic fields, so the synthesized model is reused
+        assert len(model_list) == 5 and len(set(model_list)) == 1
+        assert len(openapi._synthesized_model_cache[core_model]) == 1
+
+    def test_model_type_hints_cache(self) -> None:
+        class DemoModel(BaseModel):
+            a: int = field.Query.i()
+
+        type_hints = openapi._get_model_type_hints(DemoModel)
+        assert type_hints == {"a": int}
+        # The type hints of the same model are only parsed once
+        assert openapi._get_model_type_hints(DemoModel) is type_hints
+        assert DemoModel in openapi._model_type_hints_cache
+
 
 class TestApiDoc:
     """Now, ignore test api doc"""
@@ -136,3 +219,73 @@ class TestApiDoc:
             OpenAPI(app).content()  # type: ignore
             OpenAPI(app).content(serialization_callback=my_serialization)  # type: ignore
             OpenAPI(app).dict  # type: ignore
+
+    def test_rebuild(self) -> None:
+        from pait.openapi.openapi import OpenAPI
+
+        for app_name in app_list:
+            module = importlib.import_module(f"example.{app_name}_example.main_example")  # type: ignore
+            app = module.create_app()  # type: ignore
+            openapi_dict = json.loads(OpenAPI(app).content())
+            # The second document reuses the parse result and the synthesized models of the first one
+            assert json.loads(OpenAPI(app).content()) == openapi_dict
+            openapi._parse_pait_model_cache.clear()
+            assert json.loads(OpenAPI(app).content()) == openapi_dict
+
+    def test_iter_content(self) -> None:
+        from pait.openapi.openapi import OpenAPI
+
+        for app_name in app_list:
+            module = importlib.import_module(f"example.{app_name}_example.main_example")  # type: ignore
+            pait_openapi = OpenAPI(module.create_app())  # type: ignore
+
+            chunk_list = list(pait_openapi.iter_content(chunk_size=4096))
+            assert len(chunk_list) > 1
+            assert all(len(chunk) >= 4096 for chunk in chunk_list[:-1])
+            assert b"".join(chunk_list) == pait_openapi.content().encode()
+            for kwargs in ({"sort_keys": True}, {"indent": 2}, {"ensure_ascii": False}):
+                assert b"".join(pait_openapi.iter_content(**kwargs)) == pait_openapi.content(**kwargs).encode()
+
+
+class TestBuild:
+    def test_load_app_from_string(self) -> None:
+        from example.flask_example import main_example
+
+        assert build.load_app_from_string("example.flask_example.main_example:create_app") is main_example.create_app
+        assert build.load_app_from_string("example.flask_example.main_example:create_app", factory=True) is not None
+        with pytest.raises(ValueError):
+            build.load_app_from_string("example.flask_example.main_example")
+        with pytest.raises(ValueError):
+            build.load_app_from_string("example.flask_example.main_example:not_exist_app")
+
+    def test_build(self, tmp_path: Path) -> None:
+        import yaml  # type: ignore
+
+        json_path = str(tmp_path / "openapi.json")
+        yaml_path = str(tmp_path / "openapi.yaml")
+        build.main(
+            [
+                "build",
+                "example.flask_example.main_example:create_app",
+                "--factory",
+                "--title",
+                "Demo",
+                "--server-url",
+                "http://127.0.0.1:8000",
+                "-o",
+                json_path,
+                "-o",
+                yaml_path,
+            ]
+        )
+        with open(json_path) as f:
+            json_content = json.load(f)
+        with open(yaml_path) as f:
+            yaml_content = yaml.safe_load(f)
+        assert json_content["info"]["title"] == "Demo"
+        assert [i["url"] for i in json_content["servers"]] == ["http://127.0.0.1:8000"]
+        assert json_content["paths"]
+        assert yaml_content == json_content
+
+        with pytest.raises(ValueError):
+            build.openapi_content(build.build_openapi(Flask(__name__)), file_format="xml")
@@ -1,20 +1,25 @@
+import asyncio
 import datetime
 import inspect
+import time
 import traceback
-from typing import Any, List
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, List, Optional
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 import pait.util._util
 from pait import _pydanitc_adapter, field
 from pait.app.base import BaseAppHelper
-from pait.exceptions import NotFoundValueException
+from pait.exceptions import NotFoundValueException, TipException
 from pait.field import resource_parse
 from pait.model import response
 from pait.model.core import PaitCoreModel
 from pait.param_handle import ParamHandler
 from pait.param_handle import util as param_handle_util
+from pait.param_handle.app_depend import async_close_app_depend, close_app_depend
+from tests.util import FakePait, FakeRawRequest, FakeRequestAppHelper
 
 
 class TestParamPlugin:
@@ -241,3 +246,443 @@ class TestUtil:
         assert result[0].name == "c"
         assert result[0].annotation == str
         assert result[0].default == value
+
+
+class TestCompiledValidation:
+    def test_pre_load_compile(self) -> None:
+        pait = FakePait()
+
+        @pait(compiled_validation=True)
+        def demo(
+            a: int = field.Query.i(),
+            b: str = field.Header.i(alias="x-b"),
+            c: dict = field.Query.i(raw_return=True),
+        ) -> None:
+            pass
+
+        pld = demo.pait_core_model.param_handler_pm.plugin_kwargs["_pait_pre_load_dc"]  # type: ignore[attr-defined]
+        assert pld.compiled_model_field is not None
+        assert [i.value_name for i in pld.compiled_model_field.pait_model_field_list] == ["a", "b"]
+        assert pld.param["a"].parse_resource_func.__wrapped__ is resource_parse.compiled_request_field_pr_func
+        assert getattr(pld.param["c"].parse_resource_func, "__wrapped__", None) is resource_parse.request_field_pr_func
+
+        @pait()
+        def demo1(a: int = field.Query.i(), b: str = field.Header.i()) -> None:
+            pass
+
+        pld = demo1.pait_core_model.param_handler_pm.plugin_kwargs["_pait_pre_load_dc"]  # type: ignore[attr-defined]
+        assert pld.compiled_model_field is None
+
+    def test_validate(self) -> None:
+        pait = FakePait()
+
+        def demo_depend(uid: int = field.Header.i(), user_name: str = field.Header.i(alias="user-name")) -> str:
+            return f"{uid}:{user_name}"
+
+        @pait(compiled_validation=True)
+        def demo(
+            user: str = field.Depends.i(demo_depend),
+            a: int = field.Query.i(),
+            b: int = field.Query.i(default=2, gt=1),
+            c: List[int] = field.Query.i(default_factory=list),
+        ) -> dict:
+            return {"user": user, "a": a, "b": b, "c": c}
+
+        assert demo(FakeRawRequest(query={"a": "1"}, header={"uid": "1", "user-name": "so1n"})) == {
+            "user": "1:so1n",
+            "a": 1,
+            "b": 2,
+            "c": [],
+        }
+        with pytest.raises(TipException) as tip_e:
+            demo(FakeRawRequest(query={}, header={"uid": "1", "user-name": "so1n"}))
+        assert isinstance(tip_e.value.exc, NotFoundValueException)
+
+        with pytest.raises(ValidationError) as e:
+            demo(FakeRawRequest(query={"a": "a", "b": "1"}, header={"uid": "1", "user-name": "so1n"}))
+        # all error are raised at once, and the loc is the same as the field by field validation
+        assert [i["loc"] for i in e.value.errors()] == [("query", "a"), ("query", "b")]
+
+        with pytest.raises(ValidationError) as e:
+            demo(FakeRawRequest(query={"a": "1"}, header={"uid": "a", "user-name": "so1n"}))
+        assert [i["loc"] for i in e.value.errors()] == [("header", "uid")]
+
+    def test_compiled_model_field(self) -> None:
+        def _gen_model_field(
+            value_name: str, annotation: type, field_info: field.BaseRequestResourceField
+        ) -> _pydanitc_adapter.PaitModelField:
+            field_info.set_request_key(value_name)
+            return _pydanitc_adapter.PaitModelField(
+                value_name=value_name,
+                annotation=annotation,
+                field_info=field_info,
+                request_param=field_info.get_field_name(),
+            )
+
+        compiled_model_field = _pydanitc_adapter.PaitCompiledModelField(
+            [
+                _gen_model_field("a", int, field.Query.i(gt=1)),
+                # the value name shadows the attribute of pydantic.BaseModel
+                _gen_model_field("json", List[int], field.Body.i()),
+                _gen_model_field("c", str, field.Header.i(alias="x-c")),
+            ],
+            class_name="DemoCompiledModel",
+        )
+        assert compiled_model_field.validate({"a": "2", "json": ["1", 2], "c": "c"}) == {
+            "a": 2,
+            "json": [1, 2],
+            "c": "c",
+        }
+        with pytest.raises(ValidationError) as e:
+            compiled_model_field.validate({"a": "1", "json": [1, "a"], "c": "c"})
+        assert [i["loc"] for i in e.value.errors()] == [("query", "a"), ("body", "json", 1)]
+
+    def test_compiled_validation_normalize_request_value(self) -> None:
+        class FlaskFakeRequestAppHelper(FakeRequestAppHelper):
+            app_name = "flask"
+
+        class FlaskFakePait(FakePait):
+            app_helper_class = FlaskFakeRequestAppHelper
+
+        class DemoDict(dict):
+            pass
+
+        pait = FlaskFakePait()
+
+        @pait(compiled_validation=True)
+        def demo(a: int = field.Query.i(), b: dict = field.Body.i()) -> dict:
+            return {"a": a, "b": b}
+
+        pld = demo.pait_core_model.param_handler_pm.plugin_kwargs["_pait_pre_load_dc"]  # type: ignore[attr-defined]
+        assert pld.compiled_model_field is not None
+        assert pld.param["b"].normalize_request_value_cb is resource_parse.flask_normalize_request_value
+        result = demo(FakeRawRequest(query={"a": "1"}, body={"b": DemoDict(c=1)}))
+        assert result == {"a": 1, "b": {"c": 1}}
+        if not _pydanitc_adapter.is_v1:
+            assert type(result["b"]) is dict
+
+
+class TestConcurrentDepend:
+    def test_pre_load(self) -> None:
+        pait = FakePait()
+
+        async def demo_depend() -> int:
+            return 1
+
+        @pait(concurrent_depend=True)
+        async def demo(
+            a: int = field.Depends.i(demo_depend), b: int = field.Depends.i(demo_depend), c: int = field.Query.i()
+        ) -> None:
+            pass
+
+        pld = demo.pait_core_model.param_handler_pm.plugin_kwargs["_pait_pre_load_dc"]  # type: ignore[attr-defined]
+        assert pld.concurrent_depend_name_list == ["a", "b"]
+
+        @pait(concurrent_depend=True)
+        def sync_demo(a: int = field.Depends.i(demo_depend), b: int = field.Depends.i(demo_depend)) -> None:
+            pass
+
+        pld = sync_demo.pait_core_model.param_handler_pm.plugin_kwargs[  # type: ignore[attr-defined]
+            "_pait_pre_load_dc"
+        ]
+        assert pld.concurrent_depend_name_list == []
+
+    def test_concurrent_run(self) -> None:
+        pait = FakePait()
+        event_dict: dict = {}
+
+        async def depend_a(uid: int = field.Query.i()) -> int:
+            # If the depends are run one by one, the event will never be set
+            await event_dict["b"].wait()
+            event_dict["a"].set()
+            return uid
+
+        async def depend_b(name: str = field.Query.i()) -> str:
+            event_dict["b"].set()
+            await event_dict["a"].wait()
+            return name
+
+        async def pre_depend_a() -> None:
+            await event_dict["pre_b"].wait()
+
+        async def pre_depend_b() -> None:
+            event_dict["pre_b"].set()
+
+        @pait(concurrent_depend=True, pre_depend_list=[pre_depend_a, pre_depend_b])
+        async def demo(uid: int = field.Depends.i(depend_a), name: str = field.Depends.i(depend_b)) -> dict:
+            return {"uid": uid, "name": name}
+
+        async def main() -> dict:
+            for key in ("a", "b", "pre_b"):
+                event_dict[key] = asyncio.Event()
+            return await asyncio.wait_for(demo(FakeRawRequest(query={"uid": "1", "name": "so1n"})), 1)
+
+        assert asyncio.run(main()) == {"uid": 1, "name": "so1n"}
+
+    def test_error_and_teardown_order(self) -> None:
+        pait = FakePait()
+        exit_list: List[str] = []
+
+        def gen_depend(name: str, sleep: float, exc: Optional[Exception] = None) -> Any:
+            @asynccontextmanager
+            async def _depend() -> AsyncIterator[str]:
+                # The depend declared first is completed last
+                await asyncio.sleep(sleep)
+                if exc:
+                    raise exc
+                try:
+                    yield name
+                finally:
+                    exit_list.append(name)
+
+            return _depend
+
+        @pait(concurrent_depend=True)
+        async def demo(
+            a: str = field.Depends.i(gen_depend("a", 0.03)),
+            b: str = field.Depends.i(gen_depend("b", 0.02)),
+            c: str = field.Depends.i(gen_depend("c", 0.01)),
+        ) -> str:
+            return a + b + c
+
+        assert asyncio.run(demo(FakeRawRequest())) == "abc"
+        assert exit_list == ["a", "b", "c"]
+
+        @pait(concurrent_depend=True)
+        async def demo1(
+            a: str = field.Depends.i(gen_depend("a", 0.03)),
+            b: str = field.Depends.i(gen_depend("b", 0.02, RuntimeError("b"))),
+            c: str = field.Depends.i(gen_depend("c", 0.01, ValueError("c"))),
+        ) -> str:
+            return a + b + c
+
+        exit_list.clear()
+        with pytest.raises(RuntimeError) as e:
+            asyncio.run(demo1(FakeRawRequest()))
+        # The exceptions are raised in the declared order, and the depend that succeeds is still torn down
+        assert isinstance(e.value.__context__, ValueError)
+        assert exit_list == ["a"]
+
+
+class TestDependCache:
+    def test_sync(self) -> None:
+        pait = FakePait()
+        call_list: List[str] = []
+
+        def get_user(uid: int = field.Query.i()) -> int:
+            call_list.append("get_user")
+            return uid
+
+        def get_user_name(uid: int = field.Depends.i(get_user)) -> str:
+            return f"user-{uid}"
+
+        def get_uncached_user(uid: int = field.Depends.i(get_user, use_cache=False)) -> int:
+            return uid
+
+        @pait(pre_depend_list=[get_user])
+        def demo(
+            uid: int = field.Depends.i(get_user),
+            name: str = field.Depends.i(get_user_name),
+        ) -> str:
+            return f"{uid}:{name}"
+
+        assert demo(FakeRawRequest(query={"uid": "1"})) == "1:user-1"
+        assert call_list == ["get_user"]
+        # The cache only works in one request
+        assert demo(FakeRawRequest(query={"uid": "2"})) == "2:user-2"
+        assert call_list == ["get_user"] * 2
+
+        @pait()
+        def demo1(uid: int = field.Depends.i(get_user), other_uid: int = field.Depends.i(get_uncached_user)) -> int:
+            return uid + other_uid
+
+        call_list.clear()
+        assert demo1(FakeRawRequest(query={"uid": "1"})) == 2
+        assert call_list == ["get_user"] * 2
+
+    def test_async(self) -> None:
+        pait = FakePait()
+        call_list: List[str] = []
+
+        async def get_user(uid: int = field.Query.i()) -> int:
+            call_list.append("get_user")
+            await asyncio.sleep(0.01)
+            return uid
+
+        async def get_user_name(uid: int = field.Depends.i(get_user)) -> str:
+            return f"user-{uid}"
+
+        async def raise_exc() -> int:
+            call_list.append("raise_exc")
+            raise RuntimeError("demo")
+
+        async def depend_raise_exc(value: int = field.Depends.i(raise_exc)) -> int:
+            return value
+
+        for concurrent_depend in (False, True):
+
+            @pait(concurrent_depend=concurrent_depend, pre_depend_list=[get_user])
+            async def demo(
+                uid: int = field.Depends.i(get_user),
+                name: str = field.Depends.i(get_user_name),
+            ) -> str:
+                return f"{uid}:{name}"
+
+            call_list.clear()
+            assert asyncio.run(demo(FakeRawRequest(query={"uid": "1"}))) == "1:user-1"
+            assert call_list == ["get_user"]
+
+            @pait(concurrent_depend=concurrent_depend)
+            async def demo1(a: int = field.Depends.i(raise_exc), b: int = field.Depends.i(depend_raise_exc)) -> int:
+                return a + b
+
+            call_list.clear()
+            with pytest.raises(RuntimeError):
+                asyncio.run(demo1(FakeRawRequest()))
+            assert call_list == ["raise_exc"]
+
+
+class TestAppDepend:
+    def test_depends_param(self) -> None:
+        with pytest.raises(ValueError):
+            field.Depends.i(lambda: None, scope="demo")  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            field.Depends.i(lambda: None, scope="app", use_cache=False)
+        with pytest.raises(ValueError):
+            field.Depends.i(lambda: None, ttl=1)
+
+    def test_depend_with_request_field(self) -> None:
+        pait = FakePait()
+
+        def get_user(uid: str = field.Header.i()) -> str:
+            return uid
+
+        def get_client(user: str = field.Depends.i(get_user)) -> str:
+            return f"client-{user}"
+
+        class ClientDepend(object):
+            uid: str = field.Query.i()
+
+            def __call__(self) -> str:
+                return f"client-{self.uid}"
+
+        for depend in (get_user, get_client, ClientDepend):
+            # The result of the app scope depend is shared by all requests, it can not use the request value
+            with pytest.raises(TipException) as e:
+
+                @pait()
+                def demo(value: str = field.Depends.i(depend, scope="app")) -> None:
+                    pass
+
+            assert "can not use the request value" in str(e.value)
+
+        @pait()
+        def demo1(value: str = field.Depends.i(get_user)) -> None:
+            pass
+
+    def test_sync(self) -> None:
+        pait = FakePait()
+        call_list: List[str] = []
+
+        @contextmanager
+        def get_client() -> Iterator[str]:
+            call_list.append("enter")
+            yield f"client-{len(call_list)}"
+            call_list.append("exit")
+
+        def get_key() -> str:
+            call_list.append("key")
+            return f"key-{len(call_list)}"
+
+        @pait()
+        def demo(
+            client: str = field.Depends.i(get_client, scope="app"),
+            key: str = field.Depends.i(get_key, scope="app", ttl=0.05),
+        ) -> str:
+            return f"{client}:{key}"
+
+        try:
+            assert demo(FakeRawRequest()) == "client-1:key-2"
+            # The context manager of the app scope depend is not exited at the end of the request
+            assert demo(FakeRawRequest()) == "client-1:key-2"
+            assert call_list == ["enter", "key"]
+
+            time.sleep(0.05)
+            assert demo(FakeRawRequest()) == "client-1:key-3"
+            assert call_list == ["enter", "key", "key"]
+        finally:
+            close_app_depend()
+        assert call_list == ["enter", "key", "key", "exit"]
+        # Run again after the app scope depends are closed
+        assert demo(FakeRawRequest()) == "client-5:key-6"
+        close_app_depend()
+
+    def test_async(self) -> None:
+        pait = FakePait()
+        call_list: List[str] = []
+
+        @asynccontextmanager
+        async def get_client() -> AsyncIterator[str]:
+            call_list.append("enter")
+            await asyncio.sleep(0.01)
+            yield "client"
+            call_list.append("exit")
+
+        async def get_fail_client() -> str:
+            call_list.append("fail")
+            await asyncio.sleep(0.01)
+            raise RuntimeError("demo")
+
+        @pait()
+        async def demo(client: str = field.Depends.i(get_client, scope="app")) -> str:
+            return client
+
+        @pait()
+        async def demo1(client: str = field.Depends.i(get_fail_client, scope="app")) -> str:
+            return client
+
+        async def main() -> None:
+            # Concurrent requests only run the app scope depend once
+            assert await asyncio.gather(*[demo(FakeRawRequest()) for _ in range(3)]) == ["client"] * 3
+            result_list = await asyncio.gather(*[demo1(FakeRawRequest()) for _ in range(3)], return_exceptions=True)
+            assert all(isinstance(i, RuntimeError) for i in result_list)
+            await async_close_app_depend()
+
+        asyncio.run(main())
+        assert call_list == ["enter", "fail", "exit"]
+
+
+class TestSimpleRoute:
+    def test_simple_route(self) -> None:
+        pait = FakePait()
+
+        class DemoModel(BaseModel):
+            a: int = field.Query.i()
+
+        def get_b(b: int = field.Query.i()) -> int:
+            return b
+
+        @pait()
+        def demo(model: DemoModel, c: str = field.Header.i()) -> dict:
+            return {"a": model.a, "c": c}
+
+        @pait()
+        def demo1(b: int = field.Depends.i(get_b)) -> int:
+            return b
+
+        @pait()
+        async def async_demo(model: DemoModel, c: str = field.Header.i()) -> dict:
+            return {"a": model.a, "c": c}
+
+        for route in (demo, demo1, async_demo):
+            assert route.pait_core_model.param_handler_pm.plugin_kwargs[  # type: ignore[attr-defined]
+                "_pait_simple_route"
+            ] is (route is not demo1)
+
+        core_model: PaitCoreModel = demo.pait_core_model  # type: ignore[attr-defined]
+        assert core_model.main_plugin_entry == core_model.main_plugin._simple_route_call  # type: ignore[attr-defined]
+        assert demo(FakeRawRequest(query={"a": "1"}, header={"c": "x"})) == {"a": 1, "c": "x"}
+        assert demo1(FakeRawRequest(query={"b": "2"})) == 2
+        assert asyncio.run(async_demo(FakeRawRequest(query={"a": "1"}, header={"c": "x"}))) == {"a": 1, "c": "x"}
+        with pytest.raises(TipException):
+            demo(FakeRawRequest(query={"a": "1"}))
@@ -1,10 +1,19 @@
-from typing import Callable, Generator
+import asyncio
+import datetime
+import pickle
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING
+from typing import Any, Callable, Generator, Type
 
 import pytest
 from flask import Flask
 from flask.ctx import AppContext
 from flask.testing import FlaskClient
+from pydantic import BaseModel, Field
 from redis import Redis  # type: ignore
+from redis.asyncio import Redis as AsyncRedis  # type: ignore
 
 from example.flask_example import main_example
 from pait import field
@@ -17,12 +26,21 @@ from pait.model.response import FileResponseModel, JsonResponseModel
 from pait.param_handle import BaseParamHandler, ParamHandler
 from pait.plugin.at_most_one_of import AtMostOneOfExtraParam, AtMostOneOfPlugin
 from pait.plugin.auto_complete_json_resp import AutoCompleteJsonRespPlugin
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from pait.plugin.cache_response import (
+    CacheRespExtraParam,
+    CacheResponsePlugin,
+    CacheSerializer,
+    LocalCache,
+    MemoryCacheBackend,
+    PickleCacheSerializer,
+    RedisCacheBackend,
+)
 from pait.plugin.check_json_resp import CheckJsonRespPlugin
 from pait.plugin.mock_response import MockPluginProtocol
 from pait.plugin.required import RequiredExtraParam, RequiredGroupExtraParam, RequiredPlugin
 from pait.plugin.unified_response import UnifiedResponsePluginProtocol
 from pait.util import get_pait_response_model
+from tests.util import FakePait, FakeRawRequest
 
 
 @pytest.fixture
@@ -177,6 +195,19 @@ class TestAutoCompleteJsonPlugin:
         }
 
 
+class DatetimeModel(BaseModel):
+    a: datetime.datetime
+
+
+class CacheDemoModel(BaseModel):
+    a: int
+    b: str = Field(alias="B")
+
+
+class CacheDemoSubModel(CacheDemoModel):
+    sub: CacheDemoModel
+
+
 class TestCacheResponsePlugin:
     def test_not_set_response_model(self) -> None:
         def demo() -> None:
@@ -242,6 +273,546 @@ class TestCacheResponsePlugin:
         )
         assert CacheResponsePluginManager.plugin_kwargs["_cache_name_param_set"] == {"a", "b"}
 
+    def test_gen_key(self) -> None:
+        class Demo(BaseModel):
+            a: int
+            b: dict
+
+        def gen_key(**kwargs: Any) -> Any:
+            plugin = CacheResponsePlugin(
+                lambda x: x,
+                PaitCoreModel(lambda: None, BaseAppHelper, ParamHandler, response_model_list=[JsonResponseModel]),
+                name="demo",
+                redis=None,
+                enable_cache_name_merge_param=True,
+                cache_time=10,
+                timeout=None,
+                sleep=None,
+                blocking_timeout=None,
+                _cache_name_param_set=set(),
+                **kwargs,
+            )
+            return plugin._gen_key
+
+        _gen_key = gen_key(max_key_length=128)
+        assert _gen_key(1, a="a", b=None) == ("demo:1:a:None", "demo:lock:1:a:None")
+        assert _gen_key(a={"b": 1, "a": {2, 1}})[0] == 'demo:{"a":[1,2],"b":1}'
+        assert _gen_key(a={"a": {1, 2}, "b": 1})[0] == 'demo:{"a":[1,2],"b":1}'
+        assert _gen_key(a=Demo(a=1, b={"d": [1], "c": None}))[0] == 'demo:{"a":1,"b":{"c":null,"d":[1]}}'
+        assert _gen_key(a=datetime.date(2020, 1, 1))[0] == "demo:2020-01-01"
+
+        real_key, real_lock_key = _gen_key(a="a" * 129)
+        assert len(real_key) == len("demo:") + 32
+        assert real_lock_key == "demo:lock:" + real_key[len("demo:") :]
+        assert _gen_key(a="a" * 129) == (real_key, real_lock_key)
+        assert gen_key(max_key_length=None)(a="a" * 129)[0] == "demo:" + "a" * 129
+        # The key is not changed by default
+        assert CacheResponsePlugin.build(backend=MemoryCacheBackend()).plugin_kwargs["max_key_length"] is None
+
+    def test_cache_response_with_header_param(self) -> None:
+        backend = MemoryCacheBackend()
+        pait = FakePait()
+        call_list: list = []
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, enable_cache_name_merge_param=True)],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo(
+            a: int = field.Query.i(),
+            accept_language: str = field.Header.i(
+                alias="Accept-Language", default="en", extra_param_list=[CacheRespExtraParam()]
+            ),
+        ) -> dict:
+            call_list.append(a)
+            return {"code": len(call_list), "language": accept_language}
+
+        assert demo(FakeRawRequest(query={"a": 1})) == {"code": 1, "language": "en"}
+        assert demo(FakeRawRequest(query={"a": 2})) == {"code": 1, "language": "en"}
+        assert demo(FakeRawRequest(query={"a": 1}, header={"Accept-Language": "zh"})) == {
+            "code": 2,
+            "language": "zh",
+        }
+        assert demo(FakeRawRequest(query={"a": 3}, header={"Accept-Language": "zh"})) == {
+            "code": 2,
+            "language": "zh",
+        }
+        assert list(backend._cache_dict.keys()) == [f"{demo.__qualname__}:en", f"{demo.__qualname__}:zh"]
+
+    def test_local_cache(self) -> None:
+        with pytest.raises(ValueError):
+            LocalCache(max_size=0)
+        with pytest.raises(ValueError):
+            LocalCache(ttl=0)
+
+        local_cache = LocalCache(max_size=10, ttl=0.1)
+        local_cache.set("a", "1234")
+        local_cache.set("b", "1234")
+        assert local_cache.get("a") == "1234"
+        # The least recently used key will be evicted
+        local_cache.set("c", "1234")
+        assert local_cache.get("b") is MISSING
+        assert local_cache.get("a") == local_cache.get("c") == "1234"
+        assert local_cache.size == 8
+        # The value larger than max_size will not be cached
+        local_cache.set("d", "0" * 11)
+        assert local_cache.get("d") is MISSING
+        time.sleep(0.1)
+        assert local_cache.get("a") is MISSING
+        local_cache.delete("c")
+        assert local_cache.size == 0
+
+    def test_local_cache_single_flight(self) -> None:
+        local_cache = LocalCache()
+        call_list: list = []
+
+        def loader() -> tuple:
+            call_list.append(1)
+            time.sleep(0.1)
+            return "value", "result"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            result_list = list(executor.map(lambda _: local_cache.get_or_load("key", loader), range(5)))
+        assert len(call_list) == 1
+        assert result_list.count(("value", "result")) == 1
+        assert result_list.count(("value", MISSING)) == 4
+        assert local_cache.miss_count == 1 and local_cache.hit_count == 4
+
+        async def async_loader() -> tuple:
+            call_list.append(2)
+            await asyncio.sleep(0.1)
+            return "value", "result"
+
+        async def main() -> list:
+            return await asyncio.gather(*[local_cache.async_get_or_load("async_key", async_loader) for _ in range(5)])
+
+        result_list = asyncio.run(main())
+        assert call_list.count(2) == 1
+        assert result_list.count(("value", "result")) == 1
+        assert local_cache.miss_count == 2 and local_cache.hit_count == 8
+
+    def test_cache_response_with_local_cache(self) -> None:
+        redis: Redis = Redis(decode_responses=True)
+        local_cache = LocalCache()
+        pait = FakePait()
+        call_list: list = []
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(redis=redis, name="test_local_cache", local_cache=local_cache)],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo() -> dict:
+            call_list.append(1)
+            return {"code": len(call_list)}
+
+        redis.delete("test_local_cache")
+        assert demo(FakeRawRequest()) == {"code": 1}
+        # The response is cached in the process, even if the redis key is deleted
+        redis.delete("test_local_cache")
+        assert demo(FakeRawRequest()) == {"code": 1}
+        assert local_cache.miss_count == 1 and local_cache.hit_count == 1
+        local_cache.clear()
+        assert demo(FakeRawRequest()) == {"code": 2}
+        redis.delete("test_local_cache")
+
+    def test_cache_serializer(self) -> None:
+        class LocalModel(BaseModel):
+            a: int
+
+        serializer = CacheSerializer()
+        data = serializer.dumps({"a": (1, 2)})
+        assert data[:1] == CacheSerializer.pickle_tag
+        assert serializer.loads(data) == {"a": (1, 2)}
+        # The pydantic model is loaded as the same model class
+        demo_model = CacheDemoSubModel(a=1, B="2", sub=CacheDemoModel(a=2, B="3"))
+        data = serializer.dumps(demo_model)
+        assert data[:1] == CacheSerializer.json_tag
+        load_model = serializer.loads(data)
+        assert type(load_model) is CacheDemoSubModel and type(load_model.sub) is CacheDemoModel
+        assert load_model == demo_model
+        # The class of the model defined in the function can not be imported when loading
+        assert serializer._dump_json(LocalModel(a=1)) is None
+        # The model that can not be dumped by JSON is dumped by pickle
+        datetime_model = DatetimeModel(a=datetime.datetime.now())
+        data = serializer.dumps(datetime_model)
+        assert data[:1] == CacheSerializer.pickle_tag
+        assert serializer.loads(data) == datetime_model
+        exc = serializer.loads(serializer.dumps(ValueError("demo")))
+        assert isinstance(exc, ValueError) and exc.args == ("demo",)
+        # The value cached by the old version
+        assert serializer.loads(pickle.dumps({"a": 1}).decode("latin1")) == {"a": 1}
+        assert serializer.loads(pickle.dumps({"a": 1})) == {"a": 1}
+        # The value cached by the old version and read as raw bytes from redis
+        assert serializer.loads(pickle.dumps({"a": "é"}).decode("latin1").encode("utf-8")) == {"a": "é"}
+        assert PickleCacheSerializer().loads(pickle.dumps({"a": 1}).decode("latin1").encode("utf-8")) == {"a": 1}
+
+        serializer = CacheSerializer(compress_min_size=100)
+        assert serializer.dumps({"a": 1})[:1] == CacheSerializer.pickle_tag
+        data = serializer.dumps({"a": "a" * 1000})
+        assert data[:1] == CacheSerializer.compress_tag and len(data) < 100
+        assert serializer.loads(data) == {"a": "a" * 1000}
+
+    def test_cache_response_model_type(self) -> None:
+        redis: Redis = Redis(decode_responses=True)
+        pait = FakePait()
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(redis=redis, cache_time=10)],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo() -> CacheDemoModel:
+            return CacheDemoModel(a=1, B="2")
+
+        redis.delete(demo.__qualname__)
+        try:
+            miss_value = demo(FakeRawRequest())
+            hit_value = demo(FakeRawRequest())
+        finally:
+            redis.delete(demo.__qualname__)
+        # The route returns the same type whether the cache is hit or not
+        assert type(miss_value) is type(hit_value) is CacheDemoModel
+        assert miss_value == hit_value
+
+    def test_cache_response_with_old_version_value(self) -> None:
+        redis: Redis = Redis(decode_responses=True)
+        pait = FakePait()
+
+        @pait(post_plugin_list=[CacheResponsePlugin.build(redis=redis)], response_model_list=[JsonResponseModel])
+        def demo() -> dict:
+            return {"code": 0}
+
+        # The old version of the plugin stored the value by the latin1 decoded pickle data
+        redis.set(demo.__qualname__, pickle.dumps({"code": 1, "msg": "é"}).decode("latin1"))
+        try:
+            assert demo(FakeRawRequest()) == {"code": 1, "msg": "é"}
+        finally:
+            redis.delete(demo.__qualname__)
+
+    def test_web_framework_cache_serializer(self) -> None:
+        from flask import Response as FlaskResponse
+        from sanic.response import HTTPResponse
+        from starlette.responses import JSONResponse
+
+        from pait.app.flask.plugin.cache_response import CacheSerializer as FlaskCacheSerializer
+        from pait.app.sanic.plugin.cache_response import CacheSerializer as SanicCacheSerializer
+        from pait.app.starlette.plugin.cache_response import CacheSerializer as StarletteCacheSerializer
+
+        flask_serializer = FlaskCacheSerializer()
+        data = flask_serializer.dumps(FlaskResponse("demo", status=201, headers={"X-Demo": "1"}, mimetype="text/html"))
+        assert data[:1] == CacheSerializer.response_tag
+        flask_response = flask_serializer.loads(data)
+        assert flask_response.status_code == 201
+        assert flask_response.headers["X-Demo"] == "1"
+        assert flask_response.mimetype == "text/html"
+        assert flask_response.get_data() == b"demo"
+
+        starlette_serializer = StarletteCacheSerializer()
+        data = starlette_serializer.dumps(JSONResponse({"a": 1}, status_code=201, headers={"X-Demo": "1"}))
+        assert data[:1] == CacheSerializer.response_tag
+        starlette_response = starlette_serializer.loads(data)
+        assert starlette_response.status_code == 201
+        assert starlette_response.headers["X-Demo"] == "1"
+        assert starlette_response.headers["content-type"] == "application/json"
+        assert starlette_response.body == b'{"a":1}'
+
+        sanic_serializer = SanicCacheSerializer()
+        data = sanic_serializer.dumps(
+            HTTPResponse(b"demo", status=201, headers={"X-Demo": "1"}, content_type="text/html")
+        )
+        assert data[:1] == CacheSerializer.response_tag
+        sanic_response = sanic_serializer.loads(data)
+        assert sanic_response.status == 201
+        assert sanic_response.headers["X-Demo"] == "1"
+        assert sanic_response.content_type == "text/html"
+        assert sanic_response.body == b"demo"
+
+    def test_set_redis_and_backend(self) -> None:
+        def demo() -> None:
+            pass
+
+        with pytest.raises(ValueError) as e:
+            CacheResponsePlugin.build(redis=Redis(decode_responses=True), backend=MemoryCacheBackend()).pre_check_hook(
+                PaitCoreModel(demo, BaseAppHelper, ParamHandler, response_model_list=[response.JsonResponseModel])
+            )
+        assert "Only one of redis and backend can be set" in e.value.args[0]
+
+    def test_memory_backend(self) -> None:
+        backend = MemoryCacheBackend()
+        backend.set("a", "1", ex=1)
+        backend.set("b", "1")
+        assert backend.get("a") == backend.get("b") == "1"
+        backend._cache_dict["a"] = (time.monotonic() - 1, "1")
+        assert backend.get("a") is None
+        backend.delete("b")
+        assert backend.get("b") is None
+
+        backend.set("b", "1")
+        backend.add_tag("a", ["tag"])
+        backend.add_tag("b", ["tag", "tag1"])
+        backend._cache_dict["a"] = (time.monotonic() - 1, "1")
+        backend._purge_expired()
+        assert backend._tag_dict == {"tag": {"b"}, "tag1": {"b"}}
+        assert backend.invalidate_tag("tag") == 1
+        assert backend.get("b") is None
+
+        with backend.lock("lock"):
+            with pytest.raises(TimeoutError):
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(lambda: backend.lock("lock", blocking_timeout=0.01).__enter__()).result()
+        assert not backend._lock_dict
+
+        async def main() -> None:
+            async with backend.async_lock("lock"):
+                with pytest.raises(TimeoutError):
+                    async with backend.async_lock("lock", blocking_timeout=0.01):
+                        pass
+            assert not backend._async_lock_dict
+
+            release = await backend.async_try_lock("lock")
+            assert release is not None
+            assert await backend.async_try_lock("lock") is None
+            await release()
+            assert not backend._async_lock_dict
+
+        asyncio.run(main())
+
+        release = backend.try_lock("lock")
+        assert release is not None
+        assert backend.try_lock("lock") is None
+        release()
+        assert not backend._lock_dict
+
+    def test_cache_response_with_memory_backend(self) -> None:
+        backend = MemoryCacheBackend()
+        pait = FakePait()
+        call_list: list = []
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, enable_cache_name_merge_param=True)],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo(a: int = field.Query.i()) -> dict:
+            call_list.append(a)
+            return {"code": len(call_list)}
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, enable_cache_name_merge_param=True)],
+            response_model_list=[JsonResponseModel],
+        )
+        async def async_demo(a: int = field.Query.i()) -> dict:
+            call_list.append(a)
+            return {"code": len(call_list)}
+
+        assert demo(FakeRawRequest(query={"a": 1})) == {"code": 1}
+        assert demo(FakeRawRequest(query={"a": 1})) == {"code": 1}
+        assert demo(FakeRawRequest(query={"a": 2})) == {"code": 2}
+
+        async def main() -> list:
+            return await asyncio.gather(*[async_demo(FakeRawRequest(query={"a": 3})) for _ in range(3)])
+
+        assert asyncio.run(main()) == [{"code": 3}] * 3
+        assert call_list == [1, 2, 3]
+
+    def test_cache_tag_param_not_found(self) -> None:
+        def demo(uid: int = field.Query.i()) -> None:
+            pass
+
+        with pytest.raises(ValueError) as e:
+            CacheResponsePlugin.build(backend=MemoryCacheBackend(), tag_list=["user:{user_id}"]).pre_load_hook(
+                PaitCoreModel(demo, BaseAppHelper, ParamHandler, response_model_list=[JsonResponseModel])
+            )
+        assert "Can not found param:user_id of tag:user:{user_id}" in e.value.args[0]
+
+    @pytest.mark.parametrize(
+        "backend_factory",
+        [
+            lambda: (MemoryCacheBackend(), MemoryCacheBackend()),
+            lambda: (
+                RedisCacheBackend(Redis(decode_responses=True)),
+                RedisCacheBackend(AsyncRedis(decode_responses=True)),
+            ),
+        ],
+    )
+    def test_cache_response_invalidate(self, backend_factory: Callable) -> None:
+        backend, async_backend = backend_factory()
+        pait = FakePait()
+        call_list: list = []
+        name = "test_cache_response_invalidate"
+        async_name = "test_cache_response_invalidate_async"
+        if isinstance(backend, RedisCacheBackend):
+            for key in backend.redis.scan_iter(match=name + "*"):
+                backend.redis.delete(key)
+            for key in backend.redis.scan_iter(match=backend.tag_key_prefix + "*"):
+                backend.redis.delete(key)
+
+        @pait(
+            post_plugin_list=[
+                CacheResponsePlugin.build(
+                    backend=backend, name=name, enable_cache_name_merge_param=True, tag_list=["user:{uid}", "all"]
+                )
+            ],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo(uid: int = field.Query.i(), page: int = field.Query.i()) -> dict:
+            call_list.append(uid)
+            return {"code": len(call_list)}
+
+        @pait(
+            post_plugin_list=[
+                CacheResponsePlugin.build(
+                    backend=async_backend, name=async_name, enable_cache_name_merge_param=True, tag_list=["user:{uid}"]
+                )
+            ],
+            response_model_list=[JsonResponseModel],
+        )
+        async def async_demo(uid: int = field.Query.i()) -> dict:
+            call_list.append(uid)
+            return {"code": len(call_list)}
+
+        assert demo(FakeRawRequest(query={"uid": 1, "page": 1})) == {"code": 1}
+        assert demo(FakeRawRequest(query={"uid": 1, "page": 2})) == {"code": 2}
+        assert demo(FakeRawRequest(query={"uid": 2, "page": 1})) == {"code": 3}
+        assert demo(FakeRawRequest(query={"uid": 1, "page": 1})) == {"code": 1}
+        if isinstance(backend, RedisCacheBackend):
+            assert 0 < backend.redis.ttl(backend.tag_key_prefix + "all") <= 5 * 60
+        else:
+            assert backend._tag_dict["all"] == {f"{name}:1:1", f"{name}:1:2", f"{name}:2:1"}
+
+        # Only the cache of user 1 is deleted
+        assert backend.invalidate_tag("user:1") == 2
+        assert backend.invalidate_tag("user:1") == 0
+        assert demo(FakeRawRequest(query={"uid": 1, "page": 1})) == {"code": 4}
+        assert demo(FakeRawRequest(query={"uid": 2, "page": 1})) == {"code": 3}
+
+        assert backend.invalidate_tag("all", "user:2") == 2
+        assert demo(FakeRawRequest(query={"uid": 2, "page": 1})) == {"code": 5}
+        assert demo(FakeRawRequest(query={"uid": 1, "page": 1})) == {"code": 6}
+
+        # The lock of the route is not deleted
+        with backend.lock(name + ":lock:3:1"):
+            assert backend.invalidate_name(name) == 2
+            if isinstance(backend, MemoryCacheBackend):
+                assert name + ":lock:3:1" in backend._lock_dict
+            else:
+                assert backend.redis.exists(name + ":lock:3:1")
+        assert demo(FakeRawRequest(query={"uid": 2, "page": 1})) == {"code": 7}
+
+        async def main() -> None:
+            assert await async_demo(FakeRawRequest(query={"uid": 1})) == {"code": 8}
+            assert await async_demo(FakeRawRequest(query={"uid": 1})) == {"code": 8}
+            assert await async_backend.async_invalidate_tag("user:1") == 1
+            assert await async_demo(FakeRawRequest(query={"uid": 1})) == {"code": 9}
+            assert await async_demo(FakeRawRequest(query={"uid": 2})) == {"code": 10}
+            assert await async_backend.async_invalidate_name(async_name) == 2
+            assert await async_demo(FakeRawRequest(query={"uid": 1})) == {"code": 11}
+            if isinstance(async_backend, RedisCacheBackend):
+                await async_backend.redis.close()
+
+        asyncio.run(main())
+
+    def test_cache_response_refresh(self) -> None:
+        backend = MemoryCacheBackend()
+        pait = FakePait()
+        call_list: list = []
+
+        def expire_all() -> None:
+            # Mark all cached values as stale
+            for key, (expire, value) in backend._cache_dict.items():
+                assert value[:1] == b"s"
+                backend._cache_dict[key] = (expire, value[:1] + struct.pack("!d", 0) + value[9:])
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, cache_time=10, stale_time=10)],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo() -> dict:
+            call_list.append(1)
+            return {"code": len(call_list)}
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, cache_time=10, stale_time=10)],
+            response_model_list=[JsonResponseModel],
+        )
+        async def async_demo() -> dict:
+            call_list.append(1)
+            return {"code": len(call_list)}
+
+        assert demo(FakeRawRequest()) == {"code": 1}
+        expire_time = list(backend._cache_dict.values())[0][0]
+        assert expire_time is not None and expire_time - time.monotonic() > 10
+        expire_all()
+        # other request is refreshing the cache, return the stale value
+        release = backend.try_lock(list(backend._cache_dict.keys())[0] + ":lock")
+        assert release is not None
+        assert demo(FakeRawRequest()) == {"code": 1}
+        release()
+        assert demo(FakeRawRequest()) == {"code": 2}
+        assert demo(FakeRawRequest()) == {"code": 2}
+        assert len(call_list) == 2
+
+        async def main() -> None:
+            assert await async_demo(FakeRawRequest()) == {"code": 3}
+            expire_all()
+            assert await asyncio.gather(*[async_demo(FakeRawRequest()) for _ in range(3)]) == [{"code": 4}] * 3
+            assert await async_demo(FakeRawRequest()) == {"code": 4}
+
+        asyncio.run(main())
+        assert len(call_list) == 4
+
+    def test_cache_response_not_refresh_value(self) -> None:
+        class DemoSerializer(PickleCacheSerializer):
+            # The data starts with the same byte as the tag of the value that supports refresh
+            def dumps(self, value: Any) -> bytes:
+                return b"s" + super().dumps(value)
+
+            def loads(self, data: Any) -> Any:
+                assert data[:1] == b"s"
+                return super().loads(data[1:])
+
+        backend = MemoryCacheBackend()
+        pait = FakePait()
+        call_list: list = []
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, serializer=DemoSerializer())],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo() -> dict:
+            call_list.append(1)
+            return {"code": len(call_list)}
+
+        assert demo(FakeRawRequest()) == {"code": 1}
+        assert demo(FakeRawRequest()) == {"code": 1}
+
+    def test_cache_response_early_refresh(self) -> None:
+        backend = MemoryCacheBackend()
+        pait = FakePait()
+        call_list: list = []
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, early_refresh_beta=1e9)],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo() -> dict:
+            call_list.append(1)
+            time.sleep(0.001)
+            return {"code": len(call_list)}
+
+        # With a large beta, the value is always refreshed before it expires
+        assert demo(FakeRawRequest()) == {"code": 1}
+        assert demo(FakeRawRequest()) == {"code": 2}
+
+        @pait(
+            post_plugin_list=[CacheResponsePlugin.build(backend=backend, early_refresh_beta=1.0)],
+            response_model_list=[JsonResponseModel],
+        )
+        def demo1() -> dict:
+            call_list.append(1)
+            return {"code": len(call_list)}
+
+        assert demo1(FakeRawRequest()) == {"code": 3}
+        assert demo1(FakeRawRequest()) == {"code": 3}
+
     #
     # def test_not_found_redis(self) -> None:
     #     def demo() -> None:
@@ -499,3 +1070,51 @@ class TestUnifiedResponsePlugin:
                 kwargs={"get_pait_response_model": get_pait_response_model},
             )
         assert ve.value.args[0] == "Not Support FileResponseModel"
+
+
+class TestPluginEntry:
+    def test_flatten_entry(self) -> None:
+        class DemoRespModel(JsonResponseModel):
+            class ResponseModel(BaseModel):
+                code: int = Field(0)
+
+            response_data: Type[BaseModel] = ResponseModel
+
+        pait = FakePait()
+
+        @pait(
+            plugin_list=[CheckJsonRespPlugin.build()],
+            response_model_list=[DemoRespModel],
+        )
+        def demo(a: int = field.Query.i()) -> dict:
+            return {"code": a}
+
+        @pait(
+            plugin_list=[CheckJsonRespPlugin.build()],
+            response_model_list=[DemoRespModel],
+        )
+        async def async_demo(a: int = field.Query.i()) -> dict:
+            return {"code": a}
+
+        core_model: PaitCoreModel = demo.pait_core_model  # type: ignore[attr-defined]
+        main_plugin = core_model.main_plugin
+        # The sync or async variant is selected at build time
+        assert core_model.main_plugin_entry == main_plugin._sync_call  # type: ignore[attr-defined]
+        assert main_plugin.call_next == main_plugin.next_plugin.get_entry()  # type: ignore[union-attr]
+        assert demo(FakeRawRequest(query={"a": "1"})) == {"code": 1}
+
+        async_core_model: PaitCoreModel = async_demo.pait_core_model  # type: ignore[attr-defined]
+        assert async_core_model.main_plugin_entry == async_core_model.main_plugin._async_call  # type: ignore
+        assert asyncio.run(async_demo(FakeRawRequest(query={"a": "1"}))) == {"code": 1}
+
+        class DemoPlugin(CheckJsonRespPlugin):
+            def __call__(self, context: PluginContext) -> Any:
+                return super().__call__(context)
+
+        core_model.add_plugin([DemoPlugin.build()], [])
+        core_model.build()
+        # If the plugin override `__call__`, it will be used
+        demo_plugin = core_model.main_plugin.next_plugin
+        assert isinstance(demo_plugin, DemoPlugin)
+        assert core_model.main_plugin.call_next == demo_plugin.__call__
+        assert demo(FakeRawRequest(query={"a": "1"})) == {"code": 1}
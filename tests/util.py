@@ -1,4 +1,8 @@
+from typing import Any, Dict, Optional
+
 from pait.app.base import BaseAppHelper
+from pait.app.base.adapter.request import BaseRequest
+from pait.core import Pait
 
 
 class FakeAppHelper(BaseAppHelper):
@@ -6,3 +10,39 @@ class FakeAppHelper(BaseAppHelper):
     FormType = int
     FileType = float
     HeaderType = type(None)
+
+
+class FakeRawRequest(object):
+    """A request object that does not depend on any web framework"""
+
+    def __init__(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        header: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.query: Dict[str, Any] = query or {}
+        self.header: Dict[str, Any] = header or {}
+        self.body: Dict[str, Any] = body or {}
+
+
+class FakeRequest(BaseRequest[FakeRawRequest, Any]):
+    RequestType = FakeRawRequest
+
+    def body(self) -> Dict[str, Any]:
+        return self.request.body
+
+    def header(self) -> Dict[str, Any]:
+        return self.request.header
+
+    def query(self) -> Dict[str, Any]:
+        return self.request.query
+
+
+class FakeRequestAppHelper(BaseAppHelper[FakeRawRequest, Any]):
+    app_name = "fake_request_app"
+    request_class = FakeRequest
+
+
+class FakePait(Pait):
+    app_helper_class = FakeRequestAppHelper